@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure the cumulative time of importing cachy and using a dict store,
+as reported by python -X importtime, in new interpreters.
+
+    python benchmarks/bench_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+
+
+CASES = [
+    ('import cachy', 'import cachy'),
+    ('dict store', 'from cachy import CacheManager\n'
+                   'CacheManager({"stores": {"dict": {"driver": "dict"}}}).put("foo", "bar", 10)'),
+    ('redis store', 'from cachy.stores import RedisStore'),
+]
+
+
+def cumulative_time(code):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stderr=subprocess.STDOUT, env=env
+    ).decode()
+
+    total = 0
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, module = line[len('import time:'):].split('|')
+
+        # Top level imports are not indented,
+        # and the ones of the interpreter startup are ignored.
+        if not module.startswith('  ') and module.strip().startswith('cachy'):
+            total += int(cumulative)
+
+    return total
+
+
+def main(repeat=5):
+    for name, code in CASES:
+        best = min(cumulative_time(code) for _ in range(repeat))
+
+        print('%-20s %.1fms' % (name, best / 1000.))
+
+
+if __name__ == '__main__':
+    main()
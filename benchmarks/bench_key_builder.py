@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the decorator key derivation with the previous pickle + sha1 implementation.
+
+    python benchmarks/bench_key_builder.py
+"""
+
+import hashlib
+import itertools
+import timeit
+
+from cachy.key_builder import KeyBuilder
+from cachy.serializers import PickleSerializer
+from cachy.utils import encode
+
+
+serializer = PickleSerializer()
+
+
+def get_user(user_id, active=True):
+    pass
+
+
+def legacy_key(fn, args, kwargs):
+    serialized_arguments = (
+        serializer.serialize(args[1:])
+        + serializer.serialize([(k, kwargs[k]) for k in sorted(kwargs.keys())])
+    )
+
+    return hashlib.sha1(encode('%s.%s' % (fn.__name__, serialized_arguments))).hexdigest()
+
+
+def bench(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(number=20000):
+    builder = KeyBuilder(get_user)
+    counter = itertools.count()
+
+    cases = [
+        ('repeated primitive arguments', lambda: ((42,), {'active': False})),
+        ('distinct primitive arguments', lambda: ((next(counter),), {'active': False})),
+        ('container arguments', lambda: (([1, 2, 3],), {'active': {'a': 1}})),
+    ]
+
+    for name, arguments in cases:
+        legacy = bench(lambda: legacy_key(get_user, *arguments()), number)
+        current = bench(lambda: builder.build(*(arguments() + (serializer.serialize,))), number)
+
+        print('%-30s legacy: %.2fus  key builder: %.2fus  (x%.1f)' % (
+            name, legacy, current, legacy / current
+        ))
+
+
+if __name__ == '__main__':
+    main()
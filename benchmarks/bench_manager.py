@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure cache.get() through the manager, compared to the repository it proxies,
+and the number of stores resolved by concurrent threads.
+
+    python benchmarks/bench_manager.py
+"""
+
+import threading
+import timeit
+
+from cachy import CacheManager
+
+
+def bench(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def make_manager():
+    return CacheManager({
+        'default': 'dict',
+        'stores': {
+            'dict': {
+                'driver': 'dict'
+            }
+        }
+    })
+
+
+def main(number=100000):
+    cache = make_manager()
+    cache.put('foo', 'bar', 10)
+    repository = cache.store()
+
+    direct = bench(lambda: repository.get('foo'), number)
+    store = bench(lambda: cache.store().get('foo'), number)
+    proxied = bench(lambda: cache.get('foo'), number)
+
+    print('%-30s %.2fus' % ('repository.get()', direct))
+    print('%-30s %.2fus' % ('cache.store().get()', store))
+    print('%-30s %.2fus' % ('cache.get()', proxied))
+
+    cache = make_manager()
+    resolved = []
+    resolve = cache._resolve
+
+    def counting_resolve(name):
+        resolved.append(name)
+
+        return resolve(name)
+
+    cache._resolve = counting_resolve
+
+    def worker():
+        for _ in range(1000):
+            cache.get('foo')
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print('%-30s %d' % ('stores resolved by 8 threads', len(resolved)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure the serialization and unserialization times and the sizes
+of the built-in serializers on representative payloads.
+
+    python benchmarks/bench_serializers.py
+"""
+
+import timeit
+
+import msgpack
+
+from cachy.serializers import JsonSerializer, MsgPackSerializer, PickleSerializer
+
+
+PAYLOADS = {
+    'string': 'Hello, world! ' * 4,
+    'record': {
+        'id': 12345,
+        'name': 'John Doe',
+        'email': 'john.doe@example.com',
+        'active': True,
+        'score': 98.5,
+        'tags': ['admin', 'staff', 'beta']
+    },
+    'records': [
+        {'id': i, 'name': 'user-%d' % i, 'score': i * 1.5, 'groups': [1, 2, 3]}
+        for i in range(100)
+    ],
+    'fragment': '<ul>%s</ul>' % ''.join('<li class="item">Item %d</li>' % i for i in range(200))
+}
+
+
+def bench(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(number=10000):
+    serializers = [
+        ('pickle', PickleSerializer()),
+        ('json', JsonSerializer()),
+        ('msgpack', MsgPackSerializer())
+    ]
+
+    print('%-10s %-10s %12s %12s %10s' % ('payload', 'serializer', 'serialize', 'unserialize', 'size'))
+
+    for name, payload in sorted(PAYLOADS.items()):
+        for serializer_name, serializer in serializers:
+            data = serializer.serialize(payload)
+
+            dumps = bench(lambda: serializer.serialize(payload), number)
+            loads = bench(lambda: serializer.unserialize(data), number)
+
+            print('%-10s %-10s %10.2fus %10.2fus %10d' % (
+                name, serializer_name, dumps, loads, len(data)
+            ))
+
+    # The reused packer compared to a new one per call.
+    serializer = MsgPackSerializer()
+    payload = PAYLOADS['record']
+    options = serializer._packer_options
+
+    print('')
+    print('%-30s %.2fus' % ('msgpack.packb()', bench(
+        lambda: msgpack.packb(payload, **options), number
+    )))
+    print('%-30s %.2fus' % ('MsgPackSerializer.serialize()', bench(
+        lambda: serializer.serialize(payload), number
+    )))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import inspect
+import weakref
+from functools import wraps
+
+from .envelope import Envelope
+from .repository import Repository
+
+
+async def value(val):
+    """
+    Resolve a value which may be a function or a coroutine function.
+    """
+    if callable(val):
+        val = val()
+
+    if inspect.isawaitable(val):
+        val = await val
+
+    return val
+
+
+class AsyncRepository(object):
+    """
+    A cache repository whose operations are coroutines.
+    """
+
+    _default = 60
+
+    def __init__(self, store):
+        """
+        :param store: The underlying asynchronous cache store
+        :type store: cachy.contracts.async_store.AsyncStore
+        """
+        self._store = store
+        # The pending computations of each event loop, keyed by cache key.
+        self._in_flight = weakref.WeakKeyDictionary()
+        self._key_builders = {}
+
+    async def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return await self._store.has(key)
+
+    async def get(self, key, default=None):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :param default: The default value to return
+        :type default: mixed
+
+        :rtype: mixed
+        """
+        val = await self._store.get(key)
+
+        if val is None:
+            return await value(default)
+
+        return Envelope.open(val)
+
+    async def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        values = await self._store.get_many(keys)
+
+        return {key: Envelope.open(val) for key, val in values.items()}
+
+    async def pull(self, key, default=None):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :param default: The default value to return
+        :type default: mixed
+
+        :rtype: mixed
+        """
+        val = await self._store.pull(key)
+
+        if val is None:
+            return await value(default)
+
+        return Envelope.open(val)
+
+    async def put(self, key, val, minutes):
+        """
+        Store an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param val: The cache value
+        :type val: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float or datetime or timedelta
+        """
+        minutes = self._get_minutes(minutes)
+
+        if minutes is not None:
+            await self._store.put(key, Envelope.wrap(val), minutes)
+
+    async def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float or datetime or timedelta
+        """
+        minutes = self._get_minutes(minutes)
+
+        if minutes is not None:
+            await self._store.put_many(
+                {key: Envelope.wrap(val) for key, val in values.items()},
+                minutes
+            )
+
+    async def add(self, key, val, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param val: The cache value
+        :type val: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float or datetime or timedelta
+
+        :rtype: bool
+        """
+        minutes = self._get_minutes(minutes)
+
+        if minutes is None:
+            return False
+
+        return await self._store.add(key, Envelope.wrap(val), minutes)
+
+    async def forever(self, key, val):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param val: The cache value
+        :type val: mixed
+        """
+        await self._store.forever(key, Envelope.wrap(val))
+
+    async def remember(self, key, minutes, callback, negative_minutes=None):
+        """
+        Get an item from the cache, or store the default value.
+
+        Concurrent calls for the same missing key share a single computation.
+
+        :param key: The cache key
+        :type key: str
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float or datetime or timedelta
+
+        :param callback: The default function or coroutine function
+        :type callback: mixed
+
+        :param negative_minutes: The lifetime in minutes of None values,
+                                 defaulting to the lifetime of other values
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :rtype: mixed
+        """
+        val = await self._store.get(key)
+        if val is not None:
+            return Envelope.open(val)
+
+        async def compute():
+            val = await value(callback)
+
+            if val is None and negative_minutes is not None:
+                await self.put(key, val, negative_minutes)
+            else:
+                await self.put(key, val, minutes)
+
+            return val
+
+        return await self._compute(key, compute)
+
+    async def remember_forever(self, key, callback):
+        """
+        Get an item from the cache, or store the default value forever.
+
+        :param key: The cache key
+        :type key: str
+
+        :param callback: The default function or coroutine function
+        :type callback: mixed
+
+        :rtype: mixed
+        """
+        val = await self._store.get(key)
+        if val is not None:
+            return Envelope.open(val)
+
+        async def compute():
+            val = await value(callback)
+
+            await self.forever(key, val)
+
+            return val
+
+        return await self._compute(key, compute)
+
+    async def _compute(self, key, compute):
+        """
+        Compute the value of a missing item,
+        sharing the computation between concurrent callers.
+
+        :param key: The cache key
+        :type key: str
+
+        :param compute: The coroutine function computing and storing the value
+        :type compute: callable
+
+        :rtype: mixed
+        """
+        # Futures are bound to their event loop
+        # so computations are only shared within a loop.
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.get(loop)
+
+        if in_flight is None:
+            in_flight = self._in_flight.setdefault(loop, {})
+
+        future = in_flight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(compute())
+            in_flight[key] = future
+            future.add_done_callback(lambda _: in_flight.pop(key, None))
+
+        # Shielding the computation so that a cancelled caller
+        # does not cancel it for the other ones.
+        return await asyncio.shield(future)
+
+    async def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return await self._store.forget(key)
+
+    async def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        return await self._store.forget_many(keys)
+
+    async def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return await self._store.increment(key, value)
+
+    async def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return await self._store.decrement(key, value)
+
+    async def flush(self):
+        """
+        Remove all items from the cache.
+        """
+        return await self._store.flush()
+
+    def get_default_cache_time(self):
+        """
+        Get the default cache time.
+
+        :rtype: int
+        """
+        return self._default
+
+    def set_default_cache_time(self, minutes):
+        """
+        Set the default cache time.
+
+        :param minutes: The default cache time
+        :type minutes: int
+
+        :rtype: self
+        """
+        self._default = minutes
+
+        return self
+
+    def get_store(self):
+        """
+        Get the cache store implementation.
+
+        :rtype: cachy.contracts.async_store.AsyncStore
+        """
+        return self._store
+
+    # Durations and decorator keys are computed
+    # the same way as for the synchronous repository.
+    _get_minutes = Repository._get_minutes
+    _hash = Repository._hash
+    _get_key = Repository._get_key
+    _get_key_builder = Repository._get_key_builder
+
+    def __call__(self, *args, **kwargs):
+        if args and callable(args[0]):
+            return self._decorate(args[0], None, self._default)
+
+        key = kwargs.get('key')
+        minutes = kwargs.get('minutes', self._default)
+        typed = kwargs.get('typed', False)
+        negative_minutes = kwargs.get('negative_minutes')
+
+        if 'seconds' in kwargs:
+            minutes = kwargs['seconds'] / 60.
+
+        def decorated(fn):
+            return self._decorate(fn, key, minutes, typed, negative_minutes)
+
+        return decorated
+
+    def _decorate(self, fn, key, minutes, typed=False, negative_minutes=None):
+        """
+        Cache the results of a coroutine function.
+
+        :param fn: The coroutine function
+        :type fn: callable
+
+        :param key: The key prefix, or a function computing the key from the arguments
+        :type key: str or callable or None
+
+        :param minutes: The lifetime in minutes of the cached results
+        :type minutes: int or float or datetime or timedelta
+
+        :param typed: Whether arguments of different types should be cached separately
+        :type typed: bool
+
+        :param negative_minutes: The lifetime in minutes of None results
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :rtype: callable
+        """
+        if not asyncio.iscoroutinefunction(fn):
+            raise ValueError('Only coroutine functions can be decorated.')
+
+        if callable(key):
+            @wraps(fn)
+            async def wrapper(*a, **kw):
+                return await self.remember(
+                    key(*a, **kw), minutes, lambda: fn(*a, **kw), negative_minutes
+                )
+
+            return wrapper
+
+        self._get_key_builder(key or fn, typed)
+
+        @wraps(fn)
+        async def wrapper(*a, **kw):
+            return await self.remember(
+                self._get_key(key or fn, a, kw, typed),
+                minutes,
+                lambda: fn(*a, **kw),
+                negative_minutes
+            )
+
+        return wrapper
@@ -2,43 +2,70 @@
 
 import threading
 import types
+import weakref
 from .contracts.factory import Factory
 from .contracts.store import Store
 
-from .stores import (
-    DictStore,
-    FileStore,
-    RedisStore,
-    MemcachedStore
-)
-
+from .metrics import Metrics
 from .repository import Repository
-from .serializers import (
-    Serializer,
-    JsonSerializer,
-    MsgPackSerializer,
-    PickleSerializer
-)
+from .single_flight import SingleFlight
+from .slow_log import SlowLog
+from .serializers.serializer import Serializer
 
 
-class CacheManager(Factory, threading.local):
+class CacheManager(Factory):
     """
     A CacheManager is a pool of cache stores.
+
+    Stores are resolved once and shared by all threads,
+    along with the connection pools of their clients.
     """
 
-    _serializers = {
-        'json': JsonSerializer(),
-        'msgpack': MsgPackSerializer(),
-        'pickle': PickleSerializer()
+    _serializers = {}
+
+    # The built-in serializers, imported on first use
+    # so that their libraries are only imported if needed.
+    _builtin_serializers = {
+        'compressed': 'CompressedSerializer',
+        'json': 'JsonSerializer',
+        'msgpack': 'MsgPackSerializer',
+        'pickle': 'PickleSerializer'
+    }
+
+    # The identifiers recorded in the representations of the built-in serializers
+    # when formats are recorded. They must never change.
+    _builtin_formats = {
+        'pickle': 1,
+        'json': 2,
+        'msgpack': 3,
+        'compressed': 4
     }
 
+    # Configuration options handled by the manager
+    # that must not be passed to the store implementations.
+    _manager_options = (
+        'driver', 'serializer', 'compression', 'format_tagging',
+        'single_flight', 'metrics', 'write_behind'
+    )
+
+    # Redis options the asynchronous redis store does not support.
+    _replica_options = ('replicas', 'replica_selection', 'replica_breaker', 'read_your_writes')
+
     def __init__(self, config):
         super(CacheManager, self).__init__()
 
         self._config = config
         self._stores = {}
+        # Asynchronous stores keyed by event loop, dropped with their loop.
+        self._async_stores = weakref.WeakKeyDictionary()
+        self._local = threading.local()
         self._custom_creators = {}
+        # Reentrant since resolving a store may resolve
+        # the stores it wraps, like the tiered one.
+        self._lock = threading.RLock()
+        self._formats = dict(self._builtin_formats)
         self._serializer = self._resolve_serializer(config.get('serializer', 'pickle'))
+        self._slow_log = self._resolve_slow_log(config.get('slow_log'))
 
     def store(self, name=None):
         """
@@ -52,9 +79,65 @@ class CacheManager(Factory, threading.local):
         if name is None:
             name = self.get_default_driver()
 
-        self._stores[name] = self._get(name)
+        return self._get(name)
+
+    def async_store(self, name=None):
+        """
+        Get an asynchronous cache store instance by name.
+
+        :param name: The cache store name
+        :type name: str
+
+        :rtype: cachy.async_repository.AsyncRepository
+        """
+        if name is None:
+            name = self.get_default_driver()
+
+        repositories = self._get_async_stores()
+        repository = repositories.get(name)
+
+        if repository is None:
+            with self._lock:
+                repository = repositories.get(name)
+
+                if repository is None:
+                    repository = self._resolve_async(name)
+                    repositories[name] = repository
+
+        return repository
+
+    def _get_async_stores(self):
+        """
+        Get the asynchronous stores of the running event loop,
+        or of the current thread if no event loop is running.
+
+        Asynchronous clients and pending computations are bound to an event loop
+        so they cannot be shared between event loops, unlike synchronous stores.
+
+        :rtype: dict
+        """
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            repositories = getattr(self._local, 'async_stores', None)
+
+            if repositories is None:
+                repositories = self._local.async_stores = {}
+
+            return repositories
 
-        return self._stores[name]
+        with self._lock:
+            repositories = self._async_stores.get(loop)
+
+            if repositories is None:
+                repositories = self._async_stores[loop] = {}
+
+        return repositories
 
     def driver(self, name=None):
         """
@@ -69,14 +152,25 @@ class CacheManager(Factory, threading.local):
 
     def _get(self, name):
         """
-        Attempt to get the store from the local cache.
+        Get a store from the resolved ones, resolving it if necessary.
 
         :param name: The store name
         :type name: str
 
         :rtype: Repository
         """
-        return self._stores.get(name, self._resolve(name))
+        repository = self._stores.get(name)
+
+        if repository is None:
+            with self._lock:
+                # Another thread may have resolved it in the meantime.
+                repository = self._stores.get(name)
+
+                if repository is None:
+                    repository = self._resolve(name)
+                    self._stores[name] = repository
+
+        return repository
 
     def _resolve(self, name):
         """
@@ -97,15 +191,181 @@ class CacheManager(Factory, threading.local):
         else:
             repository = getattr(self, '_create_%s_driver' % config['driver'])(config)
 
-        if 'serializer' in config:
-            serializer = self._resolve_serializer(config['serializer'])
-        else:
-            serializer = self._serializer
+        repository.get_store().set_serializer(self._resolve_store_serializer(config))
+
+        if config.get('single_flight'):
+            repository.set_single_flight(self._resolve_single_flight(config['single_flight']))
+
+        metrics = config.get('metrics', self._config.get('metrics'))
+        if metrics:
+            metrics = self._resolve_metrics(name, metrics)
 
-        repository.get_store().set_serializer(serializer)
+            repository.set_metrics(metrics)
+            repository.get_store().set_metrics(metrics)
+
+        if self._slow_log is not None:
+            repository.after(self._slow_log.hook(name))
 
         return repository
 
+    def _resolve_metrics(self, name, options):
+        """
+        Resolve the metrics of a store.
+
+        :param name: The store name
+        :type name: str
+
+        :param options: The metrics options, or True to use the defaults
+        :type options: dict or bool or Metrics
+
+        :rtype: Metrics
+        """
+        if isinstance(options, Metrics):
+            return options
+
+        if not isinstance(options, dict):
+            options = {}
+
+        return Metrics(name, **options)
+
+    def _resolve_slow_log(self, options):
+        """
+        Resolve the slow log shared by the stores.
+
+        :param options: The slow log options, or True to use the defaults
+        :type options: dict or bool or SlowLog or None
+
+        :rtype: SlowLog or None
+        """
+        if not options:
+            return
+
+        if isinstance(options, SlowLog):
+            return options
+
+        if not isinstance(options, dict):
+            options = {}
+
+        return SlowLog(**options)
+
+    def get_slow_log(self):
+        """
+        Get the slow log shared by the stores.
+
+        :rtype: SlowLog or None
+        """
+        return self._slow_log
+
+    def slow_operations(self, store=None):
+        """
+        Get the slow operations of the stores, the most recent first.
+
+        :param store: Only get the operations of this store
+        :type store: str or None
+
+        :rtype: list
+        """
+        if self._slow_log is None:
+            return []
+
+        return self._slow_log.entries(store)
+
+    def close(self):
+        """
+        Stop the refresh-ahead schedulers and close the stores which need it,
+        like the ones buffering their writes, so that no operation is lost on shutdown.
+        """
+        for repository in list(self._stores.values()):
+            refresh_ahead = repository.get_refresh_ahead()
+
+            if refresh_ahead is not None:
+                refresh_ahead.stop()
+
+            close = getattr(repository.get_store(), 'close', None)
+
+            if close is not None:
+                close()
+
+    def stats(self):
+        """
+        Get a snapshot of the metrics of the stores using them, keyed by store name.
+
+        :rtype: dict
+        """
+        return {
+            name: repository.stats()
+            for name, repository in list(self._stores.items())
+            if repository.get_metrics() is not None
+        }
+
+    def _resolve_single_flight(self, options):
+        """
+        Resolve the single-flight instance of a store.
+
+        :param options: The single-flight options, or True to use the defaults
+        :type options: dict or bool
+
+        :rtype: SingleFlight
+        """
+        if isinstance(options, SingleFlight):
+            return options
+
+        if not isinstance(options, dict):
+            options = {}
+
+        return SingleFlight(**options)
+
+    def _resolve_async(self, name):
+        """
+        Resolve the given asynchronous store.
+
+        Drivers without a native asynchronous implementation
+        have their synchronous store run in an executor.
+
+        :param name: The store to resolve
+        :type name: str
+
+        :rtype: cachy.async_repository.AsyncRepository
+        """
+        from .async_repository import AsyncRepository
+        from .stores.executor_store import ExecutorStore
+
+        config = self._get_config(name)
+
+        if not config:
+            raise RuntimeError('Cache store [%s] is not defined.' % name)
+
+        creator = getattr(self, '_create_async_%s_driver' % config['driver'], None)
+
+        if config['driver'] in self._custom_creators or creator is None:
+            return AsyncRepository(ExecutorStore(self.store(name).get_store()))
+
+        store = creator(config)
+
+        store.set_serializer(self._resolve_store_serializer(config))
+
+        return AsyncRepository(store)
+
+    def _create_async_redis_driver(self, config):
+        """
+        Create an instance of the asynchronous redis cache store.
+
+        Replicas are ignored so that every read goes to the primary.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :rtype: cachy.stores.async_redis_store.AsyncRedisStore
+        """
+        from .stores.async_redis_store import AsyncRedisStore
+
+        options = self._get_store_options(config)
+
+        for option in self._replica_options:
+            options.pop(option, None)
+
+        return AsyncRedisStore(**options)
+
     def _call_custom_creator(self, config):
         """
         Call a custom driver creator.
@@ -134,6 +394,8 @@ class CacheManager(Factory, threading.local):
 
         :rtype: Repository
         """
+        from .stores.dict_store import DictStore
+
         return self.repository(DictStore())
 
     def _create_file_driver(self, config):
@@ -145,6 +407,8 @@ class CacheManager(Factory, threading.local):
 
         :rtype: Repository
         """
+        from .stores.file_store import FileStore
+
         kwargs = {
             'directory': config['path']
         }
@@ -163,7 +427,11 @@ class CacheManager(Factory, threading.local):
 
         :return: Repository
         """
-        return self.repository(RedisStore(**config))
+        from .stores.redis_store import RedisStore
+
+        store = RedisStore(**self._get_store_options(config))
+
+        return self.repository(self._write_behind(store, config))
 
     def _create_memcached_driver(self, config):
         """
@@ -174,7 +442,111 @@ class CacheManager(Factory, threading.local):
 
         :return: Repository
         """
-        return self.repository(MemcachedStore(**config))
+        from .stores.memcached_store import MemcachedStore
+
+        store = MemcachedStore(**self._get_store_options(config))
+
+        return self.repository(self._write_behind(store, config))
+
+    def _write_behind(self, store, config):
+        """
+        Buffer the writes of a store if the write-behind mode is enabled.
+
+        :param store: The store
+        :type store: Store
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :rtype: Store
+        """
+        options = config.get('write_behind')
+
+        if not options:
+            return store
+
+        if options is True:
+            options = {}
+
+        from .stores.write_behind_store import WriteBehindStore
+
+        return WriteBehindStore(store, **options)
+
+    def _create_tiered_driver(self, config):
+        """
+        Create an instance of the tiered cache driver.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :return: Repository
+        """
+        from .stores.tiered_store import TieredStore
+
+        kwargs = {}
+
+        if 'local_minutes' in config:
+            kwargs['local_minutes'] = config['local_minutes']
+
+        if 'local_size' in config:
+            kwargs['local_size'] = config['local_size']
+
+        store = self.store(config['store']).get_store()
+
+        return self.repository(TieredStore(store, **kwargs))
+
+    def _create_failover_driver(self, config):
+        """
+        Create an instance of the failover cache driver.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :return: Repository
+        """
+        from .stores.failover_store import FailoverStore
+
+        names = list(config['stores'])
+        stores = [self.store(name).get_store() for name in names]
+
+        return self.repository(
+            FailoverStore(stores, names, **config.get('circuit_breaker', {}))
+        )
+
+    def _create_sharded_driver(self, config):
+        """
+        Create an instance of the sharded cache driver.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :return: Repository
+        """
+        from .stores.sharded_store import ShardedStore
+
+        names = list(config['stores'])
+        stores = [self.store(name).get_store() for name in names]
+
+        kwargs = {}
+
+        for option in ('weights', 'vnodes', 'workers'):
+            if option in config:
+                kwargs[option] = config[option]
+
+        return self.repository(ShardedStore(stores, names, **kwargs))
+
+    def _create_null_driver(self, config):
+        """
+        Create an instance of the null cache driver.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :rtype: Repository
+        """
+        from .stores.null_store import NullStore
+
+        return self.repository(NullStore())
 
     def repository(self, store):
         """
@@ -189,6 +561,17 @@ class CacheManager(Factory, threading.local):
 
         return repository
 
+    def _get_store_options(self, config):
+        """
+        Get the options to pass to a store implementation.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :rtype: dict
+        """
+        return {k: v for k, v in config.items() if k not in self._manager_options}
+
     def _get_prefix(self, config):
         """
         Get the cache prefix.
@@ -267,9 +650,105 @@ class CacheManager(Factory, threading.local):
         if serializer in self._serializers:
             return self._serializers[serializer]
 
+        if serializer in self._builtin_serializers:
+            from . import serializers
+
+            instance = getattr(serializers, self._builtin_serializers[serializer])()
+            self._serializers[serializer] = instance
+
+            return instance
+
         raise RuntimeError('Unsupported serializer')
 
-    def register_serializer(self, name, serializer):
+    def _resolve_store_serializer(self, config):
+        """
+        Resolve the serializer of a store, recording the format of its representations
+        and compressing them if these options are enabled for the store or globally.
+
+        :param config: The driver configuration
+        :type config: dict
+
+        :rtype: Serializer
+        """
+        if 'serializer' in config:
+            serializer = self._resolve_serializer(config['serializer'])
+        else:
+            serializer = self._serializer
+
+        tagging = config.get('format_tagging', self._config.get('format_tagging'))
+
+        if tagging:
+            serializer = self._tag_format(serializer, {} if tagging is True else tagging)
+
+        compression = config.get('compression', self._config.get('compression'))
+
+        if not compression:
+            return serializer
+
+        if compression is True:
+            compression = {}
+
+        from .serializers.compressed_serializer import CompressedSerializer
+
+        return CompressedSerializer(serializer, **compression)
+
+    def _tag_format(self, serializer, options):
+        """
+        Record the format of the representations of a serializer.
+
+        :param serializer: The serializer
+        :type serializer: Serializer
+
+        :param options: The format tagging options
+        :type options: dict
+
+        :rtype: Serializer
+        """
+        from .serializers.multi_format_serializer import MultiFormatSerializer
+
+        legacy = options.get('legacy')
+
+        if legacy is not None:
+            legacy = self._resolve_serializer(legacy)
+
+        return MultiFormatSerializer(
+            serializer, self._get_format_id(serializer), self._resolve_format, legacy
+        )
+
+    def _get_format_id(self, serializer):
+        """
+        Get the format identifier of a serializer.
+
+        :param serializer: The serializer
+        :type serializer: Serializer
+
+        :rtype: int
+        """
+        for name, format_id in self._formats.items():
+            if name in self._serializers and self._serializers[name] is serializer:
+                return format_id
+
+        raise RuntimeError(
+            'Serializer [%s] has no format identifier, '
+            'register it with one to record its format.' % serializer.__class__.__name__
+        )
+
+    def _resolve_format(self, format_id):
+        """
+        Resolve the serializer of a format identifier.
+
+        :param format_id: The format identifier
+        :type format_id: int
+
+        :rtype: Serializer
+        """
+        for name, id_ in self._formats.items():
+            if id_ == format_id:
+                return self._resolve_serializer(name)
+
+        raise RuntimeError('Unsupported serializer format [%d].' % format_id)
+
+    def register_serializer(self, name, serializer, format_id=None):
         """
         Register a new serializer.
 
@@ -278,7 +757,20 @@ class CacheManager(Factory, threading.local):
 
         :param serializer: The serializer
         :type serializer: Serializer
+
+        :param format_id: The identifier recorded in its representations
+                          when formats are recorded, between 1 and 127
+        :type format_id: int or None
         """
+        if format_id is not None:
+            for other, id_ in self._formats.items():
+                if id_ == format_id and other != name:
+                    raise ValueError(
+                        'Format identifier [%d] is already used by [%s].' % (format_id, other)
+                    )
+
+            self._formats[name] = format_id
+
         self._serializers[name] = serializer
 
     def __getattr__(self, item):
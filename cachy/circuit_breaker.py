@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import deque
+
+_connection_errors = None
+
+
+def connection_errors():
+    """
+    Get the errors raised by the cache clients
+    when a backend cannot be reached or does not answer in time.
+
+    Other errors, like serialization errors, are not failures of the backend.
+
+    :rtype: tuple
+    """
+    global _connection_errors
+
+    if _connection_errors is None:
+        # Socket errors and timeouts are environment errors.
+        errors = [EnvironmentError]
+
+        # The clients are imported here since they are optional
+        # and slow down the import of the package.
+        try:
+            from redis.exceptions import ConnectionError, TimeoutError
+        except ImportError:
+            pass
+        else:
+            errors += [ConnectionError, TimeoutError]
+
+        try:
+            import pylibmc
+        except ImportError:
+            pass
+        else:
+            for name in ('ConnectionError', 'ServerDown', 'ServerDead', 'Timeout'):
+                if hasattr(pylibmc, name):
+                    errors.append(getattr(pylibmc, name))
+
+        _connection_errors = tuple(errors)
+
+    return _connection_errors
+
+
+class CircuitBreaker(object):
+    """
+    Stop calling a failing backend for a while.
+
+    The breaker is closed while the backend behaves. It opens once the rate
+    of failed or slow calls among the most recent ones reaches a threshold,
+    and calls are then rejected right away. After a cool-down period,
+    it lets a few probing calls through, half-open, and closes again
+    if they all succeed.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_rate=0.5, latency=None, window=20, min_calls=5,
+                 reset_timeout=30, probes=1):
+        """
+        :param failure_rate: The rate of failed calls at which the breaker opens
+        :type failure_rate: float
+
+        :param latency: The number of seconds above which a call counts as failed
+        :type latency: int or float or None
+
+        :param window: The number of most recent calls considered
+        :type window: int
+
+        :param min_calls: The minimum number of calls before the breaker can open
+        :type min_calls: int
+
+        :param reset_timeout: The number of seconds the breaker stays open before probing
+        :type reset_timeout: int or float
+
+        :param probes: The number of successful probing calls needed to close the breaker
+        :type probes: int
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError('The failure rate must be between 0 and 1.')
+
+        self._failure_rate = failure_rate
+        self._latency = latency
+        self._min_calls = max(1, min_calls)
+        self._reset_timeout = reset_timeout
+        self._probes = max(1, probes)
+
+        self._lock = threading.Lock()
+        self._results = deque(maxlen=max(window, self._min_calls))
+        self._state = self.CLOSED
+        self._opened_at = None
+        self._probing = 0
+        self._succeeded_probes = 0
+
+        self._calls = 0
+        self._failures = 0
+        self._rejected = 0
+        self._transitions = 0
+        self._changed_at = None
+
+    @property
+    def state(self):
+        """
+        Get the current state of the breaker.
+
+        :rtype: str
+        """
+        with self._lock:
+            self._update()
+
+            return self._state
+
+    def allow(self):
+        """
+        Determine whether a call can be made,
+        reserving a probing call if the breaker is half-open.
+
+        Every allowed call must then be reported with record().
+
+        :rtype: bool
+        """
+        with self._lock:
+            self._update()
+
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.HALF_OPEN and self._probing < self._probes:
+                self._probing += 1
+
+                return True
+
+            self._rejected += 1
+
+            return False
+
+    def record(self, elapsed, error=None):
+        """
+        Report the result of an allowed call.
+
+        :param elapsed: The number of seconds the call took
+        :type elapsed: float
+
+        :param error: The error raised by the call, if any
+        :type error: Exception or None
+        """
+        failed = error is not None or (self._latency is not None and elapsed > self._latency)
+
+        with self._lock:
+            self._calls += 1
+
+            if failed:
+                self._failures += 1
+
+            if self._state == self.HALF_OPEN:
+                self._probing = max(0, self._probing - 1)
+
+                if failed:
+                    self._transition(self.OPEN)
+                else:
+                    self._succeeded_probes += 1
+
+                    if self._succeeded_probes >= self._probes:
+                        self._transition(self.CLOSED)
+
+                return
+
+            if self._state != self.CLOSED:
+                return
+
+            self._results.append(failed)
+
+            if len(self._results) >= self._min_calls:
+                failures = sum(self._results)
+
+                if failures >= self._failure_rate * len(self._results):
+                    self._transition(self.OPEN)
+
+    def get_stats(self):
+        """
+        Get the state of the breaker, the number of times it changed,
+        and the number of calls, failed calls and rejected calls.
+
+        :rtype: dict
+        """
+        with self._lock:
+            self._update()
+
+            return {
+                'state': self._state,
+                'transitions': self._transitions,
+                'changed_at': self._changed_at,
+                'calls': self._calls,
+                'failures': self._failures,
+                'rejected': self._rejected
+            }
+
+    def _update(self):
+        """
+        Let probing calls through once the cool-down period is over.
+        """
+        if (self._state == self.OPEN
+                and time.time() - self._opened_at >= self._reset_timeout):
+            self._transition(self.HALF_OPEN)
+
+    def _transition(self, state):
+        """
+        Change the state of the breaker.
+
+        :param state: The new state
+        :type state: str
+        """
+        self._state = state
+        self._transitions += 1
+        self._changed_at = time.time()
+        self._probing = 0
+        self._succeeded_probes = 0
+
+        if state == self.OPEN:
+            self._opened_at = self._changed_at
+        elif state == self.CLOSED:
+            self._results.clear()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+from .store import Store
+
+
+class AsyncStore(Store):
+    """
+    Abstract class representing a cache store whose operations are coroutines.
+    """
+
+    async def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        raise NotImplementedError()
+
+    async def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return await self.get(key) is not None
+
+    async def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        Stores should override this method
+        to check and store the item atomically.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        if await self.has(key):
+            return False
+
+        await self.put(key, value, minutes)
+
+        return True
+
+    async def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        Stores should override this method
+        to retrieve and delete the item atomically.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        value = await self.get(key)
+
+        if value is not None:
+            await self.forget(key)
+
+        return value
+
+    async def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        return {key: await self.get(key) for key in keys}
+
+    async def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        raise NotImplementedError()
+
+    async def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        for key, value in values.items():
+            await self.put(key, value, minutes)
+
+    async def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        results = [await self.forget(key) for key in keys]
+
+        return all(results)
+
+    async def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        raise NotImplementedError()
+
+    async def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        raise NotImplementedError()
+
+    async def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value
+        :type value: mixed
+        """
+        raise NotImplementedError()
+
+    async def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        raise NotImplementedError()
+
+    async def flush(self):
+        """
+        Remove all items from the cache.
+        """
+        raise NotImplementedError()
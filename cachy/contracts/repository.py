@@ -28,6 +28,19 @@ class Repository(object):
         """
         raise NotImplementedError()
 
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        raise NotImplementedError()
+
     def pull(self, key, default=None):
         """
         Retrieve an item from the cache by key and delete ir.
@@ -53,7 +66,19 @@ class Repository(object):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int or datetime
+        :type minutes: int or float or datetime or timedelta
+        """
+        raise NotImplementedError()
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float or datetime or timedelta
         """
         raise NotImplementedError()
 
@@ -68,7 +93,7 @@ class Repository(object):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int or datetime
+        :type minutes: int or float or datetime or timedelta
 
         :rtype: bool
         """
@@ -94,7 +119,7 @@ class Repository(object):
         :type key: str
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int or datetime
+        :type minutes: int or float or datetime or timedelta
 
         :param callback: The default function
         :type callback: callable
@@ -127,3 +152,14 @@ class Repository(object):
         :rtype: bool
         """
         raise NotImplementedError()
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        raise NotImplementedError()
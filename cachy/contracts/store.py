@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from ..serializers import PickleSerializer
+from ..instrumentation import current_operation
+from ..metrics.metrics import timer
+from ..serializers.pickle_serializer import PickleSerializer
 
 
 class Store(object):
@@ -10,6 +12,8 @@ class Store(object):
 
     _serializer = PickleSerializer()
 
+    _metrics = None
+
     def get(self, key):
         """
         Retrieve an item from the cache by key.
@@ -21,6 +25,17 @@ class Store(object):
         """
         raise NotImplementedError()
 
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return self.get(key) is not None
+
     def put(self, key, value, minutes):
         """
         Store an item in the cache for a given number of minutes.
@@ -32,10 +47,114 @@ class Store(object):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
         """
         raise NotImplementedError()
 
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        Stores should override this method
+        to check and store the item atomically.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        if self.has(key):
+            return False
+
+        self.put(key, value, minutes)
+
+        return True
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        Stores should override this method
+        to retrieve and delete the item atomically.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        value = self.get(key)
+
+        if value is not None:
+            self.forget(key)
+
+        return value
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        return {key: self.get(key) for key in keys}
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        for key, value in values.items():
+            self.put(key, value, minutes)
+
+    def put_many_serialized(self, payloads, minutes):
+        """
+        Store multiple items already serialized with the store serializer
+        for a given number of minutes.
+
+        Stores writing serialized values should override this method
+        so that the payloads are written without being serialized again.
+
+        :param payloads: The serialized values keyed by cache key
+        :type payloads: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        serializer = self.get_serializer()
+
+        self.put_many(
+            {key: serializer.unserialize(payload) for key, payload in payloads.items()},
+            minutes
+        )
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        results = [self.forget(key) for key in keys]
+
+        return all(results)
+
     def increment(self, key, value=1):
         """
         Increment the value of an item in the cache.
@@ -76,6 +195,18 @@ class Store(object):
         """
         raise NotImplementedError()
 
+    def forever_serialized(self, key, payload):
+        """
+        Store an item already serialized with the store serializer indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param payload: The serialized value
+        :type payload: bytes
+        """
+        self.forever(key, self.get_serializer().unserialize(payload))
+
     def forget(self, key):
         """
         Remove an item from the cache.
@@ -93,6 +224,23 @@ class Store(object):
         """
         raise NotImplementedError()
 
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        raise NotImplementedError()
+
     def get_prefix(self):
         """
         Get the cache key prefix.
@@ -114,8 +262,76 @@ class Store(object):
 
         return self
 
+    def get_serializer(self):
+        """
+        Get the serializer.
+
+        :rtype: cachy.serializers.Serializer
+        """
+        return self._serializer
+
+    def set_metrics(self, metrics):
+        """
+        Set the metrics recording the serialization costs.
+
+        :param metrics: The metrics, or None to disable them
+        :type metrics: cachy.metrics.Metrics or None
+
+        :rtype: Store
+        """
+        self._metrics = metrics
+
+        return self
+
+    def get_metrics(self):
+        """
+        Get the metrics recording the serialization costs.
+
+        :rtype: cachy.metrics.Metrics or None
+        """
+        return self._metrics
+
+    def stats(self):
+        """
+        Get a snapshot of the store metrics.
+
+        :rtype: dict
+        """
+        if self._metrics is None:
+            return {}
+
+        return self._metrics.stats()
+
     def unserialize(self, data):
-        return self._serializer.unserialize(data)
+        operation = current_operation()
+
+        if self._metrics is None and operation is None:
+            return self._serializer.unserialize(data)
+
+        start = timer()
+        value = self._serializer.unserialize(data)
+
+        if self._metrics is not None:
+            self._metrics.record('unserialize', timer() - start, 'bytes_in', len(data))
+
+        if operation is not None:
+            operation.add_bytes(len(data))
+
+        return value
 
     def serialize(self, data):
-        return self._serializer.serialize(data)
+        operation = current_operation()
+
+        if self._metrics is None and operation is None:
+            return self._serializer.serialize(data)
+
+        start = timer()
+        serialized = self._serializer.serialize(data)
+
+        if self._metrics is not None:
+            self._metrics.record('serialize', timer() - start, 'bytes_out', len(serialized))
+
+        if operation is not None:
+            operation.add_bytes(len(serialized))
+
+        return serialized
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+
+class Envelope(object):
+    """
+    Wrap a cached value with the metadata needed by the repository.
+
+    Envelopes are stored as plain lists so that every serializer
+    and every store can persist them.
+    """
+
+    MARKER = '__cachy_envelope__'
+
+    def __init__(self, value, expiration=None, delta=0.):
+        """
+        :param value: The cached value
+        :type value: mixed
+
+        :param expiration: The UNIX timestamp at which the value expires
+        :type expiration: float or None
+
+        :param delta: The number of seconds it took to compute the value
+        :type delta: float
+        """
+        self.value = value
+        self.expiration = expiration
+        self.delta = delta
+
+    def pack(self):
+        """
+        Get the storable representation of the envelope.
+
+        :rtype: list
+        """
+        return [self.MARKER, self.value, self.expiration, self.delta]
+
+    @classmethod
+    def wrap(cls, value):
+        """
+        Get the storable representation of a value.
+
+        None values are wrapped in an envelope since stores
+        use None to represent missing items.
+
+        :param value: The value
+        :type value: mixed
+
+        :rtype: mixed
+        """
+        if value is None:
+            return cls(value).pack()
+
+        return value
+
+    @classmethod
+    def unpack(cls, payload):
+        """
+        Get the envelope stored in the given payload.
+
+        :param payload: The stored payload
+        :type payload: mixed
+
+        :return: The envelope or None if the payload is not an envelope
+        :rtype: Envelope or None
+        """
+        if (isinstance(payload, (list, tuple))
+                and len(payload) == 4
+                and payload[0] == cls.MARKER):
+            return cls(payload[1], payload[2], payload[3])
+
+    @classmethod
+    def open(cls, payload):
+        """
+        Get the value stored in the given payload, whether it is wrapped or not.
+
+        :param payload: The stored payload
+        :type payload: mixed
+
+        :rtype: mixed
+        """
+        envelope = cls.unpack(payload)
+
+        if envelope is not None:
+            return envelope.value
+
+        return payload
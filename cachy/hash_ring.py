@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+from bisect import bisect
+
+from .utils import encode
+
+
+class HashRing(object):
+    """
+    A ketama consistent-hash ring mapping keys to nodes.
+
+    Each node is placed on the ring at a number of points proportional
+    to its weight and a key belongs to the node of the first point following
+    its hash. Adding or removing a node thus only remaps the keys
+    of the points it gains or loses, about 1/N of them.
+
+    Hashes are computed with MD5 rather than the built-in ``hash()``,
+    which is randomized per process, so that every process maps a key
+    to the same node.
+    """
+
+    def __init__(self, nodes, weights=None, vnodes=160):
+        """
+        :param nodes: The node names
+        :type nodes: list
+
+        :param weights: The weights of the nodes keyed by node name, 1 by default
+        :type weights: dict or None
+
+        :param vnodes: The number of points of a node of weight 1
+        :type vnodes: int
+        """
+        nodes = list(nodes)
+
+        if not nodes:
+            raise ValueError('The hash ring needs at least one node.')
+
+        if len(set(nodes)) != len(nodes):
+            raise ValueError('The hash ring nodes must have distinct names.')
+
+        weights = weights or {}
+
+        self._nodes = nodes
+        self._weights = {node: weights.get(node, 1) for node in nodes}
+
+        if any(weight <= 0 for weight in self._weights.values()):
+            raise ValueError('The hash ring node weights must be positive.')
+
+        points = {}
+
+        for node in nodes:
+            # Each digest yields four points.
+            for i in range(max(1, int(vnodes * self._weights[node]) // 4)):
+                digest = bytearray(hashlib.md5(encode('%s-%d' % (node, i))).digest())
+
+                for j in range(4):
+                    points[self._point(digest, j)] = node
+
+        self._points = sorted(points)
+        self._owners = [points[point] for point in self._points]
+
+    def get_node(self, key):
+        """
+        Get the node a key belongs to.
+
+        :param key: The key
+        :type key: str
+
+        :rtype: str
+        """
+        digest = bytearray(hashlib.md5(encode(key)).digest())
+        i = bisect(self._points, self._point(digest, 0))
+
+        if i == len(self._points):
+            i = 0
+
+        return self._owners[i]
+
+    def get_nodes(self):
+        """
+        Get the node names.
+
+        :rtype: list
+        """
+        return list(self._nodes)
+
+    def get_weight(self, node):
+        """
+        Get the weight of a node.
+
+        :param node: The node name
+        :type node: str
+
+        :rtype: int or float
+        """
+        return self._weights[node]
+
+    def _point(self, digest, i):
+        """
+        Get a point of the ring from four bytes of a digest,
+        read as a little-endian integer like ketama does.
+
+        :param digest: The MD5 digest
+        :type digest: bytearray
+
+        :param i: The index of the four bytes
+        :type i: int
+
+        :rtype: int
+        """
+        return (digest[3 + i * 4] << 24
+                | digest[2 + i * 4] << 16
+                | digest[1 + i * 4] << 8
+                | digest[i * 4])
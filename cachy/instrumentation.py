@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from functools import wraps
+
+from .metrics.metrics import timer
+
+
+_local = threading.local()
+
+
+def current_operation():
+    """
+    Get the operation being executed by the current thread, if any.
+
+    :rtype: Operation or None
+    """
+    return getattr(_local, 'operation', None)
+
+
+class Operation(object):
+    """
+    A cache operation, as reported to the hooks.
+    """
+
+    def __init__(self, name, key):
+        """
+        :param name: The operation name
+        :type name: str
+
+        :param key: The cache key, or the cache keys of bulk operations
+        :type key: str or list or None
+        """
+        self.name = name
+        self.key = key
+        # The number of serialized bytes read or written,
+        # which stays None for stores that do not serialize.
+        self.size = None
+        self.elapsed = None
+        self.error = None
+        self.time = time.time()
+
+    def add_bytes(self, size):
+        """
+        Add serialized bytes to the payload size.
+
+        :param size: The number of bytes
+        :type size: int
+        """
+        self.size = (self.size or 0) + size
+
+    def __repr__(self):
+        return '<Operation %s %r (%s bytes) %ss>' % (self.name, self.key, self.size, self.elapsed)
+
+
+def instrumented(name):
+    """
+    Report the calls of the decorated method, whose first argument is the key,
+    to the hooks and metrics of its instance.
+
+    :param name: The operation name
+    :type name: str
+
+    :rtype: callable
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._instrumented:
+                return method(self, *args, **kwargs)
+
+            key = args[0] if args else None
+            if isinstance(key, dict):
+                key = list(key)
+
+            return self._instrument(name, key, method, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Instrumented(object):
+    """
+    Report the operations of a cache to hooks and metrics.
+    """
+
+    _metrics = None
+    _before_hooks = ()
+    _after_hooks = ()
+
+    # Whether operations must be reported at all,
+    # so that they cost nearly nothing otherwise.
+    _instrumented = False
+
+    def before(self, hook):
+        """
+        Register a hook called with the Operation before each operation.
+
+        :param hook: The hook
+        :type hook: callable
+
+        :rtype: self
+        """
+        self._before_hooks = self._before_hooks + (hook,)
+        self._instrumented = True
+
+        return self
+
+    def after(self, hook):
+        """
+        Register a hook called with the Operation after each operation,
+        once its elapsed time, payload size and error are known.
+
+        :param hook: The hook
+        :type hook: callable
+
+        :rtype: self
+        """
+        self._after_hooks = self._after_hooks + (hook,)
+        self._instrumented = True
+
+        return self
+
+    def get_metrics(self):
+        """
+        Get the metrics recording the operations.
+
+        :rtype: cachy.metrics.Metrics or None
+        """
+        return self._metrics
+
+    def set_metrics(self, metrics):
+        """
+        Set the metrics recording the operations.
+
+        :param metrics: The metrics, or None to disable them
+        :type metrics: cachy.metrics.Metrics or None
+
+        :rtype: self
+        """
+        self._metrics = metrics
+        self._instrumented = bool(metrics is not None or self._before_hooks or self._after_hooks)
+
+        return self
+
+    def stats(self):
+        """
+        Get a snapshot of the metrics.
+
+        :rtype: dict
+        """
+        if self._metrics is None:
+            return {}
+
+        return self._metrics.stats()
+
+    def _share_instrumentation(self, other):
+        """
+        Report the operations of another cache to the same hooks and metrics.
+
+        :param other: The other cache
+        :type other: Instrumented
+        """
+        other._metrics = self._metrics
+        other._before_hooks = self._before_hooks
+        other._after_hooks = self._after_hooks
+        other._instrumented = self._instrumented
+
+    def _instrument(self, name, key, fn, *args, **kwargs):
+        """
+        Execute an operation, reporting it to the hooks and metrics.
+
+        :param name: The operation name
+        :type name: str
+
+        :param key: The cache key or keys
+        :type key: str or list or None
+
+        :param fn: The function executing the operation
+        :type fn: callable
+
+        :rtype: mixed
+        """
+        operation = Operation(name, key)
+
+        for hook in self._before_hooks:
+            hook(operation)
+
+        # Stores add the size of the payloads they serialize
+        # to the operation of the current thread.
+        parent = getattr(_local, 'operation', None)
+        _local.operation = operation
+
+        start = timer()
+
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            operation.error = e
+
+            raise
+        finally:
+            operation.elapsed = timer() - start
+            _local.operation = parent
+
+            if self._metrics is not None:
+                if operation.error is None:
+                    self._metrics.observe(name, operation.elapsed)
+                else:
+                    self._metrics.record(name, operation.elapsed, 'errors')
+
+            for hook in self._after_hooks:
+                hook(operation)
+
+    def _record(self, counter, value=1):
+        """
+        Increment a counter of the metrics, if enabled.
+
+        :param counter: The counter name
+        :type counter: str
+
+        :param value: The increment value
+        :type value: int
+        """
+        if self._metrics is not None:
+            self._metrics.increment(counter, value)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import types
+
+try:
+    import cPickle as pickle
+except ImportError:  # noqa
+    import pickle
+
+from .utils import encode, basestring, long
+
+
+# Arguments of these types do not require the store serializer
+# and their keys can be memoized.
+PRIMITIVES = set([str, bytes, type(u''), int, long, float, bool, type(None)])
+
+
+def takes_instance(fn):
+    """
+    Determine whether a function is defined in a class body
+    and receives the instance or the class as first argument.
+
+    :param fn: The function
+    :type fn: callable
+
+    :rtype: bool
+    """
+    if not isinstance(fn, types.FunctionType):
+        return False
+
+    code = fn.__code__
+
+    return code.co_argcount > 0 and code.co_varnames[0] in ('self', 'cls')
+
+
+class KeyBuilder(object):
+    """
+    Build the cache keys of the calls of a decorated function.
+
+    Everything depending only on the function is computed once,
+    and calls with primitive arguments do not require a serializer.
+    The keys of such calls are also memoized, using the arguments themselves,
+    so that repeated calls do not compute them again.
+    """
+
+    def __init__(self, fn, typed=False, memo_size=1024):
+        """
+        :param fn: The decorated function, or a key prefix
+        :type fn: callable or str
+
+        :param typed: Whether arguments of different types should be cached separately
+        :type typed: bool
+
+        :param memo_size: The maximum number of memoized keys
+        :type memo_size: int
+        """
+        self._typed = typed
+        self._skip_first = False
+        self._memo = {}
+        self._memo_size = memo_size
+
+        if isinstance(fn, basestring):
+            self._prefix = fn
+            self._hashed = False
+        else:
+            self._prefix = self._get_function_name(fn)
+            self._hashed = True
+
+            # The instance or the class received by functions
+            # defined in a class body is not part of the key.
+            self._skip_first = takes_instance(fn)
+
+        self._prefix_bytes = encode(self._prefix) + b':'
+
+    def build(self, args, kwargs, serialize):
+        """
+        Build the key of a call.
+
+        :param args: The call arguments
+        :type args: tuple
+
+        :param kwargs: The call keyword arguments
+        :type kwargs: dict
+
+        :param serialize: The function used to serialize non primitive arguments
+        :type serialize: callable
+
+        :rtype: str
+        """
+        if self._skip_first:
+            args = args[1:]
+
+        if not self._are_primitives(args, kwargs):
+            return self._make_key(encode(
+                serialize(list(args))
+                + serialize([(k, kwargs[k]) for k in sorted(kwargs)])
+            ))
+
+        # Primitive arguments are hashable and immutable
+        # so they can be used to memoize the keys. Keyword arguments are sorted
+        # by name, their types next to them, so that each type stays with its value.
+        if self._typed:
+            memo_key = (args, tuple(map(type, args)))
+
+            if kwargs:
+                memo_key += (tuple((k, type(kwargs[k]), kwargs[k]) for k in sorted(kwargs)),)
+        elif kwargs:
+            memo_key = (args, tuple(sorted(kwargs.items())))
+        else:
+            memo_key = args
+
+        key = self._memo.get(memo_key)
+
+        if key is None:
+            key = self._make_key(self._represent(args, kwargs))
+
+            if len(self._memo) >= self._memo_size:
+                self._memo.clear()
+
+            self._memo[memo_key] = key
+
+        return key
+
+    def _are_primitives(self, args, kwargs):
+        """
+        Determine whether all the arguments are primitives.
+
+        :rtype: bool
+        """
+        primitives = PRIMITIVES
+
+        for arg in args:
+            if type(arg) not in primitives:
+                return False
+
+        if kwargs:
+            for arg in kwargs.values():
+                if type(arg) not in primitives:
+                    return False
+
+        return True
+
+    def _represent(self, args, kwargs):
+        """
+        Get the representation of primitive arguments.
+
+        :rtype: bytes
+        """
+        items = sorted(kwargs.items()) if kwargs else []
+
+        if self._typed:
+            args = [(type(arg).__name__, arg) for arg in args]
+            items = [(k, type(arg).__name__, arg) for k, arg in items]
+        else:
+            # Like functools.lru_cache, equal numbers share the same key
+            # unless typed keys are requested.
+            args = [
+                int(arg) if type(arg) is bool or type(arg) is float and arg.is_integer() else arg
+                for arg in args
+            ]
+            items = [
+                (k, int(arg) if type(arg) is bool or type(arg) is float and arg.is_integer() else arg)
+                for k, arg in items
+            ]
+
+        # Pickling primitives with a fixed protocol is both stable and
+        # faster than building their textual representation.
+        return pickle.dumps((args, items), 2)
+
+    def _make_key(self, arguments):
+        """
+        Make the key from the representation of the arguments.
+
+        :param arguments: The representation of the arguments
+        :type arguments: bytes
+
+        :rtype: str
+        """
+        if self._hashed:
+            return hashlib.sha1(self._prefix_bytes + arguments).hexdigest()
+
+        return '%s:%s' % (self._prefix, hashlib.sha1(arguments).hexdigest())
+
+    def _get_function_name(self, fn):
+        """
+        Get the fully qualified name of a function.
+
+        :rtype: str
+        """
+        if isinstance(fn, types.MethodType):
+            owner = fn.__self__
+
+            if not isinstance(owner, type):
+                owner = owner.__class__
+
+            return '%s.%s.%s' % (
+                owner.__module__,
+                getattr(owner, '__qualname__', owner.__name__),
+                fn.__name__
+            )
+
+        name = getattr(fn, '__qualname__', None) or getattr(fn, '__name__', None) or repr(fn)
+
+        return '%s.%s' % (getattr(fn, '__module__', None), name)
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+from .lock import Lock, LockTimeoutError
+from .dict_lock import DictLock
+from .file_lock import FileLock
+from .memcached_lock import MemcachedLock
+from .redis_lock import RedisLock
+from .null_lock import NullLock
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from .lock import Lock
+
+
+class DictLock(Lock):
+    """
+    A lock living in the memory of the current process.
+    """
+
+    def __init__(self, locks, guard, name, seconds=0, owner=None, **kwargs):
+        """
+        :param locks: The held locks as (owner, expiration) tuples keyed by name
+        :type locks: dict
+
+        :param guard: The lock protecting the held locks
+        :type guard: threading.Lock
+        """
+        super(DictLock, self).__init__(name, seconds, owner, **kwargs)
+
+        self._locks = locks
+        self._guard = guard
+
+    def acquire(self):
+        """
+        Attempt to acquire the lock without waiting.
+
+        :rtype: bool
+        """
+        with self._guard:
+            current = self._locks.get(self._name)
+
+            if current is not None and (current[1] is None or current[1] > time.time()):
+                return False
+
+            expiration = None
+            if self._seconds > 0:
+                expiration = time.time() + self._seconds
+
+            self._locks[self._name] = (self._owner, expiration)
+
+            return True
+
+    def release(self):
+        """
+        Release the lock if it is owned by the current owner.
+
+        :rtype: bool
+        """
+        with self._guard:
+            current = self._locks.get(self._name)
+
+            if current is None or current[0] != self._owner:
+                return False
+
+            del self._locks[self._name]
+
+            return True
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .lock import Lock
+from ..utils import mkdir_p
+
+
+class FileLock(Lock):
+    """
+    A lock using an advisory file lock as its backend.
+
+    The lock is tied to an open file descriptor so it is automatically
+    released when the owning process exits, the expiration being ignored.
+    """
+
+    def __init__(self, path, name, seconds=0, owner=None, **kwargs):
+        """
+        :param path: The lock file path
+        :type path: str
+        """
+        if fcntl is None:
+            raise RuntimeError('File locks are not supported on this platform.')
+
+        super(FileLock, self).__init__(name, seconds, owner, **kwargs)
+
+        self._path = path
+        self._fd = None
+
+    def acquire(self):
+        """
+        Attempt to acquire the lock without waiting.
+
+        :rtype: bool
+        """
+        if self._fd is not None:
+            return True
+
+        mkdir_p(os.path.dirname(self._path))
+
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            os.close(fd)
+
+            return False
+
+        self._fd = fd
+
+        return True
+
+    def release(self):
+        """
+        Release the lock if it is owned by the current owner.
+
+        :rtype: bool
+        """
+        if self._fd is None:
+            return False
+
+        fd, self._fd = self._fd, None
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+        return True
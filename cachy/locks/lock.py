@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+
+class LockTimeoutError(RuntimeError):
+    """
+    Raised when a lock could not be acquired in the given time.
+    """
+
+
+class Lock(object):
+    """
+    Abstract class representing a lock shared through a cache store.
+    """
+
+    def __init__(self, name, seconds=0, owner=None, blocking_timeout=None, sleep=0.1):
+        """
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :param blocking_timeout: The maximum number of seconds to wait when used as a context manager
+        :type blocking_timeout: int or float or None
+
+        :param sleep: The number of seconds to wait between two acquisition attempts
+        :type sleep: int or float
+        """
+        if owner is None:
+            # Imported here since it slows down the import of the package.
+            import uuid
+
+            owner = uuid.uuid4().hex
+
+        self._name = name
+        self._seconds = seconds
+        self._owner = owner
+        self._blocking_timeout = blocking_timeout
+        self._sleep = sleep
+
+    def acquire(self):
+        """
+        Attempt to acquire the lock without waiting.
+
+        :rtype: bool
+        """
+        raise NotImplementedError()
+
+    def release(self):
+        """
+        Release the lock if it is owned by the current owner.
+
+        :rtype: bool
+        """
+        raise NotImplementedError()
+
+    def get(self, callback=None):
+        """
+        Attempt to acquire the lock and execute the callback while holding it.
+
+        :param callback: The function to execute
+        :type callback: callable or None
+
+        :return: The callback result if a callback was given, whether the lock was acquired otherwise
+        """
+        acquired = self.acquire()
+
+        if acquired and callback is not None:
+            try:
+                return callback()
+            finally:
+                self.release()
+
+        return acquired
+
+    def block(self, seconds, callback=None):
+        """
+        Wait for the lock to be acquired for a given number of seconds.
+
+        :param seconds: The maximum number of seconds to wait, None meaning indefinitely
+        :type seconds: int or float or None
+
+        :param callback: The function to execute while holding the lock
+        :type callback: callable or None
+
+        :raises: LockTimeoutError
+
+        :return: The callback result if a callback was given, True otherwise
+        """
+        starting = time.time()
+
+        while not self.acquire():
+            if seconds is not None and time.time() - starting >= seconds:
+                raise LockTimeoutError('Unable to acquire lock [%s].' % self._name)
+
+            time.sleep(self._sleep)
+
+        if callback is not None:
+            try:
+                return callback()
+            finally:
+                self.release()
+
+        return True
+
+    def owner(self):
+        """
+        Get the lock owner identifier.
+
+        :rtype: str
+        """
+        return self._owner
+
+    def __enter__(self):
+        self.block(self._blocking_timeout)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
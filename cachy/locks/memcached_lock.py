@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+from .lock import Lock
+
+
+class MemcachedLock(Lock):
+    """
+    A lock using memcached as its backend.
+
+    Memcached cannot delete an item only if it is unchanged, so with clients
+    created without ``cache_cas=True``, a lock expiring between the owner check
+    and the deletion of ``release()`` may delete the lock of another owner.
+    With ``cache_cas=True``, the lock is released atomically instead,
+    by replacing it with an already expired item if it has not changed.
+    """
+
+    def __init__(self, memcache, name, seconds=0, owner=None, **kwargs):
+        """
+        :param memcache: The memcached client
+        :type memcache: memcache.Client
+        """
+        super(MemcachedLock, self).__init__(name, seconds, owner, **kwargs)
+
+        self._memcache = memcache
+
+    def acquire(self):
+        """
+        Attempt to acquire the lock without waiting.
+
+        :rtype: bool
+        """
+        return bool(self._memcache.add(self._name, self._owner, self._expiration()))
+
+    def release(self):
+        """
+        Release the lock if it is owned by the current owner.
+
+        :rtype: bool
+        """
+        if getattr(self._memcache, 'cache_cas', False):
+            if self._memcache.gets(self._name) != self._owner:
+                return False
+
+            # Items stored with a negative expiration time expire immediately.
+            return bool(self._memcache.cas(self._name, self._owner, -1))
+
+        if self.get_current_owner() == self._owner:
+            return bool(self._memcache.delete(self._name))
+
+        return False
+
+    def get_current_owner(self):
+        """
+        Get the owner identifier of the lock currently held.
+
+        :rtype: str or None
+        """
+        return self._memcache.get(self._name)
+
+    def _expiration(self):
+        """
+        Get the expiration time of the lock in seconds.
+
+        Memcached only supports whole seconds, 0 meaning never,
+        so sub-second locks are rounded up.
+
+        :rtype: int
+        """
+        if self._seconds <= 0:
+            return 0
+
+        return max(1, int(math.ceil(self._seconds)))
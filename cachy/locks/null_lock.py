@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from .lock import Lock
+
+
+class NullLock(Lock):
+    """
+    A lock that is always acquired, meant to be used with the null store.
+    """
+
+    def acquire(self):
+        """
+        Attempt to acquire the lock without waiting.
+
+        :rtype: bool
+        """
+        return True
+
+    def release(self):
+        """
+        Release the lock if it is owned by the current owner.
+
+        :rtype: bool
+        """
+        return True
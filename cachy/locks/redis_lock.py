@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+from .lock import Lock
+from ..utils import decode
+
+
+class RedisLock(Lock):
+    """
+    A lock using Redis as its backend.
+    """
+
+    # Delete the lock only if it is still held by its owner,
+    # so that an expired lock acquired by someone else is left untouched.
+    RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+    def __init__(self, redis, name, seconds=0, owner=None, **kwargs):
+        """
+        :param redis: The Redis client
+        :type redis: redis.StrictRedis
+        """
+        super(RedisLock, self).__init__(name, seconds, owner, **kwargs)
+
+        self._redis = redis
+
+    def acquire(self):
+        """
+        Attempt to acquire the lock without waiting.
+
+        :rtype: bool
+        """
+        if self._seconds > 0:
+            result = self._redis.set(
+                self._name, self._owner, nx=True, px=self._expiration()
+            )
+        else:
+            result = self._redis.set(self._name, self._owner, nx=True)
+
+        return bool(result)
+
+    def release(self):
+        """
+        Release the lock if it is owned by the current owner.
+
+        :rtype: bool
+        """
+        return bool(self._redis.eval(self.RELEASE_SCRIPT, 1, self._name, self._owner))
+
+    def get_current_owner(self):
+        """
+        Get the owner identifier of the lock currently held.
+
+        :rtype: str or None
+        """
+        owner = self._redis.get(self._name)
+
+        if owner is not None:
+            return decode(owner)
+
+    def _expiration(self):
+        """
+        Get the expiration time of the lock in milliseconds.
+
+        Redis only supports whole milliseconds, and rejects 0,
+        so locks shorter than a millisecond are rounded up.
+
+        :rtype: int
+        """
+        return max(1, int(math.ceil(self._seconds * 1000)))
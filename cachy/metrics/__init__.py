@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from .histogram import Histogram
+from .metrics import Metrics
+from .sinks import Sink, MemorySink
+from .prometheus import PrometheusRenderer
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+
+
+class Histogram(object):
+    """
+    A histogram counting observations in fixed buckets.
+
+    It is not thread-safe, the metrics owning it being responsible
+    for the synchronization.
+    """
+
+    # Upper bounds, in seconds, of the default latency buckets.
+    DEFAULT_BUCKETS = (
+        .0001, .00025, .0005, .001, .0025, .005, .01,
+        .025, .05, .1, .25, .5, 1., 2.5, 5., 10.
+    )
+
+    def __init__(self, buckets=None):
+        """
+        :param buckets: The sorted upper bounds of the buckets
+        :type buckets: list or tuple or None
+        """
+        self._bounds = tuple(buckets or self.DEFAULT_BUCKETS)
+        # The last bucket counts the observations above every bound.
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.
+        self._count = 0
+
+    def observe(self, value):
+        """
+        Record an observation.
+
+        :param value: The observed value
+        :type value: float
+        """
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def snapshot(self):
+        """
+        Get the cumulative counts of the buckets along with
+        the sum and the number of observations.
+
+        :rtype: dict
+        """
+        buckets = []
+        total = 0
+
+        for bound, count in zip(self._bounds + (float('inf'),), self._counts):
+            total += count
+            buckets.append((bound, total))
+
+        return {
+            'buckets': buckets,
+            'sum': self._sum,
+            'count': self._count
+        }
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+try:
+    from time import perf_counter as timer
+except ImportError:  # noqa
+    from time import time as timer
+
+from .histogram import Histogram
+
+
+class Metrics(object):
+    """
+    Count the operations of a repository or a store
+    and record their latencies.
+
+    Every event is also forwarded to the registered sinks.
+    """
+
+    COUNTERS = ('hits', 'misses', 'sets', 'deletes', 'errors', 'bytes_in', 'bytes_out')
+
+    def __init__(self, name='', sinks=None, buckets=None):
+        """
+        :param name: The name identifying the metrics, usually the store name
+        :type name: str
+
+        :param sinks: The sinks receiving the events
+        :type sinks: list or None
+
+        :param buckets: The upper bounds, in seconds, of the latency buckets
+        :type buckets: list or None
+        """
+        self.name = name
+        self._sinks = list(sinks or [])
+        self._buckets = buckets
+        self._lock = threading.Lock()
+
+        self.reset()
+
+    def increment(self, counter, value=1):
+        """
+        Increment a counter.
+
+        :param counter: The counter name
+        :type counter: str
+
+        :param value: The increment value
+        :type value: int
+        """
+        with self._lock:
+            self._counters[counter] += value
+
+        for sink in self._sinks:
+            sink.increment(self.name, counter, value)
+
+    def observe(self, operation, seconds):
+        """
+        Record the duration of an operation.
+
+        :param operation: The operation name
+        :type operation: str
+
+        :param seconds: The duration of the operation
+        :type seconds: float
+        """
+        with self._lock:
+            histogram = self._latencies.get(operation)
+
+            if histogram is None:
+                histogram = Histogram(self._buckets)
+                self._latencies[operation] = histogram
+
+            histogram.observe(seconds)
+
+        for sink in self._sinks:
+            sink.observe(self.name, operation, seconds)
+
+    def record(self, operation, seconds, counter=None, value=1):
+        """
+        Record the duration of an operation and increment a counter at once.
+
+        :param operation: The operation name
+        :type operation: str
+
+        :param seconds: The duration of the operation
+        :type seconds: float
+
+        :param counter: The counter name
+        :type counter: str or None
+
+        :param value: The increment value
+        :type value: int
+        """
+        with self._lock:
+            histogram = self._latencies.get(operation)
+
+            if histogram is None:
+                histogram = Histogram(self._buckets)
+                self._latencies[operation] = histogram
+
+            histogram.observe(seconds)
+
+            if counter is not None:
+                self._counters[counter] += value
+
+        for sink in self._sinks:
+            sink.observe(self.name, operation, seconds)
+
+            if counter is not None:
+                sink.increment(self.name, counter, value)
+
+    def stats(self):
+        """
+        Get a snapshot of the counters and latencies.
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats['latency'] = {
+                operation: histogram.snapshot()
+                for operation, histogram in self._latencies.items()
+            }
+
+        return stats
+
+    def reset(self):
+        """
+        Reset the counters and latencies.
+        """
+        with self._lock:
+            self._counters = dict.fromkeys(self.COUNTERS, 0)
+            self._latencies = {}
+
+    def add_sink(self, sink):
+        """
+        Register a sink receiving the events.
+
+        :param sink: The sink
+        :type sink: cachy.metrics.Sink
+
+        :rtype: self
+        """
+        self._sinks.append(sink)
+
+        return self
+
+    def get_sinks(self):
+        """
+        Get the registered sinks.
+
+        :rtype: list
+        """
+        return self._sinks
+
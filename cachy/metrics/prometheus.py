@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+
+class PrometheusRenderer(object):
+    """
+    Render metrics snapshots in the Prometheus text exposition format.
+    """
+
+    COUNTERS = (
+        ('hits', 'Number of cache hits.'),
+        ('misses', 'Number of cache misses.'),
+        ('sets', 'Number of items stored.'),
+        ('deletes', 'Number of items removed.'),
+        ('errors', 'Number of failed operations.'),
+        ('bytes_in', 'Number of serialized bytes read.'),
+        ('bytes_out', 'Number of serialized bytes written.'),
+    )
+
+    def __init__(self, namespace='cachy'):
+        """
+        :param namespace: The prefix of the metric names
+        :type namespace: str
+        """
+        self._namespace = namespace
+
+    def render(self, stats):
+        """
+        Render metrics snapshots.
+
+        :param stats: The snapshots keyed by store name
+        :type stats: dict
+
+        :rtype: str
+        """
+        lines = []
+        names = sorted(stats)
+
+        for counter, description in self.COUNTERS:
+            metric = '%s_%s_total' % (self._namespace, counter)
+
+            lines.append('# HELP %s %s' % (metric, description))
+            lines.append('# TYPE %s counter' % metric)
+
+            for name in names:
+                lines.append('%s{store="%s"} %s' % (
+                    metric, self._escape(name), stats[name].get(counter, 0)
+                ))
+
+        metric = '%s_operation_duration_seconds' % self._namespace
+
+        lines.append('# HELP %s Duration of the cache operations.' % metric)
+        lines.append('# TYPE %s histogram' % metric)
+
+        for name in names:
+            latency = stats[name].get('latency', {})
+
+            for operation in sorted(latency):
+                histogram = latency[operation]
+                labels = 'store="%s",operation="%s"' % (self._escape(name), operation)
+
+                for bound, count in histogram['buckets']:
+                    lines.append('%s_bucket{%s,le="%s"} %d' % (
+                        metric, labels, self._format_bound(bound), count
+                    ))
+
+                lines.append('%s_sum{%s} %r' % (metric, labels, float(histogram['sum'])))
+                lines.append('%s_count{%s} %d' % (metric, labels, histogram['count']))
+
+        return '\n'.join(lines) + '\n'
+
+    def _format_bound(self, bound):
+        """
+        Format the upper bound of a bucket.
+
+        :rtype: str
+        """
+        if bound == float('inf'):
+            return '+Inf'
+
+        return repr(float(bound))
+
+    def _escape(self, value):
+        """
+        Escape a label value.
+
+        :rtype: str
+        """
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
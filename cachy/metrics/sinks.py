@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+
+class Sink(object):
+    """
+    Receive the events of metrics, to export them to a monitoring system.
+
+    Sinks are called synchronously for every event, so they should only
+    buffer or aggregate them and send them elsewhere asynchronously.
+    """
+
+    def increment(self, name, counter, value):
+        """
+        Receive a counter increment.
+
+        :param name: The name of the metrics
+        :type name: str
+
+        :param counter: The counter name
+        :type counter: str
+
+        :param value: The increment value
+        :type value: int
+        """
+        pass
+
+    def observe(self, name, operation, seconds):
+        """
+        Receive the duration of an operation.
+
+        :param name: The name of the metrics
+        :type name: str
+
+        :param operation: The operation name
+        :type operation: str
+
+        :param seconds: The duration of the operation
+        :type seconds: float
+        """
+        pass
+
+
+class MemorySink(Sink):
+    """
+    A sink aggregating in memory the events of any number of metrics.
+    """
+
+    def __init__(self, buckets=None):
+        """
+        :param buckets: The upper bounds, in seconds, of the latency buckets
+        :type buckets: list or None
+        """
+        self._buckets = buckets
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name, counter, value):
+        self._get_metrics(name).increment(counter, value)
+
+    def observe(self, name, operation, seconds):
+        self._get_metrics(name).observe(operation, seconds)
+
+    def stats(self):
+        """
+        Get a snapshot of the aggregated metrics, keyed by name.
+
+        :rtype: dict
+        """
+        return {name: metrics.stats() for name, metrics in list(self._metrics.items())}
+
+    def reset(self):
+        """
+        Remove the aggregated metrics.
+        """
+        with self._lock:
+            self._metrics = {}
+
+    def _get_metrics(self, name):
+        """
+        Get the metrics aggregating the events of the given name.
+
+        :rtype: cachy.metrics.Metrics
+        """
+        metrics = self._metrics.get(name)
+
+        if metrics is None:
+            from .metrics import Metrics
+
+            with self._lock:
+                metrics = self._metrics.setdefault(name, Metrics(name, buckets=self._buckets))
+
+        return metrics
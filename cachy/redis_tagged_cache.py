@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
 import hashlib
+from .envelope import Envelope
+from .instrumentation import instrumented
 from .tagged_cache import TaggedCache
-from .utils import encode
+from .utils import encode, decode
 
 
 class RedisTaggedCache(TaggedCache):
 
+    @instrumented('forever')
     def forever(self, key, value):
         """
         Store an item in the cache indefinitely.
@@ -23,8 +26,9 @@ class RedisTaggedCache(TaggedCache):
 
         self._store.forever(
             '%s:%s' % (hashlib.sha1(encode(self._tags.get_namespace())).hexdigest(), key),
-            value
+            Envelope.wrap(value)
         )
+        self._record('sets')
 
     def flush(self):
         """
@@ -78,3 +82,52 @@ class RedisTaggedCache(TaggedCache):
         :rtype: str
         """
         return '%s%s:forever' % (self.get_prefix(), segment)
+
+
+class ShardedRedisTaggedCache(RedisTaggedCache):
+    """
+    A tagged cache of a sharded store whose shards all use Redis.
+
+    The list of the items of a tag stored forever is kept on the shard owning it,
+    and holds their keys without prefix so that they are removed from their own shard.
+    """
+
+    def _push_forever_keys(self, namespace, key):
+        """
+        Store a copy of the key for each namespace segment.
+
+        :type namespace: str
+        :type key: str
+        """
+        item_key = '%s:%s' % (hashlib.sha1(encode(self._tags.get_namespace())).hexdigest(), key)
+
+        for segment in namespace.split('|'):
+            connection, forever_key = self._forever_list(segment)
+            connection.lpush(forever_key, item_key)
+
+    def _delete_forever_keys(self):
+        """
+        Delete all of the items that were stored forever.
+        """
+        for segment in self._tags.get_namespace().split('|'):
+            connection, forever_key = self._forever_list(segment)
+            forever = connection.lrange(forever_key, 0, -1)
+
+            if len(forever) > 0:
+                self._store.forget_many([decode(item_key) for item_key in forever])
+
+            connection.delete(forever_key)
+
+    def _forever_list(self, segment):
+        """
+        Get the connection to the shard owning the forever reference key
+        of a segment, and the key.
+
+        :type segment: str
+
+        :rtype: tuple
+        """
+        name = '%s:forever' % segment
+        shard = self._store.get_shard(name)
+
+        return shard.connection(), shard.get_prefix() + name
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+import heapq
+import random
+import threading
+
+from .metrics.metrics import timer
+
+
+class Registration(object):
+    """
+    A key reloaded before it expires.
+    """
+
+    def __init__(self, key, loader, minutes, lead):
+        self.key = key
+        self.loader = loader
+        self.minutes = minutes
+        self.lead = lead
+        self.failures = 0
+        self.running = False
+
+
+class RefreshAhead(object):
+    """
+    Reload registered keys shortly before they expire so that
+    their readers never have to compute them.
+
+    A scheduler thread keeps the next reload of each key in a time-ordered heap
+    and hands the due ones to a bounded pool of workers.
+    """
+
+    def __init__(self, repository, workers=4, jitter=0.1, backoff=1, max_backoff=300):
+        """
+        :param repository: The repository storing the reloaded values
+        :type repository: cachy.Repository
+
+        :param workers: The maximum number of concurrent reloads
+        :type workers: int
+
+        :param jitter: The maximum fraction by which a reload is moved earlier,
+                       so that keys registered together do not reload together
+        :type jitter: float
+
+        :param backoff: The number of seconds to wait before retrying a failed reload,
+                        doubled on each consecutive failure
+        :type backoff: int or float
+
+        :param max_backoff: The maximum number of seconds between retries
+        :type max_backoff: int or float
+        """
+        self._repository = repository
+        self._workers = workers
+        self._jitter = jitter
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+        self._registrations = {}
+        self._heap = []
+        self._counter = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._stopped = False
+
+        self._refreshes = 0
+        self._failures = 0
+
+    def register(self, key, loader, minutes, lead_seconds=None):
+        """
+        Register a key, loading it in the background as soon as possible
+        and then shortly before each expiration.
+
+        The first load is not awaited, so the key may still be missing right after.
+
+        :param key: The cache key
+        :type key: str
+
+        :param loader: The function computing the value
+        :type loader: callable
+
+        :param minutes: The lifetime in minutes of the value
+        :type minutes: int or float or timedelta
+
+        :param lead_seconds: The number of seconds before the expiration at which
+                             the value is reloaded, 10% of the lifetime by default
+        :type lead_seconds: int or float or None
+        """
+        minutes = self._repository._get_minutes(minutes)
+
+        if minutes is None or minutes <= 0:
+            raise ValueError('Refreshed keys must have a positive lifetime.')
+
+        seconds = minutes * 60.
+
+        if lead_seconds is None:
+            lead_seconds = seconds * 0.1
+
+        if not 0 <= lead_seconds < seconds:
+            raise ValueError('The lead time must be shorter than the lifetime.')
+
+        registration = Registration(key, loader, minutes, lead_seconds)
+
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError('The refresh-ahead scheduler is stopped.')
+
+            self._registrations[key] = registration
+            self._schedule(registration, 0)
+
+            if self._thread is None:
+                self._start()
+
+    def unregister(self, key):
+        """
+        Stop reloading a key.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        with self._condition:
+            return self._registrations.pop(key, None) is not None
+
+    def keys(self):
+        """
+        Get the registered keys.
+
+        :rtype: list
+        """
+        with self._condition:
+            return list(self._registrations)
+
+    def get_stats(self):
+        """
+        Get the number of registered keys, of reloads and of failed reloads.
+
+        :rtype: dict
+        """
+        with self._condition:
+            return {
+                'registered': len(self._registrations),
+                'refreshes': self._refreshes,
+                'failures': self._failures
+            }
+
+    def stop(self, wait=True):
+        """
+        Stop the scheduler thread and the workers.
+
+        :param wait: Whether to wait for the running reloads
+        :type wait: bool
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait)
+
+    def _start(self):
+        """
+        Start the scheduler thread and the workers.
+        """
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+        except ImportError:
+            raise RuntimeError('Refresh-ahead requires the "futures" package on Python 2.')
+
+        self._executor = ThreadPoolExecutor(self._workers)
+        self._thread = threading.Thread(target=self._run, name='cachy-refresh-ahead')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _schedule(self, registration, delay):
+        """
+        Schedule the next reload of a key.
+
+        :param registration: The registration of the key
+        :type registration: Registration
+
+        :param delay: The number of seconds before the reload
+        :type delay: float
+        """
+        # The counter keeps the heap from comparing registrations.
+        self._counter += 1
+        heapq.heappush(self._heap, (timer() + delay, self._counter, registration))
+        self._condition.notify_all()
+
+    def _run(self):
+        """
+        Hand the due reloads to the workers until the scheduler is stopped.
+        """
+        with self._condition:
+            while not self._stopped:
+                if not self._heap:
+                    self._condition.wait()
+
+                    continue
+
+                due, _, registration = self._heap[0]
+                remaining = due - timer()
+
+                if remaining > 0:
+                    self._condition.wait(remaining)
+
+                    continue
+
+                heapq.heappop(self._heap)
+
+                # Skipping unregistered or replaced keys
+                # and keys whose reload is still running.
+                if self._registrations.get(registration.key) is not registration:
+                    continue
+
+                if registration.running:
+                    continue
+
+                registration.running = True
+                self._executor.submit(self._refresh, registration)
+
+    def _refresh(self, registration):
+        """
+        Reload a key and schedule its next reload.
+
+        :param registration: The registration of the key
+        :type registration: Registration
+        """
+        try:
+            val = registration.loader()
+            self._repository.put(registration.key, val, registration.minutes)
+        except Exception:
+            failed = True
+        else:
+            failed = False
+
+        with self._condition:
+            registration.running = False
+
+            if failed:
+                self._failures += 1
+                registration.failures += 1
+
+                delay = min(
+                    self._backoff * 2 ** (registration.failures - 1),
+                    self._max_backoff
+                )
+            else:
+                self._refreshes += 1
+                registration.failures = 0
+
+                delay = registration.minutes * 60. - registration.lead
+
+            delay -= delay * random.uniform(0, self._jitter)
+
+            if self._registrations.get(registration.key) is registration and not self._stopped:
+                self._schedule(registration, delay)
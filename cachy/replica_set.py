@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+import threading
+
+from .circuit_breaker import CircuitBreaker
+from .metrics.metrics import timer
+
+
+class Replica(object):
+    """
+    A replica client with its circuit breaker and observed latency.
+    """
+
+    def __init__(self, client, breaker):
+        self.client = client
+        self.breaker = breaker
+        self.latency = None
+        self.reads = 0
+
+
+class ReplicaSet(object):
+    """
+    Spread reads across the replicas of a primary server.
+
+    Replicas are chosen in turn or by lowest observed latency.
+    Each one is guarded by a circuit breaker so that failing or slow replicas
+    are ejected until they recover, reads falling back to the primary
+    when no replica is available.
+    """
+
+    ROUND_ROBIN = 'round-robin'
+    LATENCY = 'latency'
+
+    def __init__(self, primary, replicas, selection=ROUND_ROBIN, smoothing=0.2, **options):
+        """
+        :param primary: The primary client
+        :type primary: mixed
+
+        :param replicas: The replica clients
+        :type replicas: list
+
+        :param selection: How replicas are chosen, "round-robin" or "latency"
+        :type selection: str
+
+        :param smoothing: The weight of the last call in the observed latency
+        :type smoothing: float
+
+        :param options: The options of the circuit breakers
+        :type options: dict
+        """
+        if selection not in (self.ROUND_ROBIN, self.LATENCY):
+            raise ValueError('Unsupported replica selection [%s].' % selection)
+
+        options.setdefault('min_calls', 3)
+
+        self._primary = primary
+        self._replicas = [Replica(client, CircuitBreaker(**options)) for client in replicas]
+        self._selection = selection
+        self._smoothing = smoothing
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._fallbacks = 0
+
+    def call(self, method, *args):
+        """
+        Call a read method on a replica,
+        or on the primary if no replica is available or the replica fails.
+
+        :param method: The method name
+        :type method: str
+
+        :rtype: mixed
+        """
+        replica = self._choose()
+
+        if replica is not None:
+            start = timer()
+
+            try:
+                result = getattr(replica.client, method)(*args)
+            except Exception as e:
+                replica.breaker.record(timer() - start, e)
+            else:
+                self._observe(replica, timer() - start)
+
+                return result
+
+        with self._lock:
+            self._fallbacks += 1
+
+        return getattr(self._primary, method)(*args)
+
+    def get_stats(self):
+        """
+        Get the state of each replica, in configuration order,
+        and the number of reads sent to the primary instead.
+
+        :rtype: dict
+        """
+        replicas = []
+
+        for replica in self._replicas:
+            stats = replica.breaker.get_stats()
+            stats['latency'] = replica.latency
+            stats['reads'] = replica.reads
+            replicas.append(stats)
+
+        return {
+            'replicas': replicas,
+            'fallbacks': self._fallbacks
+        }
+
+    def _choose(self):
+        """
+        Choose the replica to read from.
+
+        :rtype: Replica or None
+        """
+        if self._selection == self.LATENCY:
+            # Replicas not measured yet come first so that they get measured.
+            candidates = sorted(
+                self._replicas,
+                key=lambda replica: replica.latency or 0
+            )
+        else:
+            start = next(self._counter) % len(self._replicas)
+            candidates = self._replicas[start:] + self._replicas[:start]
+
+        for replica in candidates:
+            if replica.breaker.allow():
+                return replica
+
+    def _observe(self, replica, elapsed):
+        """
+        Record a successful call to a replica.
+
+        :param replica: The replica
+        :type replica: Replica
+
+        :param elapsed: The number of seconds the call took
+        :type elapsed: float
+        """
+        replica.breaker.record(elapsed)
+
+        with self._lock:
+            replica.reads += 1
+
+            if replica.latency is None:
+                replica.latency = elapsed
+            else:
+                replica.latency += self._smoothing * (elapsed - replica.latency)
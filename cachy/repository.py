@@ -1,26 +1,51 @@
 # -*- coding: utf-8 -*-
 
 import math
+import time
+import random
 import datetime
 import types
 import hashlib
+import threading
+from collections import OrderedDict
 from functools import wraps
+
 from .contracts.repository import Repository as CacheContract
+from .envelope import Envelope
 from .helpers import value
+from .key_builder import KeyBuilder, takes_instance
+from .refresh_ahead import RefreshAhead
+from .instrumentation import Instrumented, instrumented
 from .utils import encode, decode
 
 
-class Repository(CacheContract):
+class Repository(Instrumented, CacheContract):
 
     _default = 60
 
+    _single_flight = None
+
+    # The number of seconds a lock protecting a computation is held,
+    # and the number of seconds other callers wait for it.
+    _lock_seconds = 10
+    _lock_wait = 3
+
+    # The maximum number of threads refreshing stale items in the background.
+    _refresh_workers = 4
+
     def __init__(self, store):
         """
         :param store: The underlying cache store
         :type store: Store
         """
         self._store = store
+        self._refresher = None
+        self._refresh_ahead = None
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+        self._key_builders = {}
 
+    @instrumented('has')
     def has(self, key):
         """
         Determine if an item exists in the cache.
@@ -30,7 +55,7 @@ class Repository(CacheContract):
 
         :rtype: bool
         """
-        return self.get(key) is not None
+        return self._store.has(key)
 
     def get(self, key, default=None):
         """
@@ -44,16 +69,101 @@ class Repository(CacheContract):
 
         :rtype: mixed
         """
-        val = self._store.get(key)
+        val = self._get_payload(key)
 
         if val is None:
             return value(default)
 
-        return val
+        return Envelope.open(val)
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        values = self._get_many_payloads(keys)
+
+        return {key: Envelope.open(val) for key, val in values.items()}
+
+    @instrumented('get_many')
+    def _get_many_payloads(self, keys):
+        """
+        Retrieve the stored payloads of multiple items.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        values = self._store.get_many(keys)
+
+        if self._metrics is not None:
+            misses = sum(1 for val in values.values() if val is None)
+
+            self._metrics.increment('hits', len(values) - misses)
+            self._metrics.increment('misses', misses)
+
+        return values
+
+    def _find(self, key):
+        """
+        Retrieve an item from the cache by key,
+        telling apart missing items from cached None values.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: Whether the item was found and its value
+        :rtype: tuple
+        """
+        val = self._get_payload(key)
+
+        if val is None:
+            return False, None
+
+        return True, Envelope.open(val)
+
+    def _get_payload(self, key):
+        """
+        Retrieve the stored payload of an item.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: mixed
+        """
+        # This is the hottest path of the repository,
+        # so the instrumentation is checked inline.
+        if not self._instrumented:
+            return self._store.get(key)
+
+        return self._instrument('get', key, self._lookup, key)
 
+    def _lookup(self, key):
+        """
+        Retrieve the stored payload of an item, recording the hit or the miss.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: mixed
+        """
+        payload = self._store.get(key)
+
+        self._record('misses' if payload is None else 'hits')
+
+        return payload
+
+    @instrumented('pull')
     def pull(self, key, default=None):
         """
-        Retrieve an item from the cache by key and delete ir.
+        Retrieve an item from the cache by key and delete it.
 
         :param key: The cache key
         :type key: str
@@ -63,12 +173,19 @@ class Repository(CacheContract):
 
         :rtype: mixed
         """
-        val = self.get(key, default)
+        payload = self._store.pull(key)
 
-        self.forget(key)
+        if payload is None:
+            self._record('misses')
+
+            return value(default)
 
-        return val
+        self._record('hits')
+        self._record('deletes')
 
+        return Envelope.open(payload)
+
+    @instrumented('put')
     def put(self, key, val, minutes):
         """
         Store an item in the cache.
@@ -80,13 +197,35 @@ class Repository(CacheContract):
         :type val: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int|datetime
+        :type minutes: int or float or datetime or timedelta
+        """
+        minutes = self._get_minutes(minutes)
+
+        if minutes is not None:
+            self._store.put(key, Envelope.wrap(val), minutes)
+            self._record('sets')
+
+    @instrumented('put_many')
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float or datetime or timedelta
         """
         minutes = self._get_minutes(minutes)
 
         if minutes is not None:
-            self._store.put(key, val, minutes)
+            self._store.put_many(
+                {key: Envelope.wrap(val) for key, val in values.items()},
+                minutes
+            )
+            self._record('sets', len(values))
 
+    @instrumented('add')
     def add(self, key, val, minutes):
         """
         Store an item in the cache if it does not exist.
@@ -98,20 +237,23 @@ class Repository(CacheContract):
         :type val: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int|datetime
+        :type minutes: int or float or datetime or timedelta
 
         :rtype: bool
         """
-        if hasattr(self._store, 'add'):
-            return self._store.add(key, val, self._get_minutes(minutes))
+        minutes = self._get_minutes(minutes)
 
-        if not self.has(key):
-            self.put(key, val, minutes)
+        if minutes is None:
+            return False
 
-            return True
+        added = self._store.add(key, Envelope.wrap(val), minutes)
 
-        return False
+        if added:
+            self._record('sets')
 
+        return added
+
+    @instrumented('forever')
     def forever(self, key, val):
         """
         Store an item in the cache indefinitely.
@@ -122,9 +264,11 @@ class Repository(CacheContract):
         :param val: The cache value
         :type val: mixed
         """
-        self._store.forever(key, val)
+        self._store.forever(key, Envelope.wrap(val))
+        self._record('sets')
 
-    def remember(self, key, minutes, callback):
+    def remember(self, key, minutes, callback, lock=False, beta=None, stale=None,
+                 negative_minutes=None):
         """
         Get an item from the cache, or store the default value.
 
@@ -132,25 +276,246 @@ class Repository(CacheContract):
         :type key: str
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int or datetime
+        :type minutes: int or float or datetime or timedelta
 
         :param callback: The default function
         :type callback: mixed
 
+        :param lock: Whether to hold a lock in the store while computing the value
+        :type lock: bool
+
+        :param beta: Enable probabilistic early recomputation,
+                     higher values favoring earlier recomputations
+        :type beta: float or None
+
+        :param stale: The number of minutes during which an expired value
+                      is still served while being refreshed in the background
+        :type stale: int or float or timedelta or None
+
+        :param negative_minutes: The lifetime in minutes of None values,
+                                 defaulting to the lifetime of other values
+        :type negative_minutes: int or float or datetime or timedelta or None
+
         :rtype: mixed
         """
+        if stale is not None:
+            return self._remember_stale(key, minutes, stale, callback, lock, negative_minutes)
+
+        if beta is not None:
+            return self._remember_early(key, minutes, callback, beta, lock, negative_minutes)
+
         # If the item exists in the cache we will just return this immediately
         # otherwise we will execute the given callback and cache the result
         # of that execution for the given number of minutes in storage.
-        val = self.get(key)
-        if val is not None:
+        found, val = self._find(key)
+        if found:
             return val
 
-        val = value(callback)
+        def compute():
+            val = value(callback)
+
+            if val is None and negative_minutes is not None:
+                self.put(key, val, negative_minutes)
+            else:
+                self.put(key, val, minutes)
+
+            return val
+
+        if lock:
+            return self._compute(key, self._locked(key, compute))
+
+        return self._compute(key, compute)
+
+    def _remember_early(self, key, minutes, callback, beta, lock, negative_minutes=None):
+        """
+        Get an item from the cache, recomputing it before it expires
+        with a probability that increases as the expiration nears (XFetch).
+
+        The value is stored along with its expiration
+        and the time it took to compute it.
+
+        :param key: The cache key
+        :type key: str
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float or datetime or timedelta
+
+        :param callback: The default function
+        :type callback: mixed
+
+        :param beta: The early recomputation factor
+        :type beta: float
+
+        :param lock: Whether to hold a lock in the store while computing the value
+        :type lock: bool
+
+        :param negative_minutes: The lifetime in minutes of None values
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :rtype: mixed
+        """
+        envelope = Envelope.unpack(self._get_payload(key))
+
+        if envelope is not None and not self._should_recompute(envelope, beta):
+            return envelope.value
+
+        compute = self._enveloped(key, minutes, callback, negative_minutes=negative_minutes)
+
+        # The value is still there, so other callers will keep on
+        # serving it while we recompute it in advance.
+        if envelope is not None:
+            return compute()
+
+        if lock:
+            return self._compute(key, self._locked(key, compute))
+
+        return self._compute(key, compute)
+
+    def _remember_stale(self, key, minutes, stale, callback, lock, negative_minutes=None):
+        """
+        Get an item from the cache, serving it while stale
+        and refreshing it in the background.
+
+        :param key: The cache key
+        :type key: str
+
+        :param minutes: The number of minutes during which the value is fresh
+        :type minutes: int or float or datetime or timedelta
+
+        :param stale: The number of minutes during which the value is served stale
+        :type stale: int or float or timedelta
+
+        :param callback: The default function
+        :type callback: mixed
+
+        :param lock: Whether to hold a lock in the store while computing the value
+        :type lock: bool
+
+        :param negative_minutes: The number of minutes during which a None value is fresh
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :rtype: mixed
+        """
+        envelope = Envelope.unpack(self._get_payload(key))
+        compute = self._enveloped(key, minutes, callback, stale, negative_minutes)
+
+        if envelope is not None:
+            if envelope.expiration is not None and time.time() >= envelope.expiration:
+                self._refresh(key, compute, lock)
+
+            return envelope.value
+
+        if lock:
+            return self._compute(key, self._locked(key, compute))
+
+        return self._compute(key, compute)
+
+    def _refresh(self, key, compute, lock):
+        """
+        Schedule the refresh of a stale item in the background,
+        unless it is already being refreshed.
+
+        :param key: The cache key
+        :type key: str
+
+        :param compute: The function computing and storing the value
+        :type compute: callable
+
+        :param lock: Whether to hold a lock in the store while computing the value
+        :type lock: bool
+        """
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+
+            self._refreshing.add(key)
+
+            if self._refresher is None:
+                # Imported here since it is only needed by background refreshes
+                # and slows down the import of the package.
+                try:
+                    from concurrent.futures import ThreadPoolExecutor
+                except ImportError:
+                    raise RuntimeError(
+                        'Background refreshes require the "futures" package on Python 2.'
+                    )
+
+                self._refresher = ThreadPoolExecutor(self._refresh_workers)
+
+        def refresh():
+            try:
+                if lock:
+                    # If another process holds the lock, it is already
+                    # refreshing the value so we have nothing to do.
+                    self.lock('%s:lock' % key, self._lock_seconds).get(compute)
+                else:
+                    compute()
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
+
+    def _enveloped(self, key, minutes, callback, stale=0, negative_minutes=None):
+        """
+        Get a function computing a value and storing it in an envelope
+        along with its expiration and the time it took to compute it.
+
+        :param key: The cache key
+        :type key: str
+
+        :param minutes: The lifetime in minutes of the value
+        :type minutes: int or float or datetime or timedelta
+
+        :param callback: The default function
+        :type callback: mixed
+
+        :param stale: The number of minutes to keep the value in the store after it expired
+        :type stale: int or float or timedelta
+
+        :param negative_minutes: The lifetime in minutes of None values
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :rtype: callable
+        """
+        def compute():
+            start = time.time()
+            val = value(callback)
+            delta = time.time() - start
+
+            if val is None and negative_minutes is not None:
+                duration = self._get_minutes(negative_minutes)
+            else:
+                duration = self._get_minutes(minutes)
+            if duration is not None:
+                envelope = Envelope(val, time.time() + duration * 60, delta)
+
+                self._store.put(key, envelope.pack(), duration + (self._get_minutes(stale) or 0))
+                self._record('sets')
+
+            return val
+
+        return compute
+
+    def _should_recompute(self, envelope, beta):
+        """
+        Determine whether a value should be recomputed before its expiration.
+
+        :param envelope: The stored envelope
+        :type envelope: Envelope
+
+        :param beta: The early recomputation factor
+        :type beta: float
+
+        :rtype: bool
+        """
+        if envelope.expiration is None:
+            return False
 
-        self.put(key, val, minutes)
+        # random() may return 0, whose logarithm is undefined.
+        gap = envelope.delta * beta * math.log(1. - random.random())
 
-        return val
+        return time.time() - gap >= envelope.expiration
 
     def remember_forever(self, key, callback):
         """
@@ -167,16 +532,147 @@ class Repository(CacheContract):
         # If the item exists in the cache we will just return this immediately
         # otherwise we will execute the given callback and cache the result
         # of that execution forever.
-        val = self.get(key)
-        if val is not None:
+        found, val = self._find(key)
+        if found:
+            return val
+
+        def compute():
+            val = value(callback)
+
+            self.forever(key, val)
+
             return val
 
-        val = value(callback)
+        return self._compute(key, compute)
+
+    def remember_many(self, keys, minutes, callback, negative_minutes=None):
+        """
+        Get multiple items from the cache, or store the missing ones.
+
+        The items are retrieved at once and the callback is called
+        only with the keys of the missing items, whose values
+        are then stored at once.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float or datetime or timedelta
+
+        :param callback: The function computing the missing values keyed by cache key
+        :type callback: callable
+
+        :param negative_minutes: The lifetime in minutes of None values,
+                                 defaulting to the lifetime of other values
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :return: The values in the order of the keys
+        :rtype: OrderedDict
+        """
+        keys = list(OrderedDict.fromkeys(keys))
+        payloads = self._get_many_payloads(keys) if keys else {}
+
+        values = OrderedDict()
+        missing = []
+
+        for key in keys:
+            payload = payloads.get(key)
+
+            if payload is None:
+                missing.append(key)
+            else:
+                values[key] = Envelope.open(payload)
+
+        if missing:
+            computed = callback(missing) or {}
+            computed = {key: computed.get(key) for key in missing}
+
+            negatives = {}
+            if negative_minutes is not None:
+                negatives = {key: val for key, val in computed.items() if val is None}
+
+            positives = {key: val for key, val in computed.items() if key not in negatives}
+
+            if positives:
+                self.put_many(positives, minutes)
+
+            if negatives:
+                self.put_many(negatives, negative_minutes)
+
+            values.update(computed)
+
+        return OrderedDict((key, values[key]) for key in keys)
+
+    def _compute(self, key, compute):
+        """
+        Compute the value of a missing item.
+
+        If single-flight is enabled, concurrent callers for the same key
+        will wait for the first one and share its result.
+
+        :param key: The cache key
+        :type key: str
+
+        :param compute: The function computing and storing the value
+        :type compute: callable
+
+        :rtype: mixed
+        """
+        if self._single_flight is None:
+            return compute()
+
+        def leader():
+            # Another caller might have stored the value between
+            # our cache miss and the moment we started computing.
+            found, val = self._find(key)
+            if found:
+                return val
+
+            return compute()
+
+        return self._single_flight.do(key, leader)
+
+    def _locked(self, key, compute):
+        """
+        Wrap the computation of a missing item so that it runs
+        while holding a lock shared by every process using the store.
+
+        :param key: The cache key
+        :type key: str
+
+        :param compute: The function computing and storing the value
+        :type compute: callable
+
+        :rtype: callable
+        """
+        def locked():
+            lock = self.lock('%s:lock' % key, self._lock_seconds)
+
+            if lock.acquire():
+                try:
+                    found, val = self._find(key)
+                    if found:
+                        return val
+
+                    return compute()
+                finally:
+                    lock.release()
+
+            # Someone else is computing the value, so we wait for it
+            # to be stored. If it takes too long, we compute it ourselves.
+            deadline = time.time() + self._lock_wait
+            while time.time() < deadline:
+                time.sleep(0.05)
 
-        self.forever(key, val)
+                found, val = self._find(key)
+                if found:
+                    return val
 
-        return val
+            return compute()
 
+        return locked
+
+    @instrumented('forget')
     def forget(self, key):
         """
         Remove an item from the cache.
@@ -188,6 +684,26 @@ class Repository(CacheContract):
         """
         success = self._store.forget(key)
 
+        if success:
+            self._record('deletes')
+
+        return success
+
+    @instrumented('forget_many')
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        keys = list(keys)
+        success = self._store.forget_many(keys)
+
+        self._record('deletes', len(keys))
+
         return success
 
     def get_default_cache_time(self):
@@ -211,6 +727,118 @@ class Repository(CacheContract):
 
         return self
 
+    def lock(self, name, seconds=0, owner=None, blocking_timeout=None):
+        """
+        Get a lock instance shared through the cache store.
+
+        The lock can be used as a context manager,
+        waiting at most blocking_timeout seconds to acquire it.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :param blocking_timeout: The maximum number of seconds to wait for the lock
+        :type blocking_timeout: int or float or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return self._store.lock(name, seconds, owner, blocking_timeout=blocking_timeout)
+
+    def get_single_flight(self):
+        """
+        Get the single-flight instance used when computing missing items.
+
+        :rtype: cachy.single_flight.SingleFlight or None
+        """
+        return self._single_flight
+
+    def set_single_flight(self, single_flight):
+        """
+        Set the single-flight instance used when computing missing items.
+
+        :param single_flight: The single-flight instance, or None to disable it
+        :type single_flight: cachy.single_flight.SingleFlight or None
+
+        :rtype: self
+        """
+        self._single_flight = single_flight
+
+        return self
+
+    def refresh_ahead(self, key, loader, minutes, lead_seconds=None):
+        """
+        Keep a hot item in the cache by loading it in the background as soon as possible
+        and then reloading it shortly before it expires.
+
+        The first load is not awaited, so reads should use remember()
+        to compute the item if it is not loaded yet.
+
+        :param key: The cache key
+        :type key: str
+
+        :param loader: The function computing the value
+        :type loader: callable
+
+        :param minutes: The lifetime in minutes of the value
+        :type minutes: int or float or timedelta
+
+        :param lead_seconds: The number of seconds before the expiration at which
+                             the value is reloaded, 10% of the lifetime by default
+        :type lead_seconds: int or float or None
+
+        :rtype: self
+        """
+        with self._refreshing_lock:
+            if self._refresh_ahead is None:
+                self._refresh_ahead = RefreshAhead(self, self._refresh_workers)
+
+        self._refresh_ahead.register(key, loader, minutes, lead_seconds)
+
+        return self
+
+    def get_refresh_ahead(self):
+        """
+        Get the scheduler reloading the items registered with refresh_ahead().
+
+        :rtype: cachy.refresh_ahead.RefreshAhead or None
+        """
+        return self._refresh_ahead
+
+    def set_refresh_ahead(self, refresh_ahead):
+        """
+        Set the scheduler reloading the items registered with refresh_ahead(),
+        to configure its workers, jitter and backoff.
+
+        :param refresh_ahead: The scheduler
+        :type refresh_ahead: cachy.refresh_ahead.RefreshAhead
+
+        :rtype: self
+        """
+        self._refresh_ahead = refresh_ahead
+
+        return self
+
+    def tags(self, *names):
+        """
+        Begin executing a new tags operation.
+
+        :param names: The tags
+        :type names: tuple
+
+        :rtype: cachy.tagged_cache.TaggedCache
+        """
+        tagged = self._store.tags(*names)
+        tagged.set_single_flight(self._single_flight)
+        self._share_instrumentation(tagged)
+
+        return tagged
+
     def get_store(self):
         """
         Get the cache store implementation.
@@ -232,17 +860,20 @@ class Repository(CacheContract):
         """
         Calculate the number of minutes with the given duration.
 
-        :param duration: The duration
-        :type duration: int or datetime
+        :param duration: The duration in minutes, the expiration date or the lifetime
+        :type duration: int or float or datetime or timedelta
 
-        :rtype: int or None
+        :rtype: int or float or None
         """
         if isinstance(duration, datetime.datetime):
-            from_now = (duration - datetime.datetime.now()).total_seconds()
-            from_now = math.ceil(from_now / 60)
+            duration = duration - datetime.datetime.now()
+
+        if isinstance(duration, datetime.timedelta):
+            # Durations are rounded up to the second.
+            seconds = math.ceil(duration.total_seconds())
 
-            if from_now > 0:
-                return from_now
+            if seconds > 0:
+                return seconds / 60.
 
             return
 
@@ -259,7 +890,7 @@ class Repository(CacheContract):
         """
         return hashlib.sha1(encode(value)).hexdigest()
 
-    def _get_key(self, fn, args, kwargs):
+    def _get_key(self, fn, args, kwargs, typed=False):
         """
         Calculate a cache key given a function, args and kwargs.
 
@@ -272,29 +903,36 @@ class Repository(CacheContract):
         :param kwargs: The function kwargs
         :type kwargs: dict
 
+        :param typed: Whether arguments of different types should be cached separately
+        :type typed: bool
+
         :rtype: str
         """
-        if args:
-            serialized_arguments = (
-                self._store.serialize(args[1:])
-                + self._store.serialize([(k, kwargs[k]) for k in sorted(kwargs.keys())])
-            )
-        else:
-            serialized_arguments = self._store.serialize([(k, kwargs[k]) for k in sorted(kwargs.keys())])
-
-        if isinstance(fn, types.MethodType):
-            key = self._hash('%s.%s.%s'
-                             % (fn.__self__.__class__.__name__,
-                                args[0].__name__,
-                                serialized_arguments))
-        elif isinstance(fn, types.FunctionType):
-            key = self._hash('%s.%s'
-                             % (fn.__name__,
-                                serialized_arguments))
-        else:
-            key = '%s:' % fn + self._hash(serialized_arguments)
+        # The serializer is called directly since building a key
+        # is not a serialization of a cached value to be recorded.
+        return self._get_key_builder(fn, typed).build(
+            args, kwargs, self._store.get_serializer().serialize
+        )
+
+    def _get_key_builder(self, fn, typed=False):
+        """
+        Get the key builder of a function or key prefix, creating it if necessary.
 
-        return key
+        :param fn: The function
+        :type fn: callable or str
+
+        :param typed: Whether arguments of different types should be cached separately
+        :type typed: bool
+
+        :rtype: KeyBuilder
+        """
+        builder = self._key_builders.get((fn, typed))
+
+        if builder is None:
+            builder = KeyBuilder(fn, typed=typed)
+            self._key_builders[(fn, typed)] = builder
+
+        return builder
 
     def __getattr__(self, item):
         try:
@@ -316,20 +954,135 @@ class Repository(CacheContract):
 
             return wrapper
         else:
-            k = kwargs.get('key')
-            minutes = kwargs.get('minutes', self._default)
+            k = kwargs.pop('key', None)
+            minutes = kwargs.pop('minutes', self._default)
+            typed = kwargs.pop('typed', False)
+
+            if 'seconds' in kwargs:
+                minutes = kwargs.pop('seconds') / 60.
+
+            # The remaining options, like lock, beta or stale,
+            # are passed as is to the remember() method.
+            options = kwargs
 
             def decorated(fn):
                 key = k
 
+                if callable(key):
+                    # The key is computed by the given function
+                    # from the arguments of the call.
+                    @wraps(fn)
+                    def wrapper(*a, **kw):
+                        return self.remember(
+                            key(*a, **kw),
+                            minutes,
+                            lambda: fn(*a, **kw),
+                            **options
+                        )
+
+                    return wrapper
+
+                self._get_key_builder(key or fn, typed)
+
                 @wraps(fn)
                 def wrapper(*a, **kw):
                     return self.remember(
-                        self._get_key(key or fn, a, kw),
+                        self._get_key(key or fn, a, kw, typed),
                         minutes,
-                        lambda: fn(*a, **kw)
+                        lambda: fn(*a, **kw),
+                        **options
                     )
 
                 return wrapper
 
             return decorated
+
+    def many(self, key_fn=None, minutes=None, negative_minutes=None, seconds=None):
+        """
+        Decorate a function loading several items by their IDs,
+        like ``load_users(ids) -> {id: user}``, so that each item is cached separately.
+
+        The IDs are the first argument of the function, after the instance or the class
+        for functions defined in a class body, given by position or by name.
+        The items are retrieved at once and the function is called
+        only with the IDs of the missing ones.
+
+        :param key_fn: The function computing the cache key of an ID,
+                       the key being built from the function, the ID and the other arguments otherwise.
+                       IDs sharing a key share the same item.
+        :type key_fn: callable or None
+
+        :param minutes: The lifetime in minutes of the cached items
+        :type minutes: int or float or datetime or timedelta or None
+
+        :param negative_minutes: The lifetime in minutes of the items the function
+                                 did not return or returned as None
+        :type negative_minutes: int or float or datetime or timedelta or None
+
+        :param seconds: The lifetime in seconds of the cached items, instead of minutes
+        :type seconds: int or float or None
+
+        :rtype: callable
+        """
+        if minutes is None:
+            minutes = self._default
+
+        if seconds is not None:
+            minutes = seconds / 60.
+
+        def decorated(fn):
+            position = 1 if takes_instance(fn) else 0
+            code = getattr(fn, '__code__', None)
+
+            # The name of the IDs argument, so that they can be given by name.
+            name = None
+            if code is not None and code.co_argcount > position:
+                name = code.co_varnames[position]
+
+            if key_fn is None:
+                self._get_key_builder(fn)
+
+            @wraps(fn)
+            def wrapper(*a, **kw):
+                if len(a) > position:
+                    ids = a[position]
+                    before, after = a[:position], a[position + 1:]
+                elif name is not None and name in kw:
+                    kw = dict(kw)
+                    ids = kw.pop(name)
+                    before, after = a, ()
+                else:
+                    raise TypeError('%s() is missing its IDs argument.' % fn.__name__)
+
+                ids = list(OrderedDict.fromkeys(ids))
+
+                # The IDs are always passed by position
+                # so that the keys do not depend on how they were given.
+                if key_fn is None:
+                    keys = [self._get_key(fn, before + (id_,) + after, kw) for id_ in ids]
+                else:
+                    keys = [key_fn(id_) for id_ in ids]
+
+                ids_by_key = OrderedDict()
+                for id_, key in zip(ids, keys):
+                    ids_by_key.setdefault(key, []).append(id_)
+
+                def load(missing):
+                    missing_ids = [id_ for key in missing for id_ in ids_by_key[key]]
+                    loaded = fn(*(before + (missing_ids,) + after), **kw) or {}
+
+                    return {
+                        key: next(
+                            (loaded[id_] for id_ in ids_by_key[key] if loaded.get(id_) is not None),
+                            None
+                        )
+                        for key in missing
+                    }
+
+                values = self.remember_many(list(ids_by_key), minutes, load, negative_minutes)
+
+                return OrderedDict((id_, values[key]) for id_, key in zip(ids, keys))
+
+            return wrapper
+
+        return decorated
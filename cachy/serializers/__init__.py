@@ -1,6 +1,23 @@
 # -*- coding: utf-8 -*-
 
-from .serializer import Serializer
-from .json_serializer import JsonSerializer
-from .msgpack_serializer import MsgPackSerializer
-from .pickle_serializer import PickleSerializer
+from ..utils import lazy_attributes
+
+# The serializers are imported on first use
+# so that their libraries are only imported if needed.
+__all__ = [
+    'Serializer',
+    'CompressedSerializer',
+    'JsonSerializer',
+    'MsgPackSerializer',
+    'MultiFormatSerializer',
+    'PickleSerializer'
+]
+
+lazy_attributes(__name__, {
+    'Serializer': 'serializer',
+    'CompressedSerializer': 'compressed_serializer',
+    'JsonSerializer': 'json_serializer',
+    'MsgPackSerializer': 'msgpack_serializer',
+    'MultiFormatSerializer': 'multi_format_serializer',
+    'PickleSerializer': 'pickle_serializer'
+}, globals())
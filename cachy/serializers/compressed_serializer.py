@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+import zlib
+
+try:
+    import lzma
+except ImportError:
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
+
+try:
+    import lz4.frame as lz4
+except ImportError:
+    lz4 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from ..utils import encode
+from .pickle_serializer import PickleSerializer
+from .serializer import Serializer
+
+
+class CompressedSerializer(Serializer):
+    """
+    Serializer compressing the representations of another serializer
+    once they reach a given size.
+
+    Compressed payloads start with a two-byte header: the 0xc1 marker,
+    which pickle, JSON and msgpack representations never start with,
+    followed by a byte identifying the codec. Payloads written without
+    compression are thus read as is. Payloads of other serializers
+    starting with a header are escaped with the ``none`` header.
+    """
+
+    MARKER = b'\xc1'
+
+    NONE = MARKER + b'\xf0'
+    ZLIB = MARKER + b'\xf1'
+    LZMA = MARKER + b'\xf2'
+    LZ4 = MARKER + b'\xf3'
+    ZSTD = MARKER + b'\xf4'
+
+    _headers = {
+        'zlib': ZLIB,
+        'lzma': LZMA,
+        'lz4': LZ4,
+        'zstd': ZSTD
+    }
+
+    _codecs = {
+        ZLIB: 'zlib',
+        LZMA: 'lzma',
+        LZ4: 'lz4',
+        ZSTD: 'zstd'
+    }
+
+    def __init__(self, serializer=None, threshold=1024, codec='zlib', level=None):
+        """
+        :param serializer: The serializer whose representations are compressed,
+                           pickle by default
+        :type serializer: Serializer or None
+
+        :param threshold: The size in bytes from which representations are compressed
+        :type threshold: int
+
+        :param codec: The compression codec, "zlib", "lzma", "lz4" or "zstd"
+        :type codec: str
+
+        :param level: The compression level, the codec default if None
+        :type level: int or None
+        """
+        if codec not in self._headers:
+            raise ValueError('Unsupported compression codec [%s].' % codec)
+
+        self._serializer = serializer or PickleSerializer()
+        self._threshold = threshold
+        self._codec = codec
+        self._header = self._headers[codec]
+        self._level = level
+
+        # Failing early rather than on the first write.
+        self._check(codec)
+
+    def serialize(self, data):
+        """
+        Serialize data.
+
+        :param data: The data to serialize
+        :type data: mixed
+
+        :rtype: bytes
+        """
+        payload = encode(self._serializer.serialize(data))
+
+        if len(payload) >= self._threshold:
+            compressed = self._compress(payload)
+
+            # Incompressible payloads are kept as is.
+            if len(compressed) < len(payload):
+                return self._header + compressed
+
+        if payload[:2] == self.NONE or payload[:2] in self._codecs:
+            return self.NONE + payload
+
+        return payload
+
+    def unserialize(self, data):
+        """
+        Unserialize data.
+
+        :param data: The data to unserialize
+        :type data: mixed
+
+        :rtype: mixed
+        """
+        if isinstance(data, bytes) and data[:1] == self.MARKER:
+            header = data[:2]
+
+            if header == self.NONE:
+                data = data[2:]
+            elif header in self._codecs:
+                data = self._decompress(self._codecs[header], data[2:])
+
+        return self._serializer.unserialize(data)
+
+    def get_serializer(self):
+        """
+        Get the serializer whose representations are compressed.
+
+        :rtype: Serializer
+        """
+        return self._serializer
+
+    def _compress(self, payload):
+        """
+        Compress a payload with the configured codec.
+
+        :param payload: The payload
+        :type payload: bytes
+
+        :rtype: bytes
+        """
+        if self._codec == 'zlib':
+            return zlib.compress(payload, 6 if self._level is None else self._level)
+
+        if self._codec == 'lzma':
+            return lzma.compress(payload, preset=self._level)
+
+        if self._codec == 'lz4':
+            return lz4.compress(payload, compression_level=self._level or 0)
+
+        return zstandard.ZstdCompressor(
+            level=3 if self._level is None else self._level
+        ).compress(payload)
+
+    def _decompress(self, codec, payload):
+        """
+        Decompress a payload, whichever codec compressed it.
+
+        :param codec: The codec name
+        :type codec: str
+
+        :param payload: The compressed payload
+        :type payload: bytes
+
+        :rtype: bytes
+        """
+        self._check(codec)
+
+        if codec == 'zlib':
+            return zlib.decompress(payload)
+
+        if codec == 'lzma':
+            return lzma.decompress(payload)
+
+        if codec == 'lz4':
+            return lz4.decompress(payload)
+
+        return zstandard.ZstdDecompressor().decompress(payload)
+
+    @staticmethod
+    def _check(codec):
+        """
+        Ensure that the library of a codec is installed.
+
+        :param codec: The codec name
+        :type codec: str
+        """
+        libraries = {
+            'lzma': (lzma, 'backports.lzma'),
+            'lz4': (lz4, 'lz4'),
+            'zstd': (zstandard, 'zstandard')
+        }
+
+        if codec in libraries and libraries[codec][0] is None:
+            raise RuntimeError(
+                'The "%s" codec requires the "%s" package.' % (codec, libraries[codec][1])
+            )
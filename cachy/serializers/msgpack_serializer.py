@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+import threading
+import uuid
+from decimal import Decimal
+
 try:
     import msgpack
 except ImportError:
@@ -7,14 +12,69 @@ except ImportError:
 
 from .serializer import Serializer
 
+try:
+    _utc_offset = datetime.timezone
+except AttributeError:
+    class _utc_offset(datetime.tzinfo):
+        """
+        A fixed offset from UTC, for Python versions without datetime.timezone.
+        """
+
+        def __init__(self, offset):
+            self._offset = offset
+
+        def utcoffset(self, dt):
+            return self._offset
+
+        def dst(self, dt):
+            return datetime.timedelta(0)
+
+        def tzname(self, dt):
+            return None
+
 
 class MsgPackSerializer(Serializer):
     """
-    Serializer that uses `msgpack <https://pypi.python.org/pypi/msgpack-python/>`_ representations.
+    Serializer that uses `msgpack <https://pypi.python.org/pypi/msgpack/>`_ representations.
 
-    By default, this serializer does not support serializing custom objects.
+    Besides the msgpack types, it supports datetimes, dates, decimals, UUIDs,
+    sets and tuples through extension types. Custom objects are not supported.
+    Time zones of aware datetimes are kept as fixed UTC offsets.
     """
 
+    DATETIME = 1
+    DATE = 2
+    DECIMAL = 3
+    UUID = 4
+    SET = 5
+    TUPLE = 6
+    FROZENSET = 7
+
+    def __init__(self):
+        # Packers are reused across calls but cannot be shared between threads.
+        # Unpacking is not: a reused streaming unpacker is no faster than unpackb().
+        self._local = threading.local()
+
+        self._packer_options = {
+            'default': self._default,
+            'use_bin_type': True,
+            # Tuples and sets are only passed to the default hook
+            # if types are checked strictly.
+            'strict_types': True
+        }
+
+        self._unpacker_options = {'ext_hook': self._ext_hook}
+
+        if msgpack is not None:
+            if msgpack.version < (0, 5, 2):
+                self._unpacker_options['encoding'] = 'utf-8'
+            else:
+                self._unpacker_options['raw'] = False
+
+            if msgpack.version >= (1, 0, 0):
+                # Cached dictionaries may have non-string keys.
+                self._unpacker_options['strict_map_key'] = False
+
     def serialize(self, data):
         """
         Serialize data.
@@ -22,9 +82,20 @@ class MsgPackSerializer(Serializer):
         :param data: The data to serialize
         :type data: mixed
 
-        :rtype: str
+        :rtype: bytes
         """
-        return msgpack.packb(data, use_bin_type=True)
+        packer = getattr(self._local, 'packer', None)
+
+        if packer is None:
+            packer = self._local.packer = msgpack.Packer(**self._packer_options)
+
+        try:
+            return packer.pack(data)
+        except Exception:
+            # Resetting the buffer a failed call may have left data in.
+            self._local.packer = None
+
+            raise
 
     def unserialize(self, data):
         """
@@ -33,6 +104,105 @@ class MsgPackSerializer(Serializer):
         :param data: The data to unserialize
         :type data: mixed
 
-        :rtype: str
+        :rtype: mixed
         """
-        return msgpack.unpackb(data, encoding='utf-8')
+        return msgpack.unpackb(data, **self._unpacker_options)
+
+    def _pack(self, data):
+        """
+        Pack the contents of an extension type.
+
+        The reused packer of the thread is in use at that time
+        so a new one is needed.
+
+        :rtype: bytes
+        """
+        return msgpack.packb(data, **self._packer_options)
+
+    def _default(self, obj):
+        """
+        Convert the objects msgpack does not support.
+
+        :param obj: The object to convert
+        :type obj: mixed
+
+        :rtype: msgpack.ExtType or mixed
+        """
+        if isinstance(obj, datetime.datetime):
+            offset = obj.utcoffset()
+
+            if offset is not None:
+                offset = offset.days * 86400 + offset.seconds
+
+            return msgpack.ExtType(self.DATETIME, self._pack([
+                obj.year, obj.month, obj.day, obj.hour, obj.minute,
+                obj.second, obj.microsecond, offset
+            ]))
+
+        if isinstance(obj, datetime.date):
+            return msgpack.ExtType(self.DATE, self._pack([obj.year, obj.month, obj.day]))
+
+        if isinstance(obj, Decimal):
+            return msgpack.ExtType(self.DECIMAL, str(obj).encode('ascii'))
+
+        if isinstance(obj, uuid.UUID):
+            return msgpack.ExtType(self.UUID, obj.bytes)
+
+        if isinstance(obj, tuple):
+            return msgpack.ExtType(self.TUPLE, self._pack(list(obj)))
+
+        if isinstance(obj, frozenset):
+            return msgpack.ExtType(self.FROZENSET, self._pack(list(obj)))
+
+        if isinstance(obj, set):
+            return msgpack.ExtType(self.SET, self._pack(list(obj)))
+
+        # Subclasses of the supported types are not accepted
+        # when types are checked strictly.
+        for base in (int, float, bytes, type(u''), dict, list):
+            if isinstance(obj, base):
+                return base(obj)
+
+        raise TypeError('Cannot serialize %r.' % (obj,))
+
+    def _ext_hook(self, code, data):
+        """
+        Convert extension types back.
+
+        :param code: The extension type code
+        :type code: int
+
+        :param data: The extension type contents
+        :type data: bytes
+
+        :rtype: mixed
+        """
+        if code == self.DATETIME:
+            values = self.unserialize(data)
+            offset = values.pop()
+            tzinfo = None
+
+            if offset is not None:
+                tzinfo = _utc_offset(datetime.timedelta(seconds=offset))
+
+            return datetime.datetime(*values, tzinfo=tzinfo)
+
+        if code == self.DATE:
+            return datetime.date(*self.unserialize(data))
+
+        if code == self.DECIMAL:
+            return Decimal(data.decode('ascii'))
+
+        if code == self.UUID:
+            return uuid.UUID(bytes=data)
+
+        if code == self.TUPLE:
+            return tuple(self.unserialize(data))
+
+        if code == self.FROZENSET:
+            return frozenset(self.unserialize(data))
+
+        if code == self.SET:
+            return set(self.unserialize(data))
+
+        return msgpack.ExtType(code, data)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from ..utils import encode
+from .serializer import Serializer
+
+
+class MultiFormatSerializer(Serializer):
+    """
+    Serializer recording in each representation the format that wrote it,
+    so that items are read back whichever serializer wrote them
+    and a store can change its serializer without being flushed.
+
+    Representations start with a marker byte, which pickle, JSON
+    and msgpack representations never start with, followed by the format identifier.
+    Representations without the marker, written before formats were recorded,
+    are read by the legacy serializer.
+    """
+
+    MARKER = b'\xc1'
+
+    def __init__(self, serializer, format_id, resolver, legacy=None):
+        """
+        :param serializer: The serializer writing the representations
+        :type serializer: Serializer
+
+        :param format_id: The identifier of its format, between 1 and 127,
+                          higher values following the marker being reserved for compression
+        :type format_id: int
+
+        :param resolver: The function returning the serializer of a format identifier,
+                         called the first time an item of that format is read
+        :type resolver: callable
+
+        :param legacy: The serializer reading representations without a format,
+                       the writing serializer by default
+        :type legacy: Serializer or None
+        """
+        if not 0 < format_id < 128:
+            raise ValueError('Format identifiers must be between 1 and 127.')
+
+        self._serializer = serializer
+        self._format_id = format_id
+        self._header = self.MARKER + bytes(bytearray([format_id]))
+        self._resolver = resolver
+        self._legacy = legacy or serializer
+        self._serializers = {format_id: serializer}
+        self._lock = threading.Lock()
+
+    def serialize(self, data):
+        """
+        Serialize data.
+
+        :param data: The data to serialize
+        :type data: mixed
+
+        :rtype: bytes
+        """
+        return self._header + encode(self._serializer.serialize(data))
+
+    def unserialize(self, data):
+        """
+        Unserialize data with the serializer of its format.
+
+        :param data: The data to unserialize
+        :type data: mixed
+
+        :rtype: mixed
+        """
+        if not isinstance(data, bytes) or data[:1] != self.MARKER:
+            return self._legacy.unserialize(data)
+
+        format_id = bytearray(data[1:2])[0]
+        serializer = self._serializers.get(format_id)
+
+        if serializer is None:
+            serializer = self._resolve(format_id)
+
+        return serializer.unserialize(data[2:])
+
+    def get_serializer(self):
+        """
+        Get the serializer writing the representations.
+
+        :rtype: Serializer
+        """
+        return self._serializer
+
+    def get_format_id(self):
+        """
+        Get the identifier of the format of the representations written.
+
+        :rtype: int
+        """
+        return self._format_id
+
+    def _resolve(self, format_id):
+        """
+        Resolve the serializer of a format read for the first time.
+
+        :param format_id: The format identifier
+        :type format_id: int
+
+        :rtype: Serializer
+        """
+        with self._lock:
+            serializer = self._serializers.get(format_id)
+
+            if serializer is None:
+                serializer = self._resolver(format_id)
+                self._serializers[format_id] = serializer
+
+        return serializer
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from .helpers import value
+
+
+class Call(object):
+    """
+    Represent an in-flight computation shared by concurrent callers.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Make sure that only one thread computes the value of a given key at a time.
+
+    Concurrent callers for the same key wait for the computing thread
+    and share its result. The in-flight calls are spread over a fixed number
+    of lock stripes so that memory stays bounded whatever the size of the key space.
+    """
+
+    def __init__(self, timeout=None, stripes=64):
+        """
+        :param timeout: The maximum number of seconds to wait for another caller
+        :type timeout: int or float or None
+
+        :param stripes: The number of lock stripes
+        :type stripes: int
+        """
+        if stripes < 1:
+            raise ValueError('The number of stripes must be at least 1.')
+
+        self._timeout = timeout
+        self._stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._calls = [{} for _ in range(stripes)]
+
+    def do(self, key, fn, fallback=None):
+        """
+        Execute the given function for the key,
+        or wait for the result of the caller already executing it.
+
+        If the wait exceeds the timeout, the fallback is used instead.
+        It defaults to executing the function.
+
+        :param key: The key identifying the computation
+        :type key: str
+
+        :param fn: The function to execute
+        :type fn: callable
+
+        :param fallback: The value to use if the wait times out
+        :type fallback: mixed
+
+        :rtype: mixed
+        """
+        index = hash(key) % self._stripes
+        lock = self._locks[index]
+        calls = self._calls[index]
+
+        with lock:
+            call = calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = Call()
+                calls[key] = call
+
+        if not leader:
+            return self._wait(call, fn, fallback)
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+
+            raise
+        finally:
+            with lock:
+                del calls[key]
+
+            call.event.set()
+
+        return call.result
+
+    def _wait(self, call, fn, fallback):
+        """
+        Wait for the result of an in-flight call.
+
+        :type call: Call
+        :type fn: callable
+        :type fallback: mixed
+
+        :rtype: mixed
+        """
+        if not call.event.wait(self._timeout):
+            if fallback is None:
+                return fn()
+
+            return value(fallback)
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result
+
+    def in_flight(self):
+        """
+        Get the number of computations currently in flight.
+
+        :rtype: int
+        """
+        return sum(len(calls) for calls in self._calls)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import deque
+
+
+class SlowLog(object):
+    """
+    Keep the most recent operations slower than a threshold.
+    """
+
+    def __init__(self, threshold=0.1, size=128):
+        """
+        :param threshold: The number of seconds above which an operation is slow
+        :type threshold: float
+
+        :param size: The maximum number of entries
+        :type size: int
+        """
+        self.threshold = threshold
+        self._entries = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, operation, store=None):
+        """
+        Record an operation if it is slow.
+
+        :param operation: The operation
+        :type operation: cachy.instrumentation.Operation
+
+        :param store: The name of the store the operation was executed on
+        :type store: str or None
+        """
+        if operation.elapsed < self.threshold:
+            return
+
+        entry = {
+            'store': store,
+            'operation': operation.name,
+            'key': operation.key,
+            'size': operation.size,
+            'elapsed': operation.elapsed,
+            'time': operation.time,
+            'error': operation.error
+        }
+
+        with self._lock:
+            self._entries.append(entry)
+
+    def hook(self, store=None):
+        """
+        Get an after hook recording the slow operations of a store.
+
+        :param store: The store name
+        :type store: str or None
+
+        :rtype: callable
+        """
+        def hook(operation):
+            self.record(operation, store)
+
+        return hook
+
+    def entries(self, store=None):
+        """
+        Get the recorded entries, the most recent first.
+
+        :param store: Only get the entries of this store
+        :type store: str or None
+
+        :rtype: list
+        """
+        with self._lock:
+            entries = list(self._entries)
+
+        entries.reverse()
+
+        if store is not None:
+            entries = [entry for entry in entries if entry['store'] == store]
+
+        return entries
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
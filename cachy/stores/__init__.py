@@ -1,7 +1,29 @@
 # -*- coding: utf-8 -*-
 
-from .dict_store import DictStore
-from .file_store import FileStore
-from .memcached_store import MemcachedStore
-from .redis_store import RedisStore
-from .null_store import NullStore
+from ..utils import lazy_attributes
+
+# The stores are imported on first use
+# so that their client libraries are only imported if needed.
+__all__ = [
+    'DictStore',
+    'FailoverStore',
+    'FileStore',
+    'MemcachedStore',
+    'RedisStore',
+    'NullStore',
+    'ShardedStore',
+    'TieredStore',
+    'WriteBehindStore'
+]
+
+lazy_attributes(__name__, {
+    'DictStore': 'dict_store',
+    'FailoverStore': 'failover_store',
+    'FileStore': 'file_store',
+    'MemcachedStore': 'memcached_store',
+    'RedisStore': 'redis_store',
+    'NullStore': 'null_store',
+    'ShardedStore': 'sharded_store',
+    'TieredStore': 'tiered_store',
+    'WriteBehindStore': 'write_behind_store'
+}, globals())
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+try:
+    from redis.asyncio import StrictRedis
+    from redis.exceptions import ResponseError
+except ImportError:
+    StrictRedis = None
+
+    class ResponseError(Exception):
+        pass
+
+from ..contracts.async_store import AsyncStore
+from .redis_store import RedisStore
+from ..utils import milliseconds
+
+
+class AsyncRedisStore(AsyncStore):
+    """
+    A cache store using Redis as its backend through an asyncio client.
+    """
+
+    PULL_SCRIPT = RedisStore.PULL_SCRIPT
+
+    _getdel = True
+
+    def __init__(self, host='localhost', port=6379, db=0, password=None,
+                 prefix='', redis_class=StrictRedis, **kwargs):
+        if redis_class is None:
+            raise RuntimeError(
+                'The asynchronous redis store requires the "redis" package 4.2 or later.'
+            )
+
+        # Removing potential "driver" key
+        kwargs.pop('driver', None)
+
+        self._prefix = prefix
+        self._redis = redis_class(host=host, port=port, db=db,
+                                  password=password, **kwargs)
+
+    async def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        value = await self._redis.get(self._prefix + key)
+
+        if value is not None:
+            return self.unserialize(value)
+
+    async def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return bool(await self._redis.exists(self._prefix + key))
+
+    async def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        value = self.serialize(value)
+
+        return bool(await self._redis.set(
+            self._prefix + key, value, px=milliseconds(minutes), nx=True
+        ))
+
+    async def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        key = self._prefix + key
+
+        if self._getdel:
+            try:
+                value = await self._redis.getdel(key)
+            except (AttributeError, ResponseError) as e:
+                if not self._is_unknown_command(e):
+                    raise
+
+                self._getdel = False
+
+        if not self._getdel:
+            value = await self._redis.eval(self.PULL_SCRIPT, 1, key)
+
+        if value is not None:
+            return self.unserialize(value)
+
+    _is_unknown_command = staticmethod(RedisStore._is_unknown_command)
+
+    async def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        keys = list(keys)
+
+        if not keys:
+            return {}
+
+        values = await self._redis.mget([self._prefix + key for key in keys])
+
+        return {
+            key: self.unserialize(value) if value is not None else None
+            for key, value in zip(keys, values)
+        }
+
+    async def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        value = self.serialize(value)
+
+        await self._redis.psetex(self._prefix + key, milliseconds(minutes), value)
+
+    async def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        if not values:
+            return
+
+        ttl = milliseconds(minutes)
+
+        pipe = self._redis.pipeline(transaction=False)
+
+        for key, value in values.items():
+            pipe.psetex(self._prefix + key, ttl, self.serialize(value))
+
+        await pipe.execute()
+
+    async def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        keys = list(keys)
+
+        if not keys:
+            return True
+
+        deleted = await self._redis.delete(*[self._prefix + key for key in keys])
+
+        return deleted == len(keys)
+
+    async def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return await self._redis.incrby(self._prefix + key, value)
+
+    async def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return await self._redis.decr(self._prefix + key, value)
+
+    async def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value to store
+        :type value: mixed
+        """
+        value = self.serialize(value)
+
+        await self._redis.set(self._prefix + key, value)
+
+    async def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return bool(await self._redis.delete(self._prefix + key))
+
+    async def flush(self):
+        """
+        Remove all items from the cache.
+        """
+        return await self._redis.flushdb()
+
+    def get_prefix(self):
+        """
+        Get the cache key prefix.
+
+        :rtype: str
+        """
+        return self._prefix
+
+    def connection(self):
+        return self._redis
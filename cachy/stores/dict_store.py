@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import time
-import math
+import threading
+from collections import OrderedDict
 from ..contracts.taggable_store import TaggableStore
+from ..locks import DictLock
 
 
 class DictStore(TaggableStore):
@@ -10,8 +12,22 @@ class DictStore(TaggableStore):
     A cache store using a dictionary as its backend.
     """
 
-    def __init__(self):
-        self._storage = {}
+    def __init__(self, size=None):
+        """
+        :param size: The maximum number of items, the least recently used ones
+                     being evicted first
+        :type size: int or None
+        """
+        self._size = size
+
+        if size:
+            self._storage = OrderedDict()
+        else:
+            self._storage = {}
+
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._write_lock = threading.Lock()
 
     def get(self, key):
         """
@@ -24,6 +40,27 @@ class DictStore(TaggableStore):
         """
         return self._get_payload(key)[0]
 
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        payload = self._storage.get(key)
+
+        if not payload:
+            return False
+
+        if time.time() >= payload[0]:
+            self.forget(key)
+
+            return False
+
+        return True
+
     def _get_payload(self, key):
         """
         Retrieve an item and expiry time from the cache by key.
@@ -43,17 +80,20 @@ class DictStore(TaggableStore):
 
         # If the current time is greater than expiration timestamps we will delete
         # the entry
-        if round(time.time()) >= expire:
+        if time.time() >= expire:
             self.forget(key)
 
             return (None, None)
 
         data = payload[1]
 
+        if self._size:
+            self._touch(key)
+
         # Next, we'll extract the number of minutes that are remaining for a cache
         # so that we can properly retain the time for things like the increment
-        # operation that may be performed on the cache. We'll round this out.
-        time_ = math.ceil((expire - round(time.time())) / 60.)
+        # operation that may be performed on the cache.
+        time_ = (expire - time.time()) / 60.
 
         return (data, time_)
 
@@ -68,10 +108,61 @@ class DictStore(TaggableStore):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
         """
+        if self._size:
+            # Overwritten items are moved to the most recently used end.
+            self._storage.pop(key, None)
+
+            while len(self._storage) >= self._size:
+                try:
+                    self._storage.popitem(last=False)
+                except KeyError:
+                    break
+
         self._storage[key] = (self._expiration(minutes), value)
 
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        with self._write_lock:
+            if self.has(key):
+                return False
+
+            self.put(key, value, minutes)
+
+            return True
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        # Popping the item is atomic so that
+        # concurrent calls never retrieve the same item.
+        payload = self._storage.pop(key, None)
+
+        if not payload or time.time() >= payload[0]:
+            return
+
+        return payload[1]
+
     def increment(self, key, value=1):
         """
         Increment the value of an item in the cache.
@@ -88,7 +179,7 @@ class DictStore(TaggableStore):
 
         integer = int(data) + value
 
-        self.put(key, integer, int(time_))
+        self.put(key, integer, time_)
 
         return integer
 
@@ -138,21 +229,57 @@ class DictStore(TaggableStore):
         """
         Remove all items from the cache.
         """
-        self._storage = {}
+        self._storage.clear()
+
+    def _touch(self, key):
+        """
+        Mark an item of a bounded store as the most recently used.
+
+        :param key: The cache key
+        :type key: str
+        """
+        try:
+            self._storage.move_to_end(key)
+        except AttributeError:
+            # Python 2 ordered dictionaries cannot move items.
+            payload = self._storage.pop(key, None)
+
+            if payload is not None:
+                self._storage[key] = payload
+        except KeyError:
+            # The item has been removed concurrently.
+            pass
 
     def _expiration(self, minutes):
         """
         Get the expiration time based on the given minutes.
 
         :param minutes: The minutes
-        :type minutes: int
+        :type minutes: int or float
 
-        :rtype: int
+        :rtype: float
         """
         if minutes == 0:
             return 9999999999
 
-        return round(time.time()) + (minutes * 60)
+        return time.time() + minutes * 60
+
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return DictLock(self._locks, self._locks_guard, name, seconds, owner, **kwargs)
 
     def get_prefix(self):
         """
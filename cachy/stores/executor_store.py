@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from functools import partial
+
+from ..contracts.async_store import AsyncStore
+
+
+class ExecutorStore(AsyncStore):
+    """
+    An asynchronous adapter running the operations of a synchronous store
+    in an executor so that they do not block the event loop.
+    """
+
+    def __init__(self, store, executor=None):
+        """
+        :param store: The synchronous store
+        :type store: cachy.contracts.store.Store
+
+        :param executor: The executor to use, the loop default executor if None
+        :type executor: concurrent.futures.Executor or None
+        """
+        self._store = store
+        self._executor = executor
+
+    def _run(self, fn, *args):
+        """
+        Run a store operation in the executor.
+
+        :rtype: asyncio.Future
+        """
+        loop = asyncio.get_running_loop()
+
+        return loop.run_in_executor(self._executor, partial(fn, *args))
+
+    async def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        return await self._run(self._store.get, key)
+
+    async def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return await self._run(self._store.has, key)
+
+    async def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        return await self._run(self._store.add, key, value, minutes)
+
+    async def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        return await self._run(self._store.pull, key)
+
+    async def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        return await self._run(self._store.get_many, list(keys))
+
+    async def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        return await self._run(self._store.put, key, value, minutes)
+
+    async def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        return await self._run(self._store.put_many, values, minutes)
+
+    async def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        return await self._run(self._store.forget_many, list(keys))
+
+    async def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return await self._run(self._store.increment, key, value)
+
+    async def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return await self._run(self._store.decrement, key, value)
+
+    async def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value
+        :type value: mixed
+        """
+        return await self._run(self._store.forever, key, value)
+
+    async def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return await self._run(self._store.forget, key)
+
+    async def flush(self):
+        """
+        Remove all items from the cache.
+        """
+        return await self._run(self._store.flush)
+
+    def get_prefix(self):
+        """
+        Get the cache key prefix.
+
+        :rtype: str
+        """
+        return self._store.get_prefix()
+
+    def get_store(self):
+        """
+        Get the wrapped synchronous store.
+
+        :rtype: cachy.contracts.store.Store
+        """
+        return self._store
+
+    def set_serializer(self, serializer):
+        """
+        Set the serializer.
+
+        :param serializer: The serializer
+        :type serializer: cachy.serializers.Serializer
+
+        :rtype: Store
+        """
+        self._store.set_serializer(serializer)
+
+        return self
+
+    def get_serializer(self):
+        """
+        Get the serializer.
+
+        :rtype: cachy.serializers.Serializer
+        """
+        return self._store.get_serializer()
+
+    def unserialize(self, data):
+        return self._store.unserialize(data)
+
+    def serialize(self, data):
+        return self._store.serialize(data)
@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from ..circuit_breaker import CircuitBreaker, connection_errors
+from ..contracts.taggable_store import TaggableStore
+from ..metrics.metrics import timer
+
+
+class FailoverStore(TaggableStore):
+    """
+    A cache store trying an ordered list of stores until one of them answers.
+
+    Each store is guarded by a circuit breaker: once too many of its calls
+    fail or are too slow, it is skipped without being called until it recovers.
+    Only connection errors and timeouts are failures, other errors being raised.
+    When no store can answer, operations behave as if the cache were empty,
+    so that values are computed again rather than waiting for a failing store.
+
+    The keys written or removed while a store could not be called are recorded,
+    and removed from the store before it is called again,
+    so that a recovered store does not serve values changed in the meantime.
+    """
+
+    def __init__(self, stores, names=None, errors=None, max_missed=10000, **options):
+        """
+        :param stores: The stores, in order of preference
+        :type stores: list
+
+        :param names: The names of the stores used in the statistics,
+                      their positions by default
+        :type names: list or None
+
+        :param errors: The errors counted as failures of a store,
+                       the connection errors and timeouts of the clients by default
+        :type errors: tuple or None
+
+        :param max_missed: The maximum number of keys recorded for a store it could not
+                           be called for, the store being flushed on recovery beyond it
+        :type max_missed: int
+
+        :param options: The options of the circuit breakers
+        :type options: dict
+        """
+        if not stores:
+            raise ValueError('The failover store needs at least one store.')
+
+        if names is None:
+            names = [str(i) for i in range(len(stores))]
+
+        if len(names) != len(stores):
+            raise ValueError('The failover store needs a name for each store.')
+
+        self._stores = list(stores)
+        self._names = list(names)
+        self._breakers = [CircuitBreaker(**options) for _ in self._stores]
+        self._errors = errors or connection_errors()
+        self._max_missed = max_missed
+
+        # The keys each store missed the changes of, None meaning all of them.
+        self._missed = [set() for _ in self._stores]
+        self._missed_lock = threading.Lock()
+
+        self.reset_stats()
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        return self._call('get', None, key)
+
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return self._call('has', False, key)
+
+    def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        self._call('put', None, key, value, minutes, written=[key])
+
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        return self._call('add', False, key, value, minutes, written=[key])
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        return self._call('pull', None, key, written=[key])
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        keys = list(keys)
+
+        return self._call('get_many', None, keys) or {key: None for key in keys}
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        self._call('put_many', None, values, minutes, written=list(values))
+
+    def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return self._call('increment', False, key, value, written=[key])
+
+    def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return self._call('decrement', False, key, value, written=[key])
+
+    def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value
+        :type value: mixed
+        """
+        self._call('forever', None, key, value, written=[key])
+
+    def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        The item is removed from every available store
+        so that a store taking over does not serve it afterwards,
+        and from the other ones once they recover.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return self._call_all('forget', [key], key)
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        keys = list(keys)
+
+        return self._call_all('forget_many', keys, keys)
+
+    def flush(self):
+        """
+        Remove all items from every available store,
+        and from the other ones once they recover.
+        """
+        self._call_all('flush', None)
+
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        Locks are acquired on the first available store.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        for store, breaker in zip(self._stores, self._breakers):
+            if breaker.state == CircuitBreaker.CLOSED:
+                return store.lock(name, seconds, owner, **kwargs)
+
+        return self._stores[-1].lock(name, seconds, owner, **kwargs)
+
+    def get_prefix(self):
+        """
+        Get the cache key prefix.
+
+        :rtype: str
+        """
+        return self._stores[0].get_prefix()
+
+    def get_stores(self):
+        """
+        Get the stores, in order of preference.
+
+        :rtype: list
+        """
+        return list(self._stores)
+
+    def get_store(self):
+        """
+        Get the preferred store.
+
+        :rtype: cachy.contracts.store.Store
+        """
+        return self._stores[0]
+
+    def get_stats(self):
+        """
+        Get the state of the circuit breaker of each store, keyed by store name,
+        with the number of operations each store served,
+        and the number of operations no store could serve.
+
+        :rtype: dict
+        """
+        stores = {}
+
+        for name, breaker, served in zip(self._names, self._breakers, self._served):
+            stats = breaker.get_stats()
+            stats['served'] = served
+            stores[name] = stats
+
+        return {
+            'stores': stores,
+            'unavailable': self._unavailable
+        }
+
+    def reset_stats(self):
+        """
+        Reset the operation counters.
+        """
+        self._served = [0] * len(self._stores)
+        self._unavailable = 0
+
+    def _call(self, method, default, *args, **kwargs):
+        """
+        Call a method on the first store able to answer.
+
+        :param method: The method name
+        :type method: str
+
+        :param default: The result when no store can answer
+        :type default: mixed
+
+        :param written: The keys changed by the method, keyword-only
+        :type written: list or None
+
+        :rtype: mixed
+        """
+        written = kwargs.get('written')
+
+        for i, (store, breaker) in enumerate(zip(self._stores, self._breakers)):
+            if not breaker.allow():
+                self._miss(i, written)
+
+                continue
+
+            start = timer()
+
+            try:
+                self._catch_up(i)
+                result = getattr(store, method)(*args)
+            except self._errors as e:
+                breaker.record(timer() - start, e)
+                self._miss(i, written)
+
+                continue
+            except Exception:
+                # The store answered, the error coming from the call itself.
+                breaker.record(timer() - start)
+
+                raise
+
+            breaker.record(timer() - start)
+            self._served[i] += 1
+
+            return result
+
+        self._unavailable += 1
+
+        return default
+
+    def _call_all(self, method, removed, *args):
+        """
+        Call a method removing items on every available store,
+        recording the removals for the other ones.
+
+        :param method: The method name
+        :type method: str
+
+        :param removed: The keys removed by the method, None for all of them
+        :type removed: list or None
+
+        :return: Whether a store succeeded
+        :rtype: bool
+        """
+        succeeded = False
+
+        for i, (store, breaker) in enumerate(zip(self._stores, self._breakers)):
+            if not breaker.allow():
+                self._miss(i, removed)
+
+                continue
+
+            start = timer()
+
+            try:
+                self._catch_up(i)
+                result = getattr(store, method)(*args)
+            except self._errors as e:
+                breaker.record(timer() - start, e)
+                self._miss(i, removed)
+
+                continue
+            except Exception:
+                # The store answered, the error coming from the call itself.
+                breaker.record(timer() - start)
+
+                raise
+
+            breaker.record(timer() - start)
+            self._served[i] += 1
+
+            succeeded = succeeded or result is not False
+
+        if not succeeded:
+            self._unavailable += 1
+
+        return succeeded
+
+    def _miss(self, i, keys):
+        """
+        Record the keys a store could not be called for.
+
+        :param i: The position of the store
+        :type i: int
+
+        :param keys: The keys, None for all of them
+        :type keys: list or None
+        """
+        if not keys and keys is not None:
+            return
+
+        with self._missed_lock:
+            missed = self._missed[i]
+
+            if missed is None:
+                return
+
+            if keys is None or len(missed) + len(keys) > self._max_missed:
+                self._missed[i] = None
+            else:
+                missed.update(keys)
+
+    def _catch_up(self, i):
+        """
+        Remove from a store the keys it missed the changes of before calling it.
+
+        :param i: The position of the store
+        :type i: int
+        """
+        with self._missed_lock:
+            missed = self._missed[i]
+
+            if missed is not None and not missed:
+                return
+
+            # Copied since other calls may record keys meanwhile.
+            if missed is not None:
+                missed = set(missed)
+
+        store = self._stores[i]
+
+        if missed is None:
+            store.flush()
+        else:
+            store.forget_many(list(missed))
+
+        with self._missed_lock:
+            if missed is None:
+                self._missed[i] = set()
+            elif self._missed[i] is not None:
+                self._missed[i] -= missed
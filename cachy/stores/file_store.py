@@ -3,8 +3,10 @@
 import os
 import time
 import math
+import errno
 import hashlib
 from ..contracts.store import Store
+from ..locks import FileLock
 from ..utils import mkdir_p, encode
 
 
@@ -19,6 +21,9 @@ class FileStore(Store):
         'sha256': (hashlib.sha256, 8)
     }
 
+    # Flags creating a file only if it does not exist yet
+    _EXCLUSIVE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+
     def __init__(self, directory, hash_type='sha256'):
         """
         :param directory: The cache directory
@@ -42,6 +47,32 @@ class FileStore(Store):
         """
         return self._get_payload(key).get('data')
 
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        path = self._path(key)
+
+        # Only the expiration timestamp at the start of the file is read
+        # so that the value does not have to be read and unserialized.
+        try:
+            with open(path, 'rb') as fh:
+                expire = int(fh.read(10))
+        except (IOError, OSError, ValueError):
+            return False
+
+        if time.time() >= expire:
+            self.forget(key)
+
+            return False
+
+        return True
+
     def _get_payload(self, key):
         """
         Retrieve an item and expiry time from the cache by key.
@@ -67,7 +98,7 @@ class FileStore(Store):
         # If the current time is greater than expiration timestamps we will delete
         # the file and return null. This helps clean up the old files and keeps
         # this directory much cleaner for us as old files aren't hanging out.
-        if round(time.time()) >= expire:
+        if time.time() >= expire:
             self.forget(key)
 
             return {'data': None, 'time': None}
@@ -76,8 +107,8 @@ class FileStore(Store):
 
         # Next, we'll extract the number of minutes that are remaining for a cache
         # so that we can properly retain the time for things like the increment
-        # operation that may be performed on the cache. We'll round this out.
-        time_ = math.ceil((expire - round(time.time())) / 60.)
+        # operation that may be performed on the cache.
+        time_ = (expire - time.time()) / 60.
 
         return {'data': data, 'time': time_}
 
@@ -92,9 +123,37 @@ class FileStore(Store):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
         """
-        value = encode(str(self._expiration(minutes))) + encode(self.serialize(value))
+        self._write(key, self.serialize(value), minutes)
+
+    def put_many_serialized(self, payloads, minutes):
+        """
+        Store multiple serialized items for a given number of minutes.
+
+        :param payloads: The serialized values keyed by cache key
+        :type payloads: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        for key, payload in payloads.items():
+            self._write(key, payload, minutes)
+
+    def _write(self, key, payload, minutes):
+        """
+        Write a serialized item to its file.
+
+        :param key: The cache key
+        :type key: str
+
+        :param payload: The serialized value
+        :type payload: bytes
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        value = encode(str(self._expiration(minutes))) + encode(payload)
 
         path = self._path(key)
         self._create_cache_directory(path)
@@ -102,6 +161,133 @@ class FileStore(Store):
         with open(path, 'wb') as fh:
             fh.write(value)
 
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        value = encode(str(self._expiration(minutes))) + encode(self.serialize(value))
+
+        path = self._path(key)
+        self._create_cache_directory(path)
+
+        # The file is created exclusively so that only one
+        # of concurrent calls can store the item. An expired file
+        # is removed first and the creation attempted once more.
+        for _ in range(2):
+            try:
+                fd = os.open(path, self._EXCLUSIVE_FLAGS)
+            except OSError as e:
+                if e.errno != errno.EEXIST or not self._remove_expired(path):
+                    return False
+
+                continue
+
+            try:
+                os.write(fd, value)
+            finally:
+                os.close(fd)
+
+            return True
+
+        return False
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        path = self._path(key)
+
+        # Imported here since it slows down the import of the package.
+        import uuid
+
+        # Renaming the file is atomic so that
+        # concurrent calls never retrieve the same item.
+        pulled = '%s.%s.pull' % (path, uuid.uuid4().hex)
+
+        try:
+            os.rename(path, pulled)
+        except OSError:
+            return
+
+        try:
+            with open(pulled, 'rb') as fh:
+                contents = fh.read()
+        finally:
+            os.remove(pulled)
+
+        # A file being written may not hold its expiration yet.
+        try:
+            expire = int(contents[:10])
+        except ValueError:
+            return
+
+        if time.time() >= expire:
+            return
+
+        return self.unserialize(contents[10:])
+
+    def _remove_expired(self, path):
+        """
+        Remove the file of an item if it has expired.
+
+        The file is renamed before its expiration is read, so that the file removed
+        is the one found expired and never a file created concurrently in the meantime.
+
+        :param path: The file path
+        :type path: str
+
+        :return: Whether the file no longer exists
+        :rtype: bool
+        """
+        # Imported here since it slows down the import of the package.
+        import uuid
+
+        expired = '%s.%s.expired' % (path, uuid.uuid4().hex)
+
+        try:
+            os.rename(path, expired)
+        except OSError:
+            return True
+
+        # A file being written may not hold its expiration yet.
+        try:
+            with open(expired, 'rb') as fh:
+                expire = int(fh.read(10))
+        except (IOError, OSError, ValueError):
+            expire = None
+
+        if expire is None or time.time() < expire:
+            # Putting the file back unless another one has been created meanwhile,
+            # linking failing rather than replacing an existing file.
+            try:
+                os.link(expired, path)
+            except (AttributeError, OSError):
+                pass
+
+            os.remove(expired)
+
+            return False
+
+        os.remove(expired)
+
+        return True
+
     def _create_cache_directory(self, path):
         """
         Create the file cache directory if necessary
@@ -127,7 +313,7 @@ class FileStore(Store):
 
         integer = int(raw['data']) + value
 
-        self.put(key, integer, int(raw['time']))
+        self.put(key, integer, raw['time'])
 
         return integer
 
@@ -157,6 +343,18 @@ class FileStore(Store):
         """
         self.put(key, value, 0)
 
+    def forever_serialized(self, key, payload):
+        """
+        Store a serialized item indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param payload: The serialized value
+        :type payload: bytes
+        """
+        self._write(key, payload, 0)
+
     def forget(self, key):
         """
         Remove an item from the cache.
@@ -208,14 +406,33 @@ class FileStore(Store):
         Get the expiration time based on the given minutes.
 
         :param minutes: The minutes
-        :type minutes: int
+        :type minutes: int or float
 
         :rtype: int
         """
         if minutes == 0:
             return 9999999999
 
-        return int(round(time.time()) + (minutes * 60))
+        # The expiration is stored as a 10 digits UNIX timestamp
+        # so sub-second lifetimes are rounded up to the next second.
+        return int(math.ceil(time.time() + minutes * 60))
+
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return FileLock(self._path('lock:%s' % name) + '.lock', name, seconds, owner, **kwargs)
 
     def get_prefix(self):
         """
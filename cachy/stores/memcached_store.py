@@ -9,6 +9,7 @@ except ImportError:
         memcache = None
 
 from ..contracts.taggable_store import TaggableStore
+from ..locks import MemcachedLock
 
 
 class MemcachedStore(TaggableStore):
@@ -42,9 +43,48 @@ class MemcachedStore(TaggableStore):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
         """
-        self._memcache.set(self._prefix + key, value, minutes * 60)
+        self._memcache.set(self._prefix + key, value, self._seconds(minutes))
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        keys = list(keys)
+        values = self._memcache.get_multi(keys, key_prefix=self._prefix)
+
+        return {key: values.get(key) for key in keys}
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        self._memcache.set_multi(values, self._seconds(minutes), key_prefix=self._prefix)
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        return bool(self._memcache.delete_multi(list(keys), key_prefix=self._prefix))
 
     def add(self, key, val, minutes):
         """
@@ -57,11 +97,11 @@ class MemcachedStore(TaggableStore):
         :type val: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
 
         :rtype: bool
         """
-        return self._memcache.add(self._prefix + key, val, minutes * 60)
+        return self._memcache.add(self._prefix + key, val, self._seconds(minutes))
 
     def increment(self, key, value=1):
         """
@@ -120,6 +160,37 @@ class MemcachedStore(TaggableStore):
         """
         self._memcache.flush_all()
 
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return MemcachedLock(self._memcache, self._prefix + name, seconds, owner, **kwargs)
+
+    def _seconds(self, minutes):
+        """
+        Get the expiration time in seconds, memcached having a one-second resolution.
+
+        :param minutes: The lifetime in minutes, 0 meaning forever
+        :type minutes: int or float
+
+        :rtype: int
+        """
+        if not minutes:
+            return 0
+
+        return max(1, int(round(minutes * 60)))
+
     def get_prefix(self):
         """
         Get the cache key prefix.
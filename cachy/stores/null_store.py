@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ..contracts.store import Store
+from ..locks import NullLock
 
 
 class NullStore(Store):
@@ -20,6 +21,17 @@ class NullStore(Store):
         """
         pass
 
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return False
+
     def put(self, key, value, minutes):
         """
         Store an item in the cache for a given number of minutes.
@@ -31,7 +43,71 @@ class NullStore(Store):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
+        """
+        pass
+
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        return True
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        pass
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        return {key: None for key in keys}
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        pass
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
         """
         pass
 
@@ -92,6 +168,23 @@ class NullStore(Store):
         """
         pass
 
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return NullLock(name, seconds, owner, **kwargs)
+
     def get_prefix(self):
         """
         Get the cache key prefix.
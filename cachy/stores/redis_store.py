@@ -2,12 +2,23 @@
 
 try:
     from redis import StrictRedis
+    from redis.exceptions import ResponseError
 except ImportError:
     StrictRedis = None
 
+    class ResponseError(Exception):
+        pass
+
+import threading
+from collections import OrderedDict
+
 from ..contracts.taggable_store import TaggableStore
+from ..locks import RedisLock
+from ..metrics.metrics import timer
+from ..replica_set import ReplicaSet
 from ..redis_tagged_cache import RedisTaggedCache
 from ..tag_set import TagSet
+from ..utils import milliseconds
 
 
 class RedisStore(TaggableStore):
@@ -15,14 +26,62 @@ class RedisStore(TaggableStore):
     A cache store using the Redis as its backend.
     """
 
+    # Get and delete an item atomically
+    # on servers not supporting the GETDEL command.
+    PULL_SCRIPT = """
+local value = redis.call("get", KEYS[1])
+if value then
+    redis.call("del", KEYS[1])
+end
+return value
+"""
+
+    _getdel = True
+
+    # The maximum number of recently written keys read from the primary.
+    _max_written = 10000
+
     def __init__(self, host='localhost', port=6379, db=0, password=None,
-                 prefix='', redis_class=StrictRedis, **kwargs):
+                 prefix='', redis_class=StrictRedis, replicas=None,
+                 replica_selection=ReplicaSet.ROUND_ROBIN, replica_breaker=None,
+                 read_your_writes=0, **kwargs):
+        """
+        :param replicas: The replicas to read from, as clients or as connection options
+                         overriding the ones of the primary
+        :type replicas: list or None
+
+        :param replica_selection: How replicas are chosen, "round-robin" or "latency"
+        :type replica_selection: str
+
+        :param replica_breaker: The options of the circuit breakers ejecting unhealthy replicas
+        :type replica_breaker: dict or None
+
+        :param read_your_writes: The number of seconds during which a written key
+                                 is read from the primary, 0 to always read from replicas
+        :type read_your_writes: int or float
+        """
         # Removing potential "driver" key
         kwargs.pop('driver', None)
 
         self._prefix = prefix
-        self._redis = redis_class(host=host, port=port, db=db,
-                                  password=password, **kwargs)
+
+        options = dict(host=host, port=port, db=db, password=password, **kwargs)
+        self._redis = redis_class(**options)
+
+        self._replicas = None
+        self._read_your_writes = read_your_writes
+        self._written = OrderedDict()
+        self._written_lock = threading.Lock()
+
+        if replicas:
+            clients = [
+                redis_class(**dict(options, **replica)) if isinstance(replica, dict) else replica
+                for replica in replicas
+            ]
+
+            self._replicas = ReplicaSet(
+                self._redis, clients, replica_selection, **(replica_breaker or {})
+            )
 
     def get(self, key):
         """
@@ -33,11 +92,22 @@ class RedisStore(TaggableStore):
 
         :return: The cache value
         """
-        value = self._redis.get(self._prefix + key)
+        value = self._read('get', [key], self._prefix + key)
 
         if value is not None:
             return self.unserialize(value)
 
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return bool(self._read('exists', [key], self._prefix + key))
+
     def put(self, key, value, minutes):
         """
         Store an item in the cache for a given number of minutes.
@@ -49,13 +119,155 @@ class RedisStore(TaggableStore):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int
+        :type minutes: int or float
+        """
+        value = self.serialize(value)
+
+        self._wrote([key])
+        self._redis.psetex(self._prefix + key, milliseconds(minutes), value)
+
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
         """
         value = self.serialize(value)
 
-        minutes = max(1, minutes)
+        self._wrote([key])
+
+        return bool(self._redis.set(
+            self._prefix + key, value, px=milliseconds(minutes), nx=True
+        ))
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        self._wrote([key])
+
+        key = self._prefix + key
+
+        if self._getdel:
+            try:
+                value = self._redis.getdel(key)
+            except (AttributeError, ResponseError) as e:
+                if not self._is_unknown_command(e):
+                    raise
+
+                self._getdel = False
+
+        if not self._getdel:
+            value = self._redis.eval(self.PULL_SCRIPT, 1, key)
+
+        if value is not None:
+            return self.unserialize(value)
+
+    @staticmethod
+    def _is_unknown_command(error):
+        """
+        Determine whether an error means that the client or the server
+        does not support the GETDEL command, available since Redis 6.2.
+
+        :rtype: bool
+        """
+        if isinstance(error, AttributeError):
+            return True
+
+        return 'unknown command' in str(error).lower()
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        keys = list(keys)
+
+        if not keys:
+            return {}
 
-        self._redis.setex(self._prefix + key, minutes * 60, value)
+        values = self._read('mget', keys, [self._prefix + key for key in keys])
+
+        return {
+            key: self.unserialize(value) if value is not None else None
+            for key, value in zip(keys, values)
+        }
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        self.put_many_serialized(
+            {key: self.serialize(value) for key, value in values.items()}, minutes
+        )
+
+    def put_many_serialized(self, payloads, minutes):
+        """
+        Store multiple serialized items for a given number of minutes.
+
+        :param payloads: The serialized values keyed by cache key
+        :type payloads: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        if not payloads:
+            return
+
+        self._wrote(payloads)
+
+        ttl = milliseconds(minutes)
+
+        pipe = self._redis.pipeline(transaction=False)
+
+        for key, payload in payloads.items():
+            pipe.psetex(self._prefix + key, ttl, payload)
+
+        pipe.execute()
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        keys = list(keys)
+
+        if not keys:
+            return True
+
+        self._wrote(keys)
+
+        return self._redis.delete(*[self._prefix + key for key in keys]) == len(keys)
 
     def increment(self, key, value=1):
         """
@@ -69,6 +281,8 @@ class RedisStore(TaggableStore):
 
         :rtype: int or bool
         """
+        self._wrote([key])
+
         return self._redis.incrby(self._prefix + key, value)
 
     def decrement(self, key, value=1):
@@ -83,6 +297,8 @@ class RedisStore(TaggableStore):
 
         :rtype: int or bool
         """
+        self._wrote([key])
+
         return self._redis.decr(self._prefix + key, value)
 
     def forever(self, key, value):
@@ -95,9 +311,20 @@ class RedisStore(TaggableStore):
         :param value: The value to store
         :type value: mixed
         """
-        value = self.serialize(value)
+        self.forever_serialized(key, self.serialize(value))
+
+    def forever_serialized(self, key, payload):
+        """
+        Store a serialized item indefinitely.
+
+        :param key: The cache key
+        :type key: str
 
-        self._redis.set(self._prefix + key, value)
+        :param payload: The serialized value
+        :type payload: bytes
+        """
+        self._wrote([key])
+        self._redis.set(self._prefix + key, payload)
 
     def forget(self, key):
         """
@@ -108,6 +335,8 @@ class RedisStore(TaggableStore):
 
         :rtype: bool
         """
+        self._wrote([key])
+
         return bool(self._redis.delete(self._prefix + key))
 
     def flush(self):
@@ -116,6 +345,23 @@ class RedisStore(TaggableStore):
         """
         return self._redis.flushdb()
 
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return RedisLock(self._redis, self._prefix + name, seconds, owner, **kwargs)
+
     def get_prefix(self):
         """
         Get the cache key prefix.
@@ -127,6 +373,72 @@ class RedisStore(TaggableStore):
     def connection(self):
         return self._redis
 
+    def get_replica_stats(self):
+        """
+        Get the state of each replica and the number of reads sent to the primary instead.
+
+        :rtype: dict or None
+        """
+        if self._replicas is None:
+            return
+
+        return self._replicas.get_stats()
+
+    def _read(self, method, keys, *args):
+        """
+        Call a read method on a replica, or on the primary
+        if one of the keys was written recently.
+
+        :param method: The client method name
+        :type method: str
+
+        :param keys: The cache keys read
+        :type keys: list
+
+        :rtype: mixed
+        """
+        if self._replicas is None:
+            return getattr(self._redis, method)(*args)
+
+        if self._written:
+            now = timer()
+
+            with self._written_lock:
+                recent = any(self._written.get(key, 0) > now for key in keys)
+
+            if recent:
+                return getattr(self._redis, method)(*args)
+
+        return self._replicas.call(method, *args)
+
+    def _wrote(self, keys):
+        """
+        Remember the keys just written so that they are read from the primary
+        until the replicas caught up.
+
+        :param keys: The cache keys
+        :type keys: list
+        """
+        if self._replicas is None or not self._read_your_writes:
+            return
+
+        now = timer()
+        deadline = now + self._read_your_writes
+
+        with self._written_lock:
+            for key in keys:
+                # Moving the key to the end so that the keys stay ordered by deadline.
+                self._written.pop(key, None)
+                self._written[key] = deadline
+
+            while self._written:
+                key, oldest = next(iter(self._written.items()))
+
+                if oldest > now and len(self._written) <= self._max_written:
+                    break
+
+                del self._written[key]
+
     def tags(self, *names):
         """
         Begin executing a new tags operation.
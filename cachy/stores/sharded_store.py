@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from ..contracts.taggable_store import TaggableStore
+from ..hash_ring import HashRing
+from ..redis_tagged_cache import RedisTaggedCache, ShardedRedisTaggedCache
+from ..tag_set import TagSet
+
+
+class ShardedStore(TaggableStore):
+    """
+    A cache store spreading its items across several stores
+    with a consistent-hash ring.
+
+    Single-key operations go to the shard owning the key while multi-key
+    operations are split per shard and run in parallel. Tag identifier keys
+    are ordinary keys, so every process routes them to the same shard.
+    When every shard uses Redis, the items of a tag stored forever
+    are tracked like the redis store does, so that flushing the tag removes them.
+    """
+
+    def __init__(self, stores, names=None, weights=None, vnodes=160, workers=None):
+        """
+        :param stores: The shards
+        :type stores: list
+
+        :param names: The names of the shards, placing them on the ring,
+                      their positions by default
+        :type names: list or None
+
+        :param weights: The weights of the shards keyed by name, 1 by default
+        :type weights: dict or None
+
+        :param vnodes: The number of points on the ring of a shard of weight 1
+        :type vnodes: int
+
+        :param workers: The maximum number of shards called in parallel,
+                        the number of shards by default
+        :type workers: int or None
+        """
+        if not stores:
+            raise ValueError('The sharded store needs at least one store.')
+
+        if names is None:
+            names = [str(i) for i in range(len(stores))]
+
+        if len(names) != len(stores):
+            raise ValueError('The sharded store needs a name for each store.')
+
+        self._shards = dict(zip(names, stores))
+        self._ring = HashRing(names, weights, vnodes)
+        self._workers = workers or len(stores)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        return self.get_shard(key).get(key)
+
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return self.get_shard(key).has(key)
+
+    def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        self.get_shard(key).put(key, value, minutes)
+
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        return self.get_shard(key).add(key, value, minutes)
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        return self.get_shard(key).pull(key)
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        values = {}
+
+        for result in self._map('get_many', self._split(keys)):
+            values.update(result)
+
+        return values
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        groups = {}
+
+        for name, keys in self._split(values).items():
+            groups[name] = ({key: values[key] for key in keys}, minutes)
+
+        self._map('put_many', groups)
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        return all(self._map('forget_many', self._split(keys)))
+
+    def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return self.get_shard(key).increment(key, value)
+
+    def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        return self.get_shard(key).decrement(key, value)
+
+    def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value
+        :type value: mixed
+        """
+        self.get_shard(key).forever(key, value)
+
+    def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return self.get_shard(key).forget(key)
+
+    def flush(self):
+        """
+        Remove all items from every shard.
+        """
+        self._map('flush', {name: () for name in self._shards})
+
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        Locks are acquired on the shard owning their name.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return self.get_shard(name).lock(name, seconds, owner, **kwargs)
+
+    def tags(self, *names):
+        """
+        Begin executing a new tags operation.
+
+        :param names: The tags
+        :type names: tuple
+
+        :rtype: cachy.tagged_cache.TaggedCache
+        """
+        if len(names) == 1 and isinstance(names[0], list):
+            names = names[0]
+
+        if all(isinstance(shard.tags(), RedisTaggedCache) for shard in self._shards.values()):
+            return ShardedRedisTaggedCache(self, TagSet(self, names))
+
+        return super(ShardedStore, self).tags(*names)
+
+    def get_prefix(self):
+        """
+        Get the cache key prefix.
+
+        :rtype: str
+        """
+        return self._shards[self._ring.get_nodes()[0]].get_prefix()
+
+    def get_shard(self, key):
+        """
+        Get the shard owning a key.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: cachy.contracts.store.Store
+        """
+        return self._shards[self._ring.get_node(key)]
+
+    def get_shards(self):
+        """
+        Get the shards keyed by name.
+
+        :rtype: dict
+        """
+        return dict(self._shards)
+
+    def get_ring(self):
+        """
+        Get the consistent-hash ring.
+
+        :rtype: cachy.hash_ring.HashRing
+        """
+        return self._ring
+
+    def close(self):
+        """
+        Stop the workers calling the shards in parallel.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+    def _split(self, keys):
+        """
+        Group keys by shard.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :return: The keys keyed by shard name
+        :rtype: dict
+        """
+        groups = {}
+
+        for key in keys:
+            groups.setdefault(self._ring.get_node(key), []).append(key)
+
+        return groups
+
+    def _map(self, method, groups):
+        """
+        Call a method on several shards, in parallel if there are more than one.
+
+        :param method: The method name
+        :type method: str
+
+        :param groups: The arguments of the calls keyed by shard name,
+                       a list of keys being a single argument
+        :type groups: dict
+
+        :return: The results of the calls
+        :rtype: list
+        """
+        calls = []
+
+        for name, args in groups.items():
+            if isinstance(args, list):
+                args = (args,)
+
+            calls.append((getattr(self._shards[name], method), args))
+
+        if len(calls) < 2:
+            return [fn(*args) for fn, args in calls]
+
+        executor = self._get_executor()
+        futures = [executor.submit(fn, *args) for fn, args in calls]
+
+        return [future.result() for future in futures]
+
+    def _get_executor(self):
+        """
+        Get the workers calling the shards in parallel, starting them if necessary.
+
+        :rtype: concurrent.futures.ThreadPoolExecutor
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # Imported here since it is only needed by multi-key operations
+                    # and slows down the import of the package.
+                    try:
+                        from concurrent.futures import ThreadPoolExecutor
+                    except ImportError:
+                        raise RuntimeError(
+                            'Sharded stores require the "futures" package on Python 2.'
+                        )
+
+                    self._executor = ThreadPoolExecutor(self._workers)
+
+        return self._executor
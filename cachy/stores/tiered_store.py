@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+
+from ..contracts.taggable_store import TaggableStore
+from .dict_store import DictStore
+
+
+class TieredStore(TaggableStore):
+    """
+    A cache store keeping the most recently used items of a remote store
+    in a size-bounded, short-lived in-process store.
+
+    Reads check the local store first while writes and removals
+    go through to both stores. Since other processes cannot invalidate
+    the local store, its items are kept at most ``local_minutes``.
+    """
+
+    def __init__(self, store, local_minutes=1, local_size=1000):
+        """
+        :param store: The remote cache store
+        :type store: cachy.contracts.store.Store
+
+        :param local_minutes: The maximum lifetime in minutes of the local items
+        :type local_minutes: int or float
+
+        :param local_size: The maximum number of local items
+        :type local_size: int
+        """
+        self._store = store
+        self._local = DictStore(local_size)
+        self._local_minutes = local_minutes
+
+        self.reset_stats()
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        value = self._local.get(key)
+
+        if value is not None:
+            self._local_hits += 1
+
+            return value
+
+        value = self._store.get(key)
+
+        if value is None:
+            self._misses += 1
+        else:
+            self._remote_hits += 1
+            self._local.put(key, value, self._local_minutes)
+
+        return value
+
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        return self._local.has(key) or self._store.has(key)
+
+    def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        self._store.put(key, value, minutes)
+        self._local.put(key, value, self._get_local_minutes(minutes))
+
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        The existence is checked on the remote store only.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        if not self._store.add(key, value, minutes):
+            return False
+
+        self._local.put(key, value, self._get_local_minutes(minutes))
+
+        return True
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        self._local.forget(key)
+
+        return self._store.pull(key)
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        values = self._local.get_many(keys)
+        missing = [key for key, value in values.items() if value is None]
+
+        self._local_hits += len(values) - len(missing)
+
+        if not missing:
+            return values
+
+        for key, value in self._store.get_many(missing).items():
+            if value is None:
+                self._misses += 1
+
+                continue
+
+            self._remote_hits += 1
+            self._local.put(key, value, self._local_minutes)
+            values[key] = value
+
+        return values
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        self._store.put_many(values, minutes)
+        self._local.put_many(values, self._get_local_minutes(minutes))
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        keys = list(keys)
+
+        self._local.forget_many(keys)
+
+        return self._store.forget_many(keys)
+
+    def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        self._local.forget(key)
+
+        return self._store.increment(key, value)
+
+    def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        self._local.forget(key)
+
+        return self._store.decrement(key, value)
+
+    def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value
+        :type value: mixed
+        """
+        self._store.forever(key, value)
+        self._local.put(key, value, self._local_minutes)
+
+    def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        self._local.forget(key)
+
+        return self._store.forget(key)
+
+    def flush(self):
+        """
+        Remove all items from the cache.
+        """
+        self._local.flush()
+        self._store.flush()
+
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        Locks are always acquired on the remote store.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return self._store.lock(name, seconds, owner, **kwargs)
+
+    def get_prefix(self):
+        """
+        Get the cache key prefix.
+
+        :rtype: str
+        """
+        return self._store.get_prefix()
+
+    def get_stats(self):
+        """
+        Get the number of hits of each tier and the number of misses.
+
+        :rtype: dict
+        """
+        return {
+            'local_hits': self._local_hits,
+            'remote_hits': self._remote_hits,
+            'misses': self._misses
+        }
+
+    def reset_stats(self):
+        """
+        Reset the hit and miss counters.
+        """
+        self._local_hits = 0
+        self._remote_hits = 0
+        self._misses = 0
+
+    def get_store(self):
+        """
+        Get the remote cache store.
+
+        :rtype: cachy.contracts.store.Store
+        """
+        return self._store
+
+    def get_local_store(self):
+        """
+        Get the local cache store.
+
+        :rtype: cachy.stores.DictStore
+        """
+        return self._local
+
+    def _get_local_minutes(self, minutes):
+        """
+        Get the lifetime of a local item.
+
+        :param minutes: The lifetime in minutes of the remote item, 0 meaning forever
+        :type minutes: int or float
+
+        :rtype: int or float
+        """
+        if not minutes:
+            return self._local_minutes
+
+        return min(minutes, self._local_minutes)
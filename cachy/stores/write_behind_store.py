@@ -0,0 +1,615 @@
+# -*- coding: utf-8 -*-
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+from ..contracts.taggable_store import TaggableStore
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindStore(TaggableStore):
+    """
+    A cache store buffering the writes and removals of another store
+    and applying them in batches from a background thread.
+
+    Writes only wait for the network when the buffer is full.
+    Values are serialized when they are buffered, so that changing them afterwards
+    changes neither what is written nor what is read back. Items still waiting
+    to be written are served from the buffer, as copies,
+    so that a process always reads its own writes.
+    """
+
+    PUT = 'put'
+    FOREVER = 'forever'
+    FORGET = 'forget'
+
+    def __init__(self, store, batch_size=100, interval=0.1, max_pending=10000):
+        """
+        :param store: The store the writes are applied to
+        :type store: cachy.contracts.store.Store
+
+        :param batch_size: The maximum number of operations applied at once
+        :type batch_size: int
+
+        :param interval: The maximum number of seconds an operation waits for a batch to fill up
+        :type interval: int or float
+
+        :param max_pending: The maximum number of buffered operations,
+                            writers waiting for the background thread beyond it
+        :type max_pending: int
+        """
+        if batch_size < 1 or max_pending < 1:
+            raise ValueError('The batch size and the maximum number of pending operations '
+                             'must be at least 1.')
+
+        self._store = store
+        self._batch_size = batch_size
+        self._interval = interval
+        self._max_pending = max_pending
+
+        # The buffered operations, keyed by cache key
+        # since only the last operation on a key matters.
+        self._pending = OrderedDict()
+        self._in_flight = {}
+        self._condition = threading.Condition()
+        self._draining = 0
+        self._closed = False
+        self._thread = None
+
+        self.reset_stats()
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache by key.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        entry = self._buffered(key)
+
+        if entry is None:
+            return self._store.get(key)
+
+        if entry[0] == self.FORGET:
+            return
+
+        return self._restore(entry[1])
+
+    def has(self, key):
+        """
+        Determine if an item exists in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        entry = self._buffered(key)
+
+        if entry is None:
+            return self._store.has(key)
+
+        return entry[0] != self.FORGET
+
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        values = {}
+        missing = []
+
+        with self._condition:
+            for key in keys:
+                entry = self._pending.get(key) or self._in_flight.get(key)
+
+                if entry is None:
+                    missing.append(key)
+                elif entry[0] == self.FORGET:
+                    values[key] = None
+                else:
+                    values[key] = entry[1]
+
+        for key in values:
+            if values[key] is not None:
+                values[key] = self._restore(values[key])
+
+        if missing:
+            values.update(self._store.get_many(missing))
+
+        return values
+
+    def put(self, key, value, minutes):
+        """
+        Store an item in the cache for a given number of minutes.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+        """
+        self._enqueue(key, (self.PUT, self._snapshot(value), minutes))
+
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float
+        """
+        for key, value in values.items():
+            self._enqueue(key, (self.PUT, self._snapshot(value), minutes))
+
+    def forever(self, key, value):
+        """
+        Store an item in the cache indefinitely.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The value
+        :type value: mixed
+        """
+        self._enqueue(key, (self.FOREVER, self._snapshot(value), 0))
+
+    def forget(self, key):
+        """
+        Remove an item from the cache.
+
+        Since the removal is applied later,
+        it is always considered successful.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: bool
+        """
+        self._enqueue(key, (self.FORGET, None, None))
+
+        return True
+
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: bool
+        """
+        for key in keys:
+            self._enqueue(key, (self.FORGET, None, None))
+
+        return True
+
+    def add(self, key, value, minutes):
+        """
+        Store an item in the cache if it does not exist.
+
+        The buffered operation on the key, if any,
+        is applied first and the item added synchronously.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The cache value
+        :type value: mixed
+
+        :param minutes: The lifetime in minutes of the cached value
+        :type minutes: int or float
+
+        :rtype: bool
+        """
+        self._settle(key)
+
+        return self._store.add(key, value, minutes)
+
+    def pull(self, key):
+        """
+        Retrieve an item from the cache by key and delete it.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: The cache value
+        """
+        self._settle(key)
+
+        return self._store.pull(key)
+
+    def increment(self, key, value=1):
+        """
+        Increment the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The increment value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        self._settle(key)
+
+        return self._store.increment(key, value)
+
+    def decrement(self, key, value=1):
+        """
+        Decrement the value of an item in the cache.
+
+        :param key: The cache key
+        :type key: str
+
+        :param value: The decrement value
+        :type value: int
+
+        :rtype: int or bool
+        """
+        self._settle(key)
+
+        return self._store.decrement(key, value)
+
+    def flush(self):
+        """
+        Remove all items from the cache, including the buffered ones.
+        """
+        with self._condition:
+            self._pending.clear()
+
+            while self._in_flight:
+                self._condition.wait()
+
+            self._condition.notify_all()
+
+        self._store.flush()
+
+    def drain(self):
+        """
+        Wait for all the buffered operations to be applied.
+        """
+        with self._condition:
+            self._draining += 1
+            self._condition.notify_all()
+
+            try:
+                while self._pending or self._in_flight:
+                    self._condition.wait()
+            finally:
+                self._draining -= 1
+
+    def close(self):
+        """
+        Apply the buffered operations and stop the background thread.
+
+        Operations performed afterwards are applied synchronously.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+
+        # Operations left by a failed background thread
+        # are applied here rather than lost.
+        with self._condition:
+            batch = list(self._pending.items())
+            self._pending.clear()
+
+        if batch:
+            self._apply(batch)
+
+    def lock(self, name, seconds=0, owner=None, **kwargs):
+        """
+        Get a lock instance.
+
+        Locks are not buffered and are acquired on the underlying store.
+
+        :param name: The lock name
+        :type name: str
+
+        :param seconds: The number of seconds after which the lock expires, 0 meaning never
+        :type seconds: int or float
+
+        :param owner: The lock owner identifier
+        :type owner: str or None
+
+        :rtype: cachy.locks.Lock
+        """
+        return self._store.lock(name, seconds, owner, **kwargs)
+
+    def get_prefix(self):
+        """
+        Get the cache key prefix.
+
+        :rtype: str
+        """
+        return self._store.get_prefix()
+
+    def get_store(self):
+        """
+        Get the store the writes are applied to.
+
+        :rtype: cachy.contracts.store.Store
+        """
+        return self._store
+
+    def get_stats(self):
+        """
+        Get the number of buffered operations, of applied batches and operations,
+        of failed operations and of writes that waited for the buffer to have room.
+
+        :rtype: dict
+        """
+        with self._condition:
+            pending = len(self._pending) + len(self._in_flight)
+
+        return {
+            'pending': pending,
+            'batches': self._batches,
+            'written': self._written,
+            'errors': self._errors,
+            'blocked': self._blocked
+        }
+
+    def reset_stats(self):
+        """
+        Reset the counters.
+        """
+        self._batches = 0
+        self._written = 0
+        self._errors = 0
+        self._blocked = 0
+
+    def set_serializer(self, serializer):
+        """
+        Set the serializer.
+
+        :param serializer: The serializer
+        :type serializer: cachy.serializers.Serializer
+
+        :rtype: Store
+        """
+        self._store.set_serializer(serializer)
+
+        return self
+
+    def get_serializer(self):
+        """
+        Get the serializer.
+
+        :rtype: cachy.serializers.Serializer
+        """
+        return self._store.get_serializer()
+
+    def set_metrics(self, metrics):
+        """
+        Set the metrics recording the serialization costs.
+
+        :param metrics: The metrics, or None to disable them
+        :type metrics: cachy.metrics.Metrics or None
+
+        :rtype: Store
+        """
+        self._store.set_metrics(metrics)
+
+        return self
+
+    def get_metrics(self):
+        """
+        Get the metrics recording the serialization costs.
+
+        :rtype: cachy.metrics.Metrics or None
+        """
+        return self._store.get_metrics()
+
+    def unserialize(self, data):
+        return self._store.unserialize(data)
+
+    def serialize(self, data):
+        return self._store.serialize(data)
+
+    def _snapshot(self, value):
+        """
+        Serialize a buffered value on the calling thread,
+        so that the serialization is recorded by the metrics and the current operation.
+
+        :param value: The value
+        :type value: mixed
+
+        :rtype: bytes
+        """
+        return self._store.serialize(value)
+
+    def _restore(self, payload):
+        """
+        Get a copy of a buffered value.
+
+        :param payload: The serialized value
+        :type payload: bytes
+
+        :rtype: mixed
+        """
+        return self.get_serializer().unserialize(payload)
+
+    def _buffered(self, key):
+        """
+        Get the buffered operation on a key.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: tuple or None
+        """
+        with self._condition:
+            return self._pending.get(key) or self._in_flight.get(key)
+
+    def _enqueue(self, key, entry):
+        """
+        Buffer an operation, waiting for the buffer to have room if necessary.
+
+        :param key: The cache key
+        :type key: str
+
+        :param entry: The operation, its value and its lifetime
+        :type entry: tuple
+        """
+        with self._condition:
+            if not self._closed:
+                if key not in self._pending and len(self._pending) >= self._max_pending:
+                    self._blocked += 1
+
+                    while (not self._closed
+                           and key not in self._pending
+                           and len(self._pending) >= self._max_pending):
+                        self._condition.wait()
+
+            if not self._closed:
+                # Moving the key to the end so that operations
+                # are applied in the order of their last update.
+                self._pending.pop(key, None)
+                self._pending[key] = entry
+
+                if self._thread is None:
+                    self._start()
+                elif len(self._pending) in (1, self._batch_size):
+                    # Waking up the background thread when it waits
+                    # for a first operation or for a full batch.
+                    self._condition.notify_all()
+
+                return
+
+        self._apply([(key, entry)])
+
+    def _settle(self, key):
+        """
+        Apply the buffered operation on a key synchronously.
+
+        :param key: The cache key
+        :type key: str
+        """
+        with self._condition:
+            entry = self._pending.pop(key, None)
+
+            while key in self._in_flight:
+                self._condition.wait()
+
+            self._condition.notify_all()
+
+        if entry is not None:
+            self._apply([(key, entry)])
+
+    def _start(self):
+        """
+        Start the background thread applying the buffered operations.
+        """
+        self._thread = threading.Thread(target=self._run, name='cachy-write-behind')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        """
+        Apply the buffered operations in batches until the store is closed.
+        """
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+
+                if not self._pending:
+                    return
+
+                # Waiting for a full batch unless the operations
+                # must be applied right away.
+                deadline = time.time() + self._interval
+
+                while (len(self._pending) < self._batch_size
+                       and not self._draining
+                       and not self._closed):
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
+                        break
+
+                    self._condition.wait(remaining)
+
+                batch = []
+                while self._pending and len(batch) < self._batch_size:
+                    batch.append(self._pending.popitem(last=False))
+
+                self._in_flight.update(batch)
+                self._condition.notify_all()
+
+            try:
+                self._apply(batch)
+            except Exception:
+                # The background thread must keep applying the buffered operations
+                # since writers wait for it once the buffer is full.
+                self._errors += len(batch)
+                logger.exception('Failed to apply %d buffered cache operations.', len(batch))
+            finally:
+                with self._condition:
+                    for key, entry in batch:
+                        if self._in_flight.get(key) is entry:
+                            del self._in_flight[key]
+
+                    self._condition.notify_all()
+
+    def _apply(self, batch):
+        """
+        Apply a batch of operations to the underlying store,
+        grouping them so that each group is applied at once.
+
+        :param batch: The operations keyed by cache key
+        :type batch: list
+        """
+        puts = OrderedDict()
+        forever = []
+        forgets = []
+
+        for key, (operation, payload, minutes) in batch:
+            if operation == self.PUT:
+                puts.setdefault(minutes, {})[key] = payload
+            elif operation == self.FOREVER:
+                forever.append((key, payload))
+            else:
+                forgets.append(key)
+
+        # The snapshots are written as they are rather than serialized again.
+        groups = [(self._store.put_many_serialized, (payloads, minutes), len(payloads))
+                  for minutes, payloads in puts.items()]
+        groups += [(self._store.forever_serialized, item, 1) for item in forever]
+
+        if forgets:
+            groups.append((self._store.forget_many, (forgets,), len(forgets)))
+
+        for fn, args, count in groups:
+            # A failing group must not prevent the others from being applied.
+            try:
+                fn(*args)
+            except Exception:
+                self._errors += count
+                logger.exception('Failed to apply %d buffered cache operations.', count)
+            else:
+                self._written += count
+
+        self._batches += 1
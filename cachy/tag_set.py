@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import uuid
-
 
 class TagSet(object):
 
@@ -58,6 +56,9 @@ class TagSet(object):
 
         :rtype: str
         """
+        # Imported here since it slows down the import of the package.
+        import uuid
+
         id_ = str(uuid.uuid4()).replace('-', '')
 
         self._store.forever(self.tag_key(name), id_)
@@ -4,14 +4,19 @@ import hashlib
 import datetime
 import math
 from .contracts.store import Store
+from .envelope import Envelope
 from .helpers import value
+from .instrumentation import Instrumented, instrumented
 from .utils import encode
 
 
-class TaggedCache(Store):
+class TaggedCache(Instrumented, Store):
     """
 
     """
+
+    _single_flight = None
+
     def __init__(self, store, tags):
         """
         :param store: The cache store implementation
@@ -23,6 +28,7 @@ class TaggedCache(Store):
         self._store = store
         self._tags = tags
 
+    @instrumented('has')
     def has(self, key):
         """
         Determine if an item exists in the cache.
@@ -32,7 +38,7 @@ class TaggedCache(Store):
 
         :rtype: bool
         """
-        return self.get(key) is not None
+        return self._store.has(self.tagged_item_key(key))
 
     def get(self, key, default=None):
         """
@@ -46,13 +52,73 @@ class TaggedCache(Store):
 
         :return: The cache value
         """
-        val = self._store.get(self.tagged_item_key(key))
+        val = self._get_payload(key)
 
         if val is not None:
-            return val
+            return Envelope.open(val)
 
         return value(default)
 
+    def _find(self, key):
+        """
+        Retrieve an item from the cache by key,
+        telling apart missing items from cached None values.
+
+        :param key: The cache key
+        :type key: str
+
+        :return: Whether the item was found and its value
+        :rtype: tuple
+        """
+        val = self._get_payload(key)
+
+        if val is None:
+            return False, None
+
+        return True, Envelope.open(val)
+
+    @instrumented('get')
+    def _get_payload(self, key):
+        """
+        Retrieve the stored payload of an item, recording the hit or the miss.
+
+        :param key: The cache key
+        :type key: str
+
+        :rtype: mixed
+        """
+        payload = self._store.get(self.tagged_item_key(key))
+
+        self._record('misses' if payload is None else 'hits')
+
+        return payload
+
+    @instrumented('get_many')
+    def get_many(self, keys):
+        """
+        Retrieve multiple items from the cache by key.
+
+        Items not found in the cache will have a None value.
+
+        :param keys: The cache keys
+        :type keys: list
+
+        :rtype: dict
+        """
+        keys = list(keys)
+        namespace = self._namespace_key()
+
+        values = self._store.get_many(['%s:%s' % (namespace, key) for key in keys])
+
+        if self._metrics is not None:
+            misses = sum(1 for val in values.values() if val is None)
+
+            self._record('hits', len(values) - misses)
+            self._record('misses', misses)
+
+        return {key: Envelope.open(values.get('%s:%s' % (namespace, key))) for key in keys}
+
+    @instrumented('put')
     def put(self, key, value, minutes):
         """
         Store an item in the cache for a given number of minutes.
@@ -64,13 +130,39 @@ class TaggedCache(Store):
         :type value: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int or datetime
+        :type minutes: int or float or datetime or timedelta
         """
         minutes = self._get_minutes(minutes)
 
         if minutes is not None:
-            return self._store.put(self.tagged_item_key(key), value, minutes)
+            self._record('sets')
 
+            return self._store.put(self.tagged_item_key(key), Envelope.wrap(value), minutes)
+
+    @instrumented('put_many')
+    def put_many(self, values, minutes):
+        """
+        Store multiple items in the cache for a given number of minutes.
+
+        :param values: The cache values keyed by cache key
+        :type values: dict
+
+        :param minutes: The lifetime in minutes of the cached values
+        :type minutes: int or float or datetime or timedelta
+        """
+        minutes = self._get_minutes(minutes)
+
+        if minutes is not None:
+            namespace = self._namespace_key()
+
+            self._record('sets', len(values))
+
+            return self._store.put_many(
+                {'%s:%s' % (namespace, key): Envelope.wrap(val) for key, val in values.items()},
+                minutes
+            )
+
+    @instrumented('add')
     def add(self, key, val, minutes):
         """
         Store an item in the cache if it does not exist.
@@ -82,17 +174,48 @@ class TaggedCache(Store):
         :type val: mixed
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int|datetime
+        :type minutes: int or float or datetime or timedelta
 
         :rtype: bool
         """
-        if not self.has(key):
-            self.put(key, val, minutes)
+        minutes = self._get_minutes(minutes)
+
+        if minutes is None:
+            return False
+
+        added = self._store.add(self.tagged_item_key(key), Envelope.wrap(val), minutes)
+
+        if added:
+            self._record('sets')
+
+        return added
+
+    @instrumented('pull')
+    def pull(self, key, default=None):
+        """
+        Retrieve an item from the cache by key and delete it.
 
-            return True
+        :param key: The cache key
+        :type key: str
+
+        :param default: The default value to return
+        :type default: mixed
+
+        :rtype: mixed
+        """
+        payload = self._store.pull(self.tagged_item_key(key))
 
-        return False
+        if payload is None:
+            self._record('misses')
 
+            return value(default)
+
+        self._record('hits')
+        self._record('deletes')
+
+        return Envelope.open(payload)
+
+    @instrumented('increment')
     def increment(self, key, value=1):
         """
         Increment the value of an item in the cache.
@@ -107,6 +230,7 @@ class TaggedCache(Store):
         """
         self._store.increment(self.tagged_item_key(key), value)
 
+    @instrumented('decrement')
     def decrement(self, key, value=1):
         """
         Decrement the value of an item in the cache.
@@ -121,6 +245,7 @@ class TaggedCache(Store):
         """
         self._store.decrement(self.tagged_item_key(key), value)
 
+    @instrumented('forever')
     def forever(self, key, value):
         """
         Store an item in the cache indefinitely.
@@ -131,8 +256,10 @@ class TaggedCache(Store):
         :param value: The value
         :type value: mixed
         """
-        self._store.forever(self.tagged_item_key(key), value)
+        self._store.forever(self.tagged_item_key(key), Envelope.wrap(value))
+        self._record('sets')
 
+    @instrumented('forget')
     def forget(self, key):
         """
         Remove an item from the cache.
@@ -143,14 +270,33 @@ class TaggedCache(Store):
         :rtype: bool
         """
         self._store.forget(self.tagged_item_key(key))
+        self._record('deletes')
+
+    @instrumented('forget_many')
+    def forget_many(self, keys):
+        """
+        Remove multiple items from the cache.
+
+        :param keys: The cache keys
+        :type keys: list
 
+        :rtype: bool
+        """
+        keys = list(keys)
+        namespace = self._namespace_key()
+
+        self._record('deletes', len(keys))
+
+        return self._store.forget_many(['%s:%s' % (namespace, key) for key in keys])
+
+    @instrumented('flush')
     def flush(self):
         """
         Remove all items from the cache.
         """
         self._tags.reset()
 
-    def remember(self, key, minutes, callback):
+    def remember(self, key, minutes, callback, negative_minutes=None):
         """
         Get an item from the cache, or store the default value.
 
@@ -158,25 +304,35 @@ class TaggedCache(Store):
         :type key: str
 
         :param minutes: The lifetime in minutes of the cached value
-        :type minutes: int or datetime
+        :type minutes: int or float or datetime or timedelta
 
         :param callback: The default function
         :type callback: mixed
 
+        :param negative_minutes: The lifetime in minutes of None values,
+                                 defaulting to the lifetime of other values
+        :type negative_minutes: int or float or datetime or timedelta or None
+
         :rtype: mixed
         """
         # If the item exists in the cache we will just return this immediately
         # otherwise we will execute the given callback and cache the result
         # of that execution for the given number of minutes in storage.
-        val = self.get(key)
-        if val is not None:
+        found, val = self._find(key)
+        if found:
             return val
 
-        val = value(callback)
+        def compute():
+            val = value(callback)
+
+            if val is None and negative_minutes is not None:
+                self.put(key, val, negative_minutes)
+            else:
+                self.put(key, val, minutes)
 
-        self.put(key, val, minutes)
+            return val
 
-        return val
+        return self._compute(key, compute)
 
     def remember_forever(self, key, callback):
         """
@@ -193,15 +349,60 @@ class TaggedCache(Store):
         # If the item exists in the cache we will just return this immediately
         # otherwise we will execute the given callback and cache the result
         # of that execution forever.
-        val = self.get(key)
-        if val is not None:
+        found, val = self._find(key)
+        if found:
+            return val
+
+        def compute():
+            val = value(callback)
+
+            self.forever(key, val)
+
             return val
 
-        val = value(callback)
+        return self._compute(key, compute)
+
+    def _compute(self, key, compute):
+        """
+        Compute the value of a missing item.
+
+        If single-flight is enabled, concurrent callers for the same key
+        will wait for the first one and share its result.
+
+        :param key: The cache key
+        :type key: str
+
+        :param compute: The function computing and storing the value
+        :type compute: callable
+
+        :rtype: mixed
+        """
+        if self._single_flight is None:
+            return compute()
+
+        def leader():
+            # Another caller might have stored the value between
+            # our cache miss and the moment we started computing.
+            found, val = self._find(key)
+            if found:
+                return val
 
-        self.forever(key, val)
+            return compute()
 
-        return val
+        return self._single_flight.do(self.tagged_item_key(key), leader)
+
+    def set_single_flight(self, single_flight):
+        """
+        Set the single-flight instance used when computing missing items.
+
+        :param single_flight: The single-flight instance, or None to disable it
+        :type single_flight: cachy.single_flight.SingleFlight or None
+
+        :rtype: self
+        """
+        self._single_flight = single_flight
+
+        return self
 
     def tagged_item_key(self, key):
         """
@@ -212,7 +413,15 @@ class TaggedCache(Store):
 
         :rtype: str
         """
-        return '%s:%s' % (hashlib.sha1(encode(self._tags.get_namespace())).hexdigest(), key)
+        return '%s:%s' % (self._namespace_key(), key)
+
+    def _namespace_key(self):
+        """
+        Get the hashed tag namespace used to prefix tagged items.
+
+        :rtype: str
+        """
+        return hashlib.sha1(encode(self._tags.get_namespace())).hexdigest()
 
     def get_prefix(self):
         """
@@ -226,17 +435,20 @@ class TaggedCache(Store):
         """
         Calculate the number of minutes with the given duration.
 
-        :param duration: The duration
-        :type duration: int or datetime
+        :param duration: The duration in minutes, the expiration date or the lifetime
+        :type duration: int or float or datetime or timedelta
 
-        :rtype: int or None
+        :rtype: int or float or None
         """
         if isinstance(duration, datetime.datetime):
-            from_now = (duration - datetime.datetime.now()).total_seconds()
-            from_now = math.ceil(from_now / 60)
+            duration = duration - datetime.datetime.now()
+
+        if isinstance(duration, datetime.timedelta):
+            # Durations are rounded up to the second.
+            seconds = math.ceil(duration.total_seconds())
 
-            if from_now > 0:
-                return from_now
+            if seconds > 0:
+                return seconds / 60.
 
             return
 
@@ -60,3 +60,56 @@ def mkdir_p(path, mode=0o777):
             pass
         else:
             raise
+
+
+def milliseconds(minutes):
+    # Non-positive lifetimes have always been stored for one minute
+    # by the stores which cannot keep items forever with an expiration.
+    if minutes <= 0:
+        return 60000
+
+    return max(1, int(round(minutes * 60000)))
+
+
+def lazy_attributes(package, attributes, namespace):
+    """
+    Import the attributes of a package from their modules on first access,
+    so that importing the package does not import every optional dependency.
+
+    Module level ``__getattr__`` is only supported since Python 3.7,
+    so the attributes are imported right away on older versions.
+
+    :param package: The package name
+    :type package: str
+
+    :param attributes: The modules of the attributes, keyed by attribute name
+    :type attributes: dict
+
+    :param namespace: The package namespace
+    :type namespace: dict
+    """
+    def load(name):
+        # Equivalent to "from .module import name",
+        # so that the import shows up in -X importtime.
+        module = __import__(attributes[name], namespace, None, [name], 1)
+        namespace[name] = getattr(module, name)
+
+        return namespace[name]
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            load(name)
+
+        return
+
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError('module %r has no attribute %r' % (package, name))
+
+        return load(name)
+
+    def __dir__():
+        return sorted(set(namespace) | set(attributes))
+
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 7):
+    # The asynchronous repository and stores rely on the async/await syntax
+    # and on asyncio.get_running_loop().
+    collect_ignore += [
+        'test_async_repository.py',
+        'stores/test_async_redis_store.py',
+    ]
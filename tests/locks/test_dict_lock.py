@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import time
+from unittest import TestCase
+
+from cachy.locks import LockTimeoutError
+from cachy.stores import DictStore
+
+
+class DictLockTestCase(TestCase):
+
+    def test_lock_can_be_acquired_once(self):
+        store = DictStore()
+        lock = store.lock('foo', 10)
+
+        self.assertTrue(lock.acquire())
+        self.assertFalse(store.lock('foo', 10).acquire())
+
+        self.assertTrue(lock.release())
+        self.assertTrue(store.lock('foo', 10).acquire())
+
+    def test_lock_can_only_be_released_by_its_owner(self):
+        store = DictStore()
+        lock = store.lock('foo', 10)
+        lock.acquire()
+
+        self.assertFalse(store.lock('foo', 10).release())
+        self.assertTrue(store.lock('foo', 10, owner=lock.owner()).release())
+
+    def test_expired_lock_can_be_acquired(self):
+        store = DictStore()
+        store.lock('foo', 0.05).acquire()
+
+        time.sleep(0.1)
+
+        self.assertTrue(store.lock('foo', 10).acquire())
+
+    def test_lock_as_context_manager(self):
+        store = DictStore()
+
+        with store.lock('foo', 10) as lock:
+            self.assertFalse(store.lock('foo', 10).acquire())
+
+        self.assertTrue(store.lock('foo', 10).acquire())
+
+    def test_block_raises_on_timeout(self):
+        store = DictStore()
+        store.lock('foo', 10).acquire()
+
+        self.assertRaises(LockTimeoutError, store.lock('foo', 10, sleep=0.01).block, 0.05)
+
+    def test_get_executes_callback_when_acquired(self):
+        store = DictStore()
+
+        self.assertEqual('bar', store.lock('foo', 10).get(lambda: 'bar'))
+        self.assertTrue(store.lock('foo', 10).acquire())
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import glob
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from cachy.stores import FileStore
+
+
+class FileLockTestCase(TestCase):
+
+    def setUp(self):
+        self._dir = os.path.join(tempfile.gettempdir(), 'cachy')
+
+    def tearDown(self):
+        for e in glob.glob(os.path.join(self._dir, '*')):
+            if os.path.isdir(e):
+                shutil.rmtree(e)
+
+    def test_lock_can_be_acquired_once(self):
+        store = FileStore(self._dir)
+        lock = store.lock('foo')
+
+        self.assertTrue(lock.acquire())
+        self.assertFalse(store.lock('foo').acquire())
+
+        self.assertTrue(lock.release())
+        self.assertTrue(store.lock('foo').acquire())
+
+    def test_lock_is_not_released_by_another_instance(self):
+        store = FileStore(self._dir)
+        lock = store.lock('foo')
+        lock.acquire()
+
+        self.assertFalse(store.lock('foo').release())
+        self.assertFalse(store.lock('foo').acquire())
+
+        lock.release()
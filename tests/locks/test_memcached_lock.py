@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from flexmock import flexmock
+from cachy.locks import MemcachedLock
+
+
+class MemcachedLockTestCase(TestCase):
+
+    def test_lock_is_stored_with_expiration(self):
+        memcache = flexmock()
+        memcache.should_receive('add').with_args('foo', 'bar', 10).once().and_return(True)
+
+        self.assertTrue(MemcachedLock(memcache, 'foo', 10, 'bar').acquire())
+
+    def test_sub_second_locks_expire(self):
+        memcache = flexmock()
+        memcache.should_receive('add').with_args('foo', 'bar', 1).twice().and_return(True)
+
+        self.assertTrue(MemcachedLock(memcache, 'foo', 0.5, 'bar').acquire())
+        self.assertTrue(MemcachedLock(memcache, 'foo', 0.001, 'bar').acquire())
+
+    def test_partial_seconds_are_rounded_up(self):
+        memcache = flexmock()
+        memcache.should_receive('add').with_args('foo', 'bar', 2).once().and_return(True)
+
+        self.assertTrue(MemcachedLock(memcache, 'foo', 1.5, 'bar').acquire())
+
+    def test_locks_without_seconds_never_expire(self):
+        memcache = flexmock()
+        memcache.should_receive('add').with_args('foo', 'bar', 0).once().and_return(True)
+
+        self.assertTrue(MemcachedLock(memcache, 'foo', 0, 'bar').acquire())
+
+    def test_lock_can_only_be_released_by_its_owner(self):
+        memcache = flexmock()
+        memcache.should_receive('get').with_args('foo').and_return('baz')
+        memcache.should_receive('delete').never()
+
+        self.assertFalse(MemcachedLock(memcache, 'foo', 10, 'bar').release())
+
+    def test_lock_is_deleted_on_release(self):
+        memcache = flexmock()
+        memcache.should_receive('get').with_args('foo').and_return('bar')
+        memcache.should_receive('delete').with_args('foo').once().and_return(1)
+
+        self.assertTrue(MemcachedLock(memcache, 'foo', 10, 'bar').release())
+
+    def test_lock_is_released_atomically_with_cas(self):
+        memcache = flexmock(cache_cas=True)
+        memcache.should_receive('gets').with_args('foo').and_return('bar')
+        memcache.should_receive('cas').with_args('foo', 'bar', -1).once().and_return(True)
+        memcache.should_receive('delete').never()
+
+        self.assertTrue(MemcachedLock(memcache, 'foo', 10, 'bar').release())
+
+    def test_lock_of_another_owner_is_not_released_with_cas(self):
+        memcache = flexmock(cache_cas=True)
+        memcache.should_receive('gets').with_args('foo').and_return('baz')
+        memcache.should_receive('cas').never()
+
+        self.assertFalse(MemcachedLock(memcache, 'foo', 10, 'bar').release())
+
+    def test_lock_changed_since_checked_is_not_released_with_cas(self):
+        memcache = flexmock(cache_cas=True)
+        memcache.should_receive('gets').with_args('foo').and_return('bar')
+        memcache.should_receive('cas').with_args('foo', 'bar', -1).once().and_return(False)
+
+        self.assertFalse(MemcachedLock(memcache, 'foo', 10, 'bar').release())
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from flexmock import flexmock, flexmock_teardown
+from fakeredis import FakeServer
+from fakeredis import FakeStrictRedis
+from cachy.stores import RedisStore
+
+
+class RedisLockTestCase(TestCase):
+
+    def setUp(self):
+        server = FakeServer()
+        server.connected = True
+        self.store = RedisStore(
+            prefix='prefix:', redis_class=FakeStrictRedis, server=server
+        )
+        self.redis = FakeStrictRedis(server=server)
+
+        super(RedisLockTestCase, self).setUp()
+
+    def tearDown(self):
+        flexmock_teardown()
+        self.redis.flushdb()
+
+    def test_lock_is_stored_with_expiration(self):
+        lock = self.store.lock('foo', 10)
+
+        self.assertTrue(lock.acquire())
+        self.assertEqual(lock.owner(), lock.get_current_owner())
+        self.assertTrue(0 < self.redis.pttl('prefix:foo') <= 10000)
+
+    def test_sub_millisecond_lock_still_expires(self):
+        lock = self.store.lock('foo', 0.0001)
+        flexmock(self.store._redis).should_call('set').with_args(
+            'prefix:foo', lock.owner(), nx=True, px=1
+        ).once()
+
+        self.assertTrue(lock.acquire())
+
+    def test_lock_can_be_acquired_once(self):
+        lock = self.store.lock('foo', 10)
+
+        self.assertTrue(lock.acquire())
+        self.assertFalse(self.store.lock('foo', 10).acquire())
+
+    def test_lock_can_only_be_released_by_its_owner(self):
+        lock = self.store.lock('foo', 10)
+        lock.acquire()
+
+        self.assertFalse(self.store.lock('foo', 10).release())
+        self.assertTrue(self.redis.exists('prefix:foo'))
+
+        self.assertTrue(lock.release())
+        self.assertFalse(self.redis.exists('prefix:foo'))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.metrics import Histogram, Metrics, MemorySink
+
+
+class MetricsTestCase(TestCase):
+
+    def test_counters_can_be_incremented(self):
+        metrics = Metrics('dict')
+        metrics.increment('hits')
+        metrics.increment('hits', 2)
+        metrics.increment('misses')
+
+        stats = metrics.stats()
+
+        self.assertEqual(3, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(0, stats['errors'])
+
+    def test_latencies_are_recorded_per_operation(self):
+        metrics = Metrics('dict', buckets=[0.001, 0.01])
+        metrics.observe('get', 0.0005)
+        metrics.observe('get', 0.005)
+        metrics.observe('get', 1)
+        metrics.observe('put', 0.0005)
+
+        latency = metrics.stats()['latency']
+
+        self.assertEqual(
+            [(0.001, 1), (0.01, 2), (float('inf'), 3)],
+            latency['get']['buckets']
+        )
+        self.assertEqual(3, latency['get']['count'])
+        self.assertAlmostEqual(1.0055, latency['get']['sum'])
+        self.assertEqual(1, latency['put']['count'])
+
+    def test_metrics_can_be_reset(self):
+        metrics = Metrics('dict')
+        metrics.increment('hits')
+        metrics.observe('get', 0.1)
+        metrics.reset()
+
+        stats = metrics.stats()
+
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual({}, stats['latency'])
+
+    def test_events_are_forwarded_to_sinks(self):
+        sink = MemorySink()
+        Metrics('dict', sinks=[sink]).increment('hits')
+        Metrics('redis').add_sink(sink).observe('get', 0.1)
+
+        stats = sink.stats()
+
+        self.assertEqual(1, stats['dict']['hits'])
+        self.assertEqual(1, stats['redis']['latency']['get']['count'])
+
+        sink.reset()
+
+        self.assertEqual({}, sink.stats())
+
+    def test_histogram_bounds_are_inclusive(self):
+        histogram = Histogram([1, 2])
+        histogram.observe(1)
+        histogram.observe(2)
+
+        self.assertEqual([(1, 1), (2, 2), (float('inf'), 2)], histogram.snapshot()['buckets'])
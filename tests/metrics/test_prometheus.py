@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.metrics import Metrics, PrometheusRenderer
+
+
+class PrometheusRendererTestCase(TestCase):
+
+    def test_render(self):
+        metrics = Metrics('dict', buckets=[0.5])
+        metrics.increment('hits', 3)
+        metrics.observe('get', 0.25)
+
+        text = PrometheusRenderer().render({'dict': metrics.stats()})
+
+        self.assertIn('# TYPE cachy_hits_total counter\ncachy_hits_total{store="dict"} 3\n', text)
+        self.assertIn('cachy_misses_total{store="dict"} 0\n', text)
+        self.assertIn('# TYPE cachy_operation_duration_seconds histogram\n', text)
+        self.assertIn(
+            'cachy_operation_duration_seconds_bucket{store="dict",operation="get",le="0.5"} 1\n'
+            'cachy_operation_duration_seconds_bucket{store="dict",operation="get",le="+Inf"} 1\n'
+            'cachy_operation_duration_seconds_sum{store="dict",operation="get"} 0.25\n'
+            'cachy_operation_duration_seconds_count{store="dict",operation="get"} 1\n',
+            text
+        )
+
+    def test_namespace_and_label_escaping(self):
+        text = PrometheusRenderer('app').render({'my "store"': Metrics().stats()})
+
+        self.assertIn('app_hits_total{store="my \\"store\\""} 0\n', text)
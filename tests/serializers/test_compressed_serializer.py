@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import shutil
+import tempfile
+from unittest import TestCase
+
+import msgpack
+
+from cachy import CacheManager
+from cachy.serializers import (
+    CompressedSerializer, JsonSerializer, MsgPackSerializer, PickleSerializer
+)
+from cachy.serializers import compressed_serializer
+from cachy.utils import encode
+
+
+class CompressedSerializerTestCase(TestCase):
+
+    def setUp(self):
+        self.value = {'html': '<div class="item">%s</div>' % ('x' * 2000)}
+
+    def test_large_payloads_are_compressed(self):
+        serializer = CompressedSerializer(threshold=100)
+        payload = serializer.serialize(self.value)
+
+        self.assertEqual(CompressedSerializer.ZLIB, payload[:2])
+        self.assertTrue(len(payload) < len(PickleSerializer().serialize(self.value)))
+        self.assertEqual(self.value, serializer.unserialize(payload))
+
+    def test_small_payloads_are_kept_as_is(self):
+        serializer = CompressedSerializer(threshold=100)
+
+        self.assertEqual(PickleSerializer().serialize('foo'), serializer.serialize('foo'))
+        self.assertEqual('foo', serializer.unserialize(serializer.serialize('foo')))
+
+    def test_payloads_written_without_compression_are_read(self):
+        serializer = CompressedSerializer(JsonSerializer(), threshold=100)
+
+        self.assertEqual([1, 2], serializer.unserialize('[1, 2]'))
+        self.assertEqual([1, 2], serializer.unserialize(b'[1, 2]'))
+
+    def test_msgpack_payloads_written_without_compression_are_read(self):
+        serializer = CompressedSerializer(MsgPackSerializer(), threshold=100)
+        values = [0, 1, 2, 3, 4, -1, None, 'foo', [1, 2], {'foo': 1}]
+
+        for value in values:
+            self.assertEqual(value, serializer.unserialize(msgpack.packb(value)))
+            self.assertEqual(value, serializer.unserialize(serializer.serialize(value)))
+
+    def test_every_serializer_is_read_once_compression_is_enabled(self):
+        for wrapped in (PickleSerializer(), JsonSerializer(), MsgPackSerializer()):
+            serializer = CompressedSerializer(wrapped, threshold=100)
+
+            for value in (0, 1, 4, 'foo', [1, 'bar'], {'html': 'x' * 200}):
+                self.assertEqual(value, serializer.unserialize(encode(wrapped.serialize(value))))
+
+    def test_payloads_starting_with_a_header_are_escaped(self):
+        class RawSerializer(object):
+            def serialize(self, data):
+                return data
+
+            def unserialize(self, data):
+                return data
+
+        serializer = CompressedSerializer(RawSerializer(), threshold=100)
+        payload = serializer.serialize(b'\xc1\xf1foo')
+
+        self.assertEqual(b'\xc1\xf0\xc1\xf1foo', payload)
+        self.assertEqual(b'\xc1\xf1foo', serializer.unserialize(payload))
+        self.assertEqual(b'\x01foo', serializer.serialize(b'\x01foo'))
+
+    def test_entries_of_every_available_codec_are_read(self):
+        serializer = CompressedSerializer(threshold=100, codec='zlib')
+        other = CompressedSerializer(threshold=100, codec='lzma')
+        payload = other.serialize(self.value)
+
+        self.assertEqual(CompressedSerializer.LZMA, payload[:2])
+        self.assertEqual(self.value, serializer.unserialize(payload))
+
+    def test_codecs_must_be_supported_and_installed(self):
+        self.assertRaises(ValueError, CompressedSerializer, codec='brotli')
+
+        if compressed_serializer.zstandard is None:
+            self.assertRaises(RuntimeError, CompressedSerializer, codec='zstd')
+
+    def test_manager_enables_compression_per_store(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        cache = CacheManager({
+            'default': 'file',
+            'serializer': 'json',
+            'stores': {
+                'file': {
+                    'driver': 'file',
+                    'path': directory,
+                    'compression': {'threshold': 100, 'codec': 'lzma'}
+                },
+                'dict': {
+                    'driver': 'dict'
+                }
+            }
+        })
+
+        serializer = cache.store()._store._serializer
+        self.assertIsInstance(serializer, CompressedSerializer)
+        self.assertIsInstance(serializer.get_serializer(), JsonSerializer)
+        self.assertNotIsInstance(cache.store('dict')._store._serializer, CompressedSerializer)
+
+        cache.put('foo', self.value, 10)
+        self.assertEqual(self.value, cache.get('foo'))
+
+    def test_compressed_serializer_is_registered(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'serializer': 'compressed',
+            'stores': {'dict': {'driver': 'dict'}}
+        })
+
+        self.assertIsInstance(cache.store()._store._serializer, CompressedSerializer)
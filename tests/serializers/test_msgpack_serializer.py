@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import threading
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from unittest import TestCase
+
+from cachy.serializers import MsgPackSerializer
+
+
+class MsgPackSerializerTestCase(TestCase):
+
+    def setUp(self):
+        self.serializer = MsgPackSerializer()
+
+    def assertRoundTrip(self, value):
+        result = self.serializer.unserialize(self.serializer.serialize(value))
+
+        self.assertEqual(value, result)
+        self.assertEqual(type(value), type(result))
+
+        return result
+
+    def test_builtin_types_are_serialized(self):
+        self.assertRoundTrip({'foo': [1, 2.5, True, None], 1: b'\xff\x00'})
+        self.assertRoundTrip(u'h\xe9llo')
+
+    def test_extension_types_are_serialized(self):
+        self.assertRoundTrip(datetime.datetime(2020, 1, 2, 3, 4, 5, 6))
+        self.assertRoundTrip(datetime.date(2020, 1, 2))
+        self.assertRoundTrip(Decimal('10.50'))
+        self.assertRoundTrip(uuid.uuid4())
+        self.assertRoundTrip({1, 2, 3})
+        self.assertRoundTrip(frozenset(['foo']))
+        self.assertRoundTrip((1, ('foo', None), [2]))
+
+    def test_aware_datetimes_keep_their_offset(self):
+        offset = datetime.timedelta(hours=-5, minutes=-30)
+        value = datetime.datetime(2020, 1, 2, 3, 4, tzinfo=datetime.timezone(offset))
+
+        result = self.assertRoundTrip(value)
+
+        self.assertEqual(offset, result.utcoffset())
+
+    def test_nested_extension_types_are_serialized(self):
+        self.assertRoundTrip([{'at': datetime.date(2020, 1, 2), 'ids': (uuid.uuid4(),)}])
+
+    def test_subclasses_of_builtin_types_are_serialized_as_their_base(self):
+        value = self.serializer.unserialize(self.serializer.serialize(OrderedDict(foo=1)))
+
+        self.assertEqual({'foo': 1}, value)
+        self.assertIs(dict, type(value))
+
+    def test_custom_objects_are_rejected(self):
+        self.assertRaises(TypeError, self.serializer.serialize, object())
+
+        # The packer is still usable.
+        self.assertRoundTrip('foo')
+
+    def test_serializer_is_thread_safe(self):
+        errors = []
+
+        def worker(i):
+            value = {'id': i, 'values': list(range(i * 10))}
+
+            for _ in range(200):
+                if self.serializer.unserialize(self.serializer.serialize(value)) != value:
+                    errors.append(i)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
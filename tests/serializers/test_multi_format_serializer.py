@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from fakeredis import FakeServer
+from fakeredis import FakeStrictRedis
+
+from cachy import CacheManager
+from cachy.serializers import (
+    CompressedSerializer, JsonSerializer, MsgPackSerializer,
+    MultiFormatSerializer, PickleSerializer
+)
+
+
+class MultiFormatSerializerTestCase(TestCase):
+
+    def setUp(self):
+        self.resolved = []
+        self.formats = {1: PickleSerializer(), 2: JsonSerializer()}
+
+    def resolve(self, format_id):
+        self.resolved.append(format_id)
+
+        return self.formats[format_id]
+
+    def test_representations_record_their_format(self):
+        serializer = MultiFormatSerializer(JsonSerializer(), 2, self.resolve)
+
+        payload = serializer.serialize({'foo': 'bar'})
+
+        self.assertEqual(b'\xc1\x02{"foo": "bar"}', payload)
+        self.assertEqual({'foo': 'bar'}, serializer.unserialize(payload))
+        self.assertEqual([], self.resolved)
+
+    def test_representations_are_read_with_the_serializer_which_wrote_them(self):
+        writer = MultiFormatSerializer(PickleSerializer(), 1, self.resolve)
+        reader = MultiFormatSerializer(JsonSerializer(), 2, self.resolve)
+
+        payload = writer.serialize(('foo', 1))
+
+        self.assertEqual(('foo', 1), reader.unserialize(payload))
+        self.assertEqual(('foo', 1), reader.unserialize(payload))
+        self.assertEqual([1], self.resolved)
+
+    def test_representations_without_format_are_read_by_the_legacy_serializer(self):
+        serializer = MultiFormatSerializer(
+            JsonSerializer(), 2, self.resolve, legacy=PickleSerializer()
+        )
+
+        self.assertEqual(('foo', 1), serializer.unserialize(PickleSerializer().serialize(('foo', 1))))
+
+    def test_format_identifiers_must_be_valid(self):
+        self.assertRaises(ValueError, MultiFormatSerializer, JsonSerializer(), 0, self.resolve)
+        self.assertRaises(ValueError, MultiFormatSerializer, JsonSerializer(), 128, self.resolve)
+
+    def _manager(self, server, serializer, **options):
+        store = {
+            'driver': 'redis',
+            'redis_class': FakeStrictRedis,
+            'server': server,
+            'serializer': serializer
+        }
+        store.update(options)
+
+        return CacheManager({'default': 'redis', 'stores': {'redis': store}})
+
+    def test_serializer_can_be_changed_without_flushing(self):
+        server = FakeServer()
+
+        old = self._manager(server, 'pickle')
+        old.put('old', {'value': 1}, 10)
+
+        new = self._manager(server, 'msgpack', format_tagging={'legacy': 'pickle'})
+        self.assertEqual({'value': 1}, new.get('old'))
+
+        new.put('new', {'value': 2}, 10)
+        self.assertIsInstance(new.store()._store._serializer, MultiFormatSerializer)
+
+        # A process still writing pickle, but recording the format, reads both.
+        other = self._manager(server, 'pickle', format_tagging=True)
+        self.assertEqual({'value': 1}, other.get('old'))
+        self.assertEqual({'value': 2}, other.get('new'))
+
+    def test_format_tagging_is_combined_with_compression(self):
+        server = FakeServer()
+        cache = self._manager(
+            server, 'json', format_tagging=True, compression={'threshold': 10}
+        )
+
+        cache.put('foo', 'bar' * 100, 10)
+
+        serializer = cache.store()._store._serializer
+        self.assertIsInstance(serializer, CompressedSerializer)
+        self.assertIsInstance(serializer.get_serializer(), MultiFormatSerializer)
+        self.assertEqual('bar' * 100, cache.get('foo'))
+
+        reader = self._manager(server, 'msgpack', format_tagging=True, compression=True)
+        self.assertEqual('bar' * 100, reader.get('foo'))
+
+    def test_custom_serializers_need_a_format_identifier(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'stores': {'dict': {'driver': 'dict', 'serializer': 'custom', 'format_tagging': True}}
+        })
+
+        # Registered serializers are shared by the managers.
+        self.addCleanup(CacheManager._serializers.pop, 'custom', None)
+
+        cache.register_serializer('custom', MsgPackSerializer())
+        self.assertRaises(RuntimeError, cache.store)
+
+        self.assertRaises(ValueError, cache.register_serializer, 'other', JsonSerializer(), 1)
+
+        cache.register_serializer('custom', MsgPackSerializer(), 100)
+        cache.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', cache.get('foo'))
+        self.assertEqual(100, cache.store()._store._serializer.get_format_id())
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from unittest import TestCase
+from fakeredis import FakeServer
+from fakeredis import FakeAsyncRedis, FakeStrictRedis
+from cachy.stores.async_redis_store import AsyncRedisStore
+
+
+class AsyncRedisStoreTestCase(TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        server = FakeServer()
+        server.connected = True
+        self.store = AsyncRedisStore(
+            prefix='prefix:', redis_class=FakeAsyncRedis, server=server
+        )
+        self.redis = FakeStrictRedis(server=server)
+
+    def tearDown(self):
+        self.redis.flushdb()
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_get_returns_null_when_not_found(self):
+        self.assertIsNone(self.run_async(self.store.get('foo')))
+
+    def test_put_value_into_redis(self):
+        self.run_async(self.store.put('foo', 'bar', 60))
+
+        self.assertEqual(self.store.serialize('bar'), self.redis.get('prefix:foo'))
+        self.assertEqual('bar', self.run_async(self.store.get('foo')))
+
+    def test_many_values(self):
+        self.run_async(self.store.put_many({'foo': 'bar', 'baz': 1}, 60))
+
+        self.assertEqual(
+            {'foo': 'bar', 'baz': 1, 'bop': None},
+            self.run_async(self.store.get_many(['foo', 'baz', 'bop']))
+        )
+
+        self.assertTrue(self.run_async(self.store.forget_many(['foo', 'baz'])))
+        self.assertFalse(self.redis.exists('prefix:foo'))
+
+    def test_forever_and_forget(self):
+        self.run_async(self.store.forever('foo', 'bar'))
+
+        self.assertEqual(-1, self.redis.ttl('prefix:foo'))
+        self.assertTrue(self.run_async(self.store.forget('foo')))
+
+    def test_add_and_pull(self):
+        self.assertTrue(self.run_async(self.store.add('foo', 'bar', 60)))
+        self.assertFalse(self.run_async(self.store.add('foo', 'baz', 60)))
+
+        self.assertEqual('bar', self.run_async(self.store.pull('foo')))
+        self.assertIsNone(self.run_async(self.store.pull('foo')))
+        self.assertFalse(self.redis.exists('prefix:foo'))
+
+    def test_store_requires_the_asyncio_client(self):
+        self.assertRaises(RuntimeError, AsyncRedisStore, redis_class=None)
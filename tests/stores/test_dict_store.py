@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import time
 from unittest import TestCase
 from flexmock import flexmock, flexmock_teardown
 
@@ -56,3 +57,97 @@ class DictStoreTestCase(TestCase):
         store = DictStore()
 
         self.assertEqual('', store.get_prefix())
+
+    def test_many_items_can_be_set_and_retrieved(self):
+        store = DictStore()
+        store.put_many({'foo': 'bar', 'baz': 'boom'}, 10)
+
+        self.assertEqual(
+            {'foo': 'bar', 'baz': 'boom', 'bop': None},
+            store.get_many(['foo', 'baz', 'bop'])
+        )
+
+    def test_many_items_can_be_removed(self):
+        store = DictStore()
+        store.put_many({'foo': 'bar', 'baz': 'boom'}, 10)
+
+        self.assertTrue(store.forget_many(['foo', 'baz']))
+        self.assertEqual({'foo': None, 'baz': None}, store.get_many(['foo', 'baz']))
+
+    def test_least_recently_used_items_are_evicted_when_size_is_reached(self):
+        store = DictStore(size=2)
+        store.put('foo', 'bar', 10)
+        store.put('baz', 'boom', 10)
+        store.put('bop', 'bip', 10)
+
+        self.assertIsNone(store.get('foo'))
+        self.assertEqual('boom', store.get('baz'))
+        self.assertEqual('bip', store.get('bop'))
+
+    def test_read_items_are_not_evicted_first(self):
+        store = DictStore(size=2)
+        store.put('a', 1, 10)
+        store.put('b', 2, 10)
+        store.get('a')
+        store.put('c', 3, 10)
+
+        self.assertEqual(1, store.get('a'))
+        self.assertIsNone(store.get('b'))
+        self.assertEqual(3, store.get('c'))
+
+    def test_overwritten_items_are_not_evicted_first(self):
+        store = DictStore(size=2)
+        store.put('a', 1, 10)
+        store.put('b', 2, 10)
+        store.put('a', 4, 10)
+        store.put('c', 3, 10)
+
+        self.assertEqual(4, store.get('a'))
+        self.assertIsNone(store.get('b'))
+        self.assertEqual(3, store.get('c'))
+
+    def test_items_can_expire_within_a_minute(self):
+        store = DictStore()
+        store.put('foo', 'bar', 0.05 / 60)
+        store.put('baz', 'boom', 10 / 60.)
+
+        time.sleep(0.1)
+
+        self.assertIsNone(store.get('foo'))
+        self.assertEqual('boom', store.get('baz'))
+
+    def test_has_checks_expiration(self):
+        store = DictStore()
+        store.put('foo', 'bar', 10)
+        store.put('baz', 'boom', 0.01 / 60)
+
+        time.sleep(0.02)
+
+        self.assertTrue(store.has('foo'))
+        self.assertFalse(store.has('baz'))
+        self.assertFalse(store.has('bop'))
+        self.assertNotIn('baz', store._storage)
+
+    def test_add_only_stores_missing_items(self):
+        store = DictStore()
+        store.put('baz', 'boom', 0.01 / 60)
+
+        time.sleep(0.02)
+
+        self.assertTrue(store.add('foo', 'bar', 10))
+        self.assertFalse(store.add('foo', 'baz', 10))
+        self.assertTrue(store.add('baz', 'bop', 10))
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual('bop', store.get('baz'))
+
+    def test_pull_retrieves_and_removes_items(self):
+        store = DictStore()
+        store.put('foo', 'bar', 10)
+        store.put('baz', 'boom', 0.01 / 60)
+
+        time.sleep(0.02)
+
+        self.assertEqual('bar', store.pull('foo'))
+        self.assertIsNone(store.pull('foo'))
+        self.assertIsNone(store.pull('baz'))
+        self.assertNotIn('baz', store._storage)
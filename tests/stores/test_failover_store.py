@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+import time
+from unittest import TestCase
+from redis.exceptions import ConnectionError, TimeoutError
+from flexmock import flexmock, flexmock_teardown
+
+from cachy import CacheManager
+from cachy.circuit_breaker import CircuitBreaker
+from cachy.stores import DictStore, FailoverStore, NullStore
+
+
+class FailoverStoreTestCase(TestCase):
+
+    def tearDown(self):
+        flexmock_teardown()
+
+    def test_preferred_store_is_used_while_it_answers(self):
+        primary = DictStore()
+        secondary = DictStore()
+        store = FailoverStore([primary, secondary], ['primary', 'secondary'])
+
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual('bar', primary.get('foo'))
+        self.assertIsNone(secondary.get('foo'))
+        self.assertEqual(2, store.get_stats()['stores']['primary']['served'])
+
+    def test_failing_store_falls_back_to_the_next_one(self):
+        primary = flexmock(DictStore())
+        primary.should_receive('get').and_raise(IOError())
+        secondary = DictStore()
+        secondary.put('foo', 'bar', 10)
+        store = FailoverStore([primary, secondary], min_calls=2, reset_timeout=30)
+
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual('bar', store.get('foo'))
+
+        # The circuit is open, the failing store is not called anymore.
+        primary.should_receive('get').never()
+        self.assertEqual('bar', store.get('foo'))
+
+        stats = store.get_stats()
+        self.assertEqual(CircuitBreaker.OPEN, stats['stores']['0']['state'])
+        self.assertEqual(1, stats['stores']['0']['rejected'])
+        self.assertEqual(3, stats['stores']['1']['served'])
+
+    def test_redis_connection_errors_are_failures(self):
+        primary = flexmock(DictStore())
+        primary.should_receive('get').and_raise(ConnectionError())
+        primary.should_receive('put').and_raise(TimeoutError())
+        secondary = DictStore()
+        store = FailoverStore([primary, secondary])
+
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual(2, store.get_stats()['stores']['0']['failures'])
+
+    def test_other_errors_are_raised_without_failing_over(self):
+        primary = flexmock(DictStore())
+        primary.should_receive('put').and_raise(TypeError())
+        secondary = flexmock(DictStore())
+        secondary.should_receive('put').never()
+        store = FailoverStore([primary, secondary], min_calls=1)
+
+        self.assertRaises(TypeError, store.put, 'foo', object(), 10)
+
+        stats = store.get_stats()
+        self.assertEqual(CircuitBreaker.CLOSED, stats['stores']['0']['state'])
+        self.assertEqual(0, stats['stores']['0']['failures'])
+        self.assertEqual(0, stats['unavailable'])
+
+    def test_slow_store_is_skipped(self):
+        primary = DictStore()
+        secondary = DictStore()
+        store = FailoverStore([primary, secondary], latency=0.01, min_calls=1)
+        put = primary.put
+
+        def slow_put(key, value, minutes):
+            time.sleep(0.05)
+            put(key, value, minutes)
+
+        primary.put = slow_put
+
+        store.put('foo', 'bar', 10)
+        store.put('baz', 'boom', 10)
+
+        self.assertEqual('bar', primary.get('foo'))
+        self.assertIsNone(primary.get('baz'))
+        self.assertEqual('boom', secondary.get('baz'))
+
+    def test_unavailable_stores_behave_as_an_empty_cache(self):
+        primary = flexmock(DictStore())
+        primary.should_receive('get').and_raise(IOError())
+        primary.should_receive('get_many').and_raise(IOError())
+        primary.should_receive('add').and_raise(IOError())
+        primary.should_receive('forget').and_raise(IOError())
+        store = FailoverStore([primary])
+
+        self.assertIsNone(store.get('foo'))
+        self.assertEqual({'foo': None, 'bar': None}, store.get_many(['foo', 'bar']))
+        self.assertFalse(store.add('foo', 'bar', 10))
+        self.assertFalse(store.forget('foo'))
+        self.assertEqual(4, store.get_stats()['unavailable'])
+
+    def test_removals_go_to_every_available_store(self):
+        primary = DictStore()
+        secondary = DictStore()
+        primary.put('foo', 'bar', 10)
+        secondary.put('foo', 'baz', 10)
+        store = FailoverStore([primary, secondary])
+
+        self.assertTrue(store.forget('foo'))
+
+        self.assertIsNone(primary.get('foo'))
+        self.assertIsNone(secondary.get('foo'))
+
+    def test_changes_missed_during_an_outage_are_removed_on_recovery(self):
+        primary = flexmock(DictStore())
+        primary.put('foo', 'bar', 10)
+        primary.put('baz', 'boom', 10)
+        secondary = DictStore()
+        store = FailoverStore([primary, secondary], min_calls=1, reset_timeout=0.05)
+
+        primary.should_receive('get').and_raise(IOError())
+        self.assertIsNone(store.get('foo'))
+
+        # The circuit is open, the changes do not reach the primary store.
+        store.forget('foo')
+        store.put('baz', 'bop', 10)
+        self.assertTrue(primary.has('foo'))
+
+        flexmock_teardown()
+        time.sleep(0.1)
+
+        self.assertIsNone(store.get('foo'))
+        self.assertIsNone(store.get('baz'))
+        self.assertIsNone(primary.get('foo'))
+        self.assertEqual(CircuitBreaker.CLOSED, store.get_stats()['stores']['0']['state'])
+
+    def test_store_missing_too_many_changes_is_flushed_on_recovery(self):
+        primary = flexmock(DictStore())
+        primary.put('foo', 'bar', 10)
+        primary.put('bop', 'bip', 10)
+        store = FailoverStore([primary, DictStore()], max_missed=1,
+                              min_calls=1, reset_timeout=0.05)
+
+        primary.should_receive('get').and_raise(IOError())
+        store.get('foo')
+        store.forget_many(['baz', 'boom'])
+
+        flexmock_teardown()
+        time.sleep(0.1)
+
+        self.assertIsNone(store.get('foo'))
+        self.assertIsNone(primary.get('bop'))
+
+    def test_names_must_match_the_stores(self):
+        self.assertRaises(ValueError, FailoverStore, [])
+        self.assertRaises(ValueError, FailoverStore, [DictStore()], ['foo', 'bar'])
+
+    def test_manager_creates_failover_driver(self):
+        cache = CacheManager({
+            'default': 'failover',
+            'stores': {
+                'local': {
+                    'driver': 'dict'
+                },
+                'null': {
+                    'driver': 'null'
+                },
+                'failover': {
+                    'driver': 'failover',
+                    'stores': ['local', 'null'],
+                    'circuit_breaker': {'failure_rate': 0.2, 'reset_timeout': 10}
+                }
+            }
+        })
+
+        store = cache.store().get_store()
+        self.assertIsInstance(store, FailoverStore)
+        self.assertIs(cache.store('local').get_store(), store.get_store())
+        self.assertIsInstance(store.get_stores()[1], NullStore)
+
+        cache.put('foo', 'bar', 10)
+        self.assertEqual('bar', cache.get('foo'))
+        self.assertEqual('bar', cache.store('local').get('foo'))
+        self.assertEqual(
+            ['local', 'null'],
+            sorted(store.get_stats()['stores'])
+        )
@@ -5,6 +5,7 @@ import os
 import tempfile
 import hashlib
 import shutil
+import time
 
 from unittest import TestCase
 from flexmock import flexmock, flexmock_teardown
@@ -122,6 +123,25 @@ class DictStoreTestCase(TestCase):
 
         store.forever('foo', 'bar')
 
+    def test_sub_minute_expirations_are_rounded_up_to_the_second(self):
+        store = FileStore(self._dir)
+        flexmock(time).should_receive('time').and_return(1000000000.2)
+
+        self.assertEqual(1000000002, store._expiration(1.5 / 60))
+
+    def test_has_only_reads_the_expiration(self):
+        store = flexmock(FileStore(self._dir))
+        store.put('foo', 'bar', 10)
+        store.put('baz', 'boom', 1)
+        store.should_receive('unserialize').never()
+
+        now = time.time()
+        flexmock(time).should_receive('time').and_return(now + 120)
+
+        self.assertTrue(store.has('foo'))
+        self.assertFalse(store.has('baz'))
+        self.assertFalse(store.has('bop'))
+
     def test_forget_with_missing_file(self):
         store = FileStore(self._dir)
 
@@ -172,3 +192,79 @@ class DictStoreTestCase(TestCase):
         full_dir = os.path.join(self._dir, md5[0:2], md5[2:4])
 
         assert os.path.exists(full_dir)
+
+    def test_add_creates_file_exclusively(self):
+        store = FileStore(self._dir)
+
+        self.assertTrue(store.add('foo', 'bar', 10))
+        self.assertFalse(store.add('foo', 'baz', 10))
+        self.assertEqual('bar', store.get('foo'))
+
+    def test_add_replaces_expired_file(self):
+        store = FileStore(self._dir)
+        store.put('foo', 'bar', 10)
+        now = time.time()
+
+        flexmock(time).should_receive('time').and_return(now + 11 * 60)
+
+        self.assertTrue(store.add('foo', 'baz', 10))
+
+        flexmock_teardown()
+
+        self.assertEqual('baz', store.get('foo'))
+
+    def test_add_never_removes_a_file_created_concurrently(self):
+        store = FileStore(self._dir)
+        other = FileStore(self._dir)
+        store.put('foo', 'bar', 10)
+        now = time.time()
+        rename = os.rename
+        renamed = []
+
+        def rename_then_add(src, dst):
+            rename(src, dst)
+
+            # Another process replacing the expired file meanwhile.
+            if not renamed:
+                renamed.append(dst)
+                other.put('foo', 'bop', 30)
+
+        flexmock(time).should_receive('time').and_return(now + 11 * 60)
+        flexmock(os).should_receive('rename').replace_with(rename_then_add)
+
+        self.assertFalse(store.add('foo', 'baz', 10))
+
+        flexmock_teardown()
+
+        self.assertEqual('bop', store.get('foo'))
+        self.assertEqual(1, len([
+            name for _, _, files in os.walk(self._dir) for name in files
+        ]))
+
+    def test_add_keeps_files_being_written(self):
+        store = FileStore(self._dir)
+        path = store._path('foo')
+        store._create_cache_directory(path)
+        open(path, 'wb').close()
+
+        self.assertFalse(store.add('foo', 'baz', 10))
+        self.assertTrue(os.path.exists(path))
+
+    def test_pull_retrieves_and_removes_file(self):
+        store = FileStore(self._dir)
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', store.pull('foo'))
+        self.assertIsNone(store.pull('foo'))
+        self.assertEqual([], [
+            name for _, _, files in os.walk(self._dir) for name in files
+        ])
+
+    def test_pull_ignores_files_being_written(self):
+        store = FileStore(self._dir)
+        path = store._path('foo')
+        store._create_cache_directory(path)
+
+        open(path, 'wb').close()
+
+        self.assertIsNone(store.pull('foo'))
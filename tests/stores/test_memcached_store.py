@@ -71,5 +71,32 @@ class RedisStoreTestCase(TestCase):
 
         self.assertIsNone(mc.get('prefix:foo'))
 
+    def test_get_many(self):
+        mc = self.get_memcached()
+        mc.set('prefix:foo', 'bar')
+        mc.set('prefix:baz', 1)
+
+        self.assertEqual(
+            {'foo': 'bar', 'baz': 1, 'bop': None},
+            self.store.get_many(['foo', 'baz', 'bop'])
+        )
+
+    def test_put_many(self):
+        mc = self.get_memcached()
+        self.store.put_many({'foo': 'bar', 'baz': 1}, 60)
+
+        self.assertEqual('bar', mc.get('prefix:foo'))
+        self.assertEqual(1, mc.get('prefix:baz'))
+
+    def test_forget_many(self):
+        mc = self.get_memcached()
+        mc.set('prefix:foo', 'bar')
+        mc.set('prefix:baz', 'boom')
+
+        self.store.forget_many(['foo', 'baz'])
+
+        self.assertIsNone(mc.get('prefix:foo'))
+        self.assertIsNone(mc.get('prefix:baz'))
+
     def get_memcached(self):
         return self.store._memcache
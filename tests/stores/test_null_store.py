@@ -10,3 +10,13 @@ class NullStoreTestCase(TestCase):
         store = NullStore()
         store.put('foo', 'bar', 10)
         self.assertIsNone(store.get('foo'))
+
+    def test_many_items_cannot_be_cached(self):
+        store = NullStore()
+        store.put_many({'foo': 'bar'}, 10)
+        self.assertEqual({'foo': None}, store.get_many(['foo']))
+
+    def test_items_cannot_be_pulled(self):
+        store = NullStore()
+        self.assertTrue(store.add('foo', 'bar', 10))
+        self.assertIsNone(store.pull('foo'))
@@ -7,6 +7,7 @@ from unittest import TestCase
 from flexmock import flexmock, flexmock_teardown
 from fakeredis import FakeServer
 from fakeredis import FakeStrictRedis
+from cachy import Repository
 from cachy.stores import RedisStore
 
 
@@ -45,6 +46,15 @@ class RedisStoreTestCase(TestCase):
         self.assertEqual(self.store.serialize('bar'), self.redis.get('prefix:foo'))
         self.assertEqual(60., round(math.ceil(float(self.redis.ttl('prefix:foo')) / 60)))
 
+    def test_put_value_for_less_than_a_minute(self):
+        self.store.put('foo', 'bar', 0.1)
+
+        self.assertTrue(5000 < self.redis.pttl('prefix:foo') <= 6000)
+
+        self.store.put_many({'baz': 'boom'}, 1.5 / 60)
+
+        self.assertTrue(0 < self.redis.pttl('prefix:baz') <= 1500)
+
     def test_put_numeric_value_into_redis(self):
         self.store.put('foo', 1, 60)
 
@@ -75,3 +85,148 @@ class RedisStoreTestCase(TestCase):
         self.store.forget('foo')
 
         self.assertFalse(self.redis.exists('prefix:foo'))
+
+    def test_none_values_can_be_cached(self):
+        repo = Repository(self.store)
+        repo.put('foo', None, 10)
+
+        self.assertTrue(repo.has('foo'))
+        self.assertIsNone(repo.remember('foo', 10, lambda: 'bar'))
+
+    def test_has_uses_exists(self):
+        self.redis.set('prefix:foo', self.store.serialize('bar'))
+        flexmock(self.store._redis).should_receive('get').never()
+
+        self.assertTrue(self.store.has('foo'))
+        self.assertFalse(self.store.has('bar'))
+
+    def test_get_many_uses_a_single_mget(self):
+        self.redis.set('prefix:foo', self.store.serialize('bar'))
+        self.redis.set('prefix:baz', self.store.serialize(1))
+
+        self.assertEqual(
+            {'foo': 'bar', 'baz': 1, 'bop': None},
+            self.store.get_many(['foo', 'baz', 'bop'])
+        )
+
+    def test_put_many_values_into_redis(self):
+        self.store.put_many({'foo': 'bar', 'baz': 1}, 60)
+
+        self.assertEqual(self.store.serialize('bar'), self.redis.get('prefix:foo'))
+        self.assertEqual(self.store.serialize(1), self.redis.get('prefix:baz'))
+        self.assertEqual(60., round(math.ceil(float(self.redis.ttl('prefix:baz')) / 60)))
+
+    def test_forget_many(self):
+        self.redis.set('prefix:foo', 'bar')
+        self.redis.set('prefix:baz', 'boom')
+
+        self.assertTrue(self.store.forget_many(['foo', 'baz']))
+
+        self.assertFalse(self.redis.exists('prefix:foo'))
+        self.assertFalse(self.redis.exists('prefix:baz'))
+
+    def test_add_only_sets_missing_keys(self):
+        self.assertTrue(self.store.add('foo', 'bar', 1 / 60.))
+        self.assertFalse(self.store.add('foo', 'baz', 1 / 60.))
+
+        self.assertEqual(self.store.serialize('bar'), self.redis.get('prefix:foo'))
+        self.assertTrue(0 < self.redis.pttl('prefix:foo') <= 2000)
+
+    def test_pull_gets_and_deletes_value(self):
+        self.redis.set('prefix:foo', self.store.serialize('bar'))
+
+        self.assertEqual('bar', self.store.pull('foo'))
+        self.assertIsNone(self.store.pull('foo'))
+        self.assertFalse(self.redis.exists('prefix:foo'))
+
+    def test_pull_falls_back_to_script_without_getdel(self):
+        self.redis.set('prefix:foo', self.store.serialize('bar'))
+        flexmock(self.store._redis).should_receive('getdel')\
+            .once().and_raise(redis.ResponseError("ERR unknown command 'getdel'"))
+
+        self.assertEqual('bar', self.store.pull('foo'))
+        self.assertIsNone(self.store.pull('foo'))
+        self.assertFalse(self.redis.exists('prefix:foo'))
+
+
+class RedisStoreReplicasTestCase(TestCase):
+
+    def setUp(self):
+        self.servers = [FakeServer(), FakeServer(), FakeServer()]
+        self.primary, self.first, self.second = [
+            FakeStrictRedis(server=server) for server in self.servers
+        ]
+
+    def tearDown(self):
+        flexmock_teardown()
+
+    def _store(self, **kwargs):
+        return RedisStore(
+            redis_class=FakeStrictRedis,
+            server=self.servers[0],
+            replicas=[{'server': self.servers[1]}, {'server': self.servers[2]}],
+            **kwargs
+        )
+
+    def test_reads_go_to_replicas_and_writes_to_the_primary(self):
+        store = self._store()
+        self.first.set('foo', store.serialize('first'))
+        self.second.set('foo', store.serialize('second'))
+
+        store.put('bar', 'baz', 10)
+
+        self.assertEqual(store.serialize('baz'), self.primary.get('bar'))
+        self.assertIsNone(self.first.get('bar'))
+
+        self.assertEqual(
+            ['first', 'first', 'second'],
+            sorted([store.get('foo') for _ in range(3)])
+        )
+        self.assertTrue(store.has('foo'))
+        self.assertIn(store.get_many(['foo'])['foo'], ['first', 'second'])
+
+        stats = store.get_replica_stats()
+        self.assertEqual(5, sum(replica['reads'] for replica in stats['replicas']))
+        self.assertEqual(0, stats['fallbacks'])
+
+    def test_recently_written_keys_are_read_from_the_primary(self):
+        store = self._store(read_your_writes=10)
+
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual({'foo': 'bar', 'baz': None}, store.get_many(['foo', 'baz']))
+        self.assertEqual(0, sum(r['reads'] for r in store.get_replica_stats()['replicas']))
+
+        store._written['foo'] = 0
+
+        self.assertIsNone(store.get('foo'))
+
+    def test_failing_replicas_are_ejected(self):
+        store = self._store(replica_breaker={'min_calls': 1, 'reset_timeout': 30})
+        self.primary.set('foo', store.serialize('primary'))
+        self.second.set('foo', store.serialize('second'))
+        flexmock(store._replicas._replicas[0].client).should_receive('get')\
+            .once().and_raise(redis.ConnectionError())
+
+        self.assertEqual(
+            ['primary', 'second', 'second', 'second'],
+            sorted([store.get('foo') for _ in range(4)])
+        )
+
+        stats = store.get_replica_stats()
+        self.assertEqual('open', stats['replicas'][0]['state'])
+        self.assertEqual('closed', stats['replicas'][1]['state'])
+        self.assertEqual(1, stats['fallbacks'])
+
+    def test_fastest_replica_is_preferred(self):
+        store = self._store(replica_selection='latency')
+        self.first.set('foo', store.serialize('first'))
+        self.second.set('foo', store.serialize('second'))
+        store._replicas._replicas[0].latency = 0.5
+        store._replicas._replicas[1].latency = 0.001
+
+        self.assertEqual('second', store.get('foo'))
+
+    def test_unknown_replica_selection_is_rejected(self):
+        self.assertRaises(ValueError, self._store, replica_selection='random')
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from unittest import TestCase
+from fakeredis import FakeServer
+from fakeredis import FakeStrictRedis
+
+from cachy import CacheManager
+from cachy.redis_tagged_cache import ShardedRedisTaggedCache
+from cachy.stores import DictStore, RedisStore, ShardedStore
+
+
+class ShardedStoreTestCase(TestCase):
+
+    def setUp(self):
+        self.shards = [DictStore(), DictStore(), DictStore()]
+        self.store = ShardedStore(self.shards, ['a', 'b', 'c'])
+        self.keys = ['key:%d' % i for i in range(30)]
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_items_are_stored_on_their_shard_only(self):
+        for key in self.keys:
+            self.store.put(key, key, 10)
+
+        for key in self.keys:
+            shard = self.store.get_shard(key)
+
+            self.assertEqual(key, self.store.get(key))
+            self.assertEqual(key, shard.get(key))
+            for other in self.shards:
+                if other is not shard:
+                    self.assertIsNone(other.get(key))
+
+        self.assertTrue(all(shard._storage for shard in self.shards))
+
+    def test_multi_key_operations_are_split_per_shard(self):
+        self.store.put_many({key: key for key in self.keys}, 10)
+
+        values = self.store.get_many(self.keys + ['missing'])
+
+        self.assertEqual(dict({key: key for key in self.keys}, missing=None), values)
+        for key in self.keys:
+            self.assertEqual(key, self.store.get_shard(key).get(key))
+
+        self.assertTrue(self.store.forget_many(self.keys[:10]))
+        for key in self.keys[:10]:
+            self.assertIsNone(self.store.get(key))
+
+    def test_shards_are_called_in_parallel(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        for shard in self.shards:
+            get_many = shard.get_many
+
+            def waiting_get_many(keys, get_many=get_many):
+                # Each call waits for the others.
+                barrier.wait()
+
+                return get_many(keys)
+
+            shard.get_many = waiting_get_many
+
+        self.assertEqual(len(self.keys), len(self.store.get_many(self.keys)))
+
+    def test_tag_identifiers_are_routed_deterministically(self):
+        self.store.tags('users').put('foo', 'bar', 10)
+
+        other = ShardedStore(self.shards, ['a', 'b', 'c'])
+        tag_key = 'tag:users:key'
+
+        self.assertIsNotNone(self.store.get_shard(tag_key).get(tag_key))
+        self.assertIs(self.store.get_shard(tag_key), other.get_shard(tag_key))
+        self.assertEqual('bar', other.tags('users').get('foo'))
+
+    def test_flushing_a_tag_removes_its_items_stored_forever_from_redis_shards(self):
+        redis = [FakeStrictRedis(server=FakeServer()) for _ in range(3)]
+        shards = [RedisStore(prefix='prefix:', redis_class=lambda **kwargs: r) for r in redis]
+        store = ShardedStore(shards, ['a', 'b', 'c'])
+        tagged = store.tags('users', 'people')
+
+        for key in self.keys:
+            tagged.forever(key, key)
+
+        self.assertEqual('key:1', store.tags('users', 'people').get('key:1'))
+        self.assertTrue(all(r.dbsize() > 2 for r in redis))
+
+        tagged.flush()
+
+        self.assertIsNone(store.tags('users', 'people').get('key:1'))
+        for r in redis:
+            # Only the new tag identifiers are left.
+            self.assertEqual([], [
+                key for key in r.keys() if not key.startswith(b'prefix:tag:')
+            ])
+
+        store.close()
+
+    def test_tags_of_other_shards_are_not_tracked(self):
+        self.assertNotIsInstance(self.store.tags('users'), ShardedRedisTaggedCache)
+
+    def test_manager_creates_sharded_driver(self):
+        stores = {
+            'shard-%d' % i: {
+                'driver': 'redis',
+                'redis_class': FakeStrictRedis,
+                'server': FakeServer()
+            }
+            for i in range(3)
+        }
+        stores['sharded'] = {
+            'driver': 'sharded',
+            'stores': ['shard-0', 'shard-1', 'shard-2'],
+            'weights': {'shard-0': 2},
+            'vnodes': 100
+        }
+        cache = CacheManager({'default': 'sharded', 'stores': stores})
+
+        store = cache.store().get_store()
+        self.assertIsInstance(store, ShardedStore)
+        self.assertEqual(2, store.get_ring().get_weight('shard-0'))
+        self.assertIsInstance(store.get_shards()['shard-1'], RedisStore)
+
+        cache.put_many({key: key for key in self.keys}, 10)
+
+        self.assertEqual({key: key for key in self.keys}, cache.get_many(self.keys))
+        for key in self.keys:
+            name = store.get_ring().get_node(key)
+            self.assertEqual(key, cache.store(name).get(key))
+
+        cache.close()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from flexmock import flexmock, flexmock_teardown
+
+from cachy.stores import DictStore, TieredStore
+
+
+class TieredStoreTestCase(TestCase):
+
+    def tearDown(self):
+        flexmock_teardown()
+
+    def test_items_are_written_to_both_stores(self):
+        remote = DictStore()
+        store = TieredStore(remote)
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', remote.get('foo'))
+        self.assertEqual('bar', store.get_local_store().get('foo'))
+
+    def test_local_store_is_checked_first(self):
+        remote = flexmock(DictStore())
+        store = TieredStore(remote)
+        store.put('foo', 'bar', 10)
+
+        remote.should_receive('get').never()
+
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual(
+            {'local_hits': 1, 'remote_hits': 0, 'misses': 0},
+            store.get_stats()
+        )
+
+    def test_remote_items_are_kept_locally(self):
+        remote = DictStore()
+        remote.put('foo', 'bar', 10)
+        store = TieredStore(remote)
+
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual('bar', store.get('foo'))
+        self.assertIsNone(store.get('baz'))
+        self.assertEqual(
+            {'local_hits': 1, 'remote_hits': 1, 'misses': 1},
+            store.get_stats()
+        )
+
+        store.reset_stats()
+
+        self.assertEqual(
+            {'local_hits': 0, 'remote_hits': 0, 'misses': 0},
+            store.get_stats()
+        )
+
+    def test_local_lifetime_is_capped(self):
+        local = flexmock(DictStore())
+        store = TieredStore(DictStore(), local_minutes=2)
+        store._local = local
+
+        local.should_receive('put').with_args('foo', 'bar', 2).twice()
+        local.should_receive('put').with_args('baz', 'boom', 1).once()
+
+        store.put('foo', 'bar', 10)
+        store.forever('foo', 'bar')
+        store.put('baz', 'boom', 1)
+
+    def test_local_store_is_size_bounded(self):
+        store = TieredStore(DictStore(), local_size=1)
+        store.put('foo', 'bar', 10)
+        store.put('baz', 'boom', 10)
+
+        self.assertIsNone(store.get_local_store().get('foo'))
+        self.assertEqual('bar', store.get('foo'))
+
+    def test_many_items_are_read_from_both_stores(self):
+        remote = DictStore()
+        remote.put('baz', 'boom', 10)
+        store = TieredStore(remote)
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual(
+            {'foo': 'bar', 'baz': 'boom', 'bop': None},
+            store.get_many(['foo', 'baz', 'bop'])
+        )
+        self.assertEqual('boom', store.get_local_store().get('baz'))
+        self.assertEqual(
+            {'local_hits': 1, 'remote_hits': 1, 'misses': 1},
+            store.get_stats()
+        )
+
+    def test_items_are_removed_from_both_stores(self):
+        remote = DictStore()
+        store = TieredStore(remote)
+        store.put_many({'foo': 'bar', 'baz': 'boom', 'bop': 'bip'}, 10)
+
+        self.assertTrue(store.forget('foo'))
+        self.assertTrue(store.forget_many(['baz']))
+        self.assertIsNone(store.get('foo'))
+        self.assertIsNone(store.get('baz'))
+
+        store.flush()
+
+        self.assertIsNone(remote.get('bop'))
+        self.assertIsNone(store.get_local_store().get('bop'))
+
+    def test_incremented_items_are_removed_locally(self):
+        remote = DictStore()
+        store = TieredStore(remote)
+        store.put('foo', 1, 10)
+        store.increment('foo', 2)
+
+        self.assertEqual(3, store.get('foo'))
+
+        store.decrement('foo')
+
+        self.assertEqual(2, store.get('foo'))
+
+    def test_locks_and_prefix_come_from_remote_store(self):
+        remote = flexmock(DictStore())
+        remote.should_receive('get_prefix').and_return('prefix:')
+        remote.should_receive('lock').with_args('foo', 10, None).once().and_return('lock')
+        store = TieredStore(remote)
+
+        self.assertEqual('prefix:', store.get_prefix())
+        self.assertEqual('lock', store.lock('foo', 10))
+
+    def test_add_checks_remote_store(self):
+        remote = DictStore()
+        remote.put('foo', 'bar', 10)
+        store = TieredStore(remote)
+
+        self.assertFalse(store.add('foo', 'baz', 10))
+        self.assertTrue(store.add('bop', 'bip', 10))
+        self.assertEqual('bar', store.get('foo'))
+        self.assertEqual('bip', store.get_local_store().get('bop'))
+
+    def test_pull_removes_items_from_both_stores(self):
+        remote = DictStore()
+        store = TieredStore(remote)
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', store.pull('foo'))
+        self.assertIsNone(remote.get('foo'))
+        self.assertIsNone(store.get_local_store().get('foo'))
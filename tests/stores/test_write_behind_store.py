@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+from flexmock import flexmock, flexmock_teardown
+from fakeredis import FakeServer
+from fakeredis import FakeStrictRedis
+
+from cachy import CacheManager, Repository
+from cachy.envelope import Envelope
+from cachy.serializers import PickleSerializer
+from cachy.stores import DictStore, FileStore, RedisStore, WriteBehindStore
+
+
+class WriteBehindStoreTestCase(TestCase):
+
+    def tearDown(self):
+        flexmock_teardown()
+
+    def test_writes_are_applied_in_batches(self):
+        remote = flexmock(DictStore())
+        remote.should_call('put_many').with_args({'foo': 'bar', 'baz': 'boom'}, 10).once()
+        remote.should_call('forget_many').with_args(['bop']).once()
+        store = WriteBehindStore(remote, batch_size=10, interval=10)
+
+        store.put('foo', 'bar', 10)
+        store.put_many({'baz': 'boom'}, 10)
+        store.forget('bop')
+        store.drain()
+
+        self.assertEqual('bar', remote.get('foo'))
+        self.assertEqual('boom', remote.get('baz'))
+        self.assertEqual(1, store.get_stats()['batches'])
+        self.assertEqual(3, store.get_stats()['written'])
+
+        store.close()
+
+    def test_pending_writes_are_read_back(self):
+        remote = DictStore()
+        remote.put('bop', 'bip', 10)
+        store = WriteBehindStore(remote, interval=10)
+
+        store.put('foo', 'bar', 10)
+        store.forget('bop')
+
+        self.assertIsNone(remote.get('foo'))
+        self.assertEqual('bar', store.get('foo'))
+        self.assertTrue(store.has('foo'))
+        self.assertIsNone(store.get('bop'))
+        self.assertFalse(store.has('bop'))
+        self.assertEqual({'foo': 'bar', 'bop': None}, store.get_many(['foo', 'bop']))
+        self.assertEqual(2, store.get_stats()['pending'])
+
+        store.close()
+
+        self.assertEqual('bar', remote.get('foo'))
+        self.assertIsNone(remote.get('bop'))
+        self.assertEqual(0, store.get_stats()['pending'])
+
+    def test_only_the_last_operation_on_a_key_is_applied(self):
+        remote = flexmock(DictStore())
+        remote.should_receive('put_many').never()
+        store = WriteBehindStore(remote, interval=10)
+
+        store.put('foo', 'bar', 10)
+        store.put('foo', 'baz', 10)
+        store.forget('foo')
+        store.close()
+
+        self.assertEqual(1, store.get_stats()['written'])
+
+    def test_values_are_buffered_as_snapshots(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        remote = FileStore(directory)
+        store = WriteBehindStore(remote, interval=10)
+
+        value = [1]
+        store.put('foo', value, 10)
+        value.append(2)
+
+        read = store.get('foo')
+        read.append(3)
+
+        self.assertEqual([1], store.get('foo'))
+        self.assertEqual({'foo': [1]}, store.get_many(['foo']))
+
+        store.drain()
+
+        self.assertEqual([1], remote.get('foo'))
+
+        store.close()
+
+    def test_payload_size_is_reported_to_hooks(self):
+        store = WriteBehindStore(DictStore(), interval=10)
+        repo = Repository(store)
+        after = []
+        repo.after(after.append)
+
+        repo.put('foo', 'bar', 10)
+
+        self.assertEqual(len(store.serialize(Envelope.wrap('bar'))), after[0].size)
+
+        store.close()
+
+    def test_writers_wait_when_the_buffer_is_full(self):
+        remote = DictStore()
+        store = WriteBehindStore(remote, batch_size=1, interval=0, max_pending=1)
+        applying = threading.Event()
+        release = threading.Event()
+        original = remote.put_many
+
+        def put_many(values, minutes):
+            applying.set()
+            release.wait()
+            original(values, minutes)
+
+        remote.put_many = put_many
+
+        store.put('foo', 'bar', 10)
+        applying.wait()
+        store.put('baz', 'boom', 10)
+
+        writer = threading.Thread(target=store.put, args=('bop', 'bip', 10))
+        writer.start()
+        writer.join(0.1)
+
+        self.assertTrue(writer.is_alive())
+
+        release.set()
+        writer.join()
+        store.close()
+
+        self.assertEqual(1, store.get_stats()['blocked'])
+        self.assertEqual('bip', remote.get('bop'))
+
+    def test_operations_needing_the_store_apply_pending_writes_first(self):
+        remote = DictStore()
+        store = WriteBehindStore(remote, interval=10)
+
+        store.put('foo', 1, 10)
+        self.assertEqual(2, store.increment('foo'))
+
+        store.forget('foo')
+        self.assertTrue(store.add('foo', 'bar', 10))
+        self.assertEqual('bar', store.pull('foo'))
+
+        store.close()
+
+    def test_snapshots_are_written_without_being_serialized_again(self):
+        server = FakeServer()
+        redis = FakeStrictRedis(server=server)
+        remote = RedisStore(redis_class=FakeStrictRedis, server=server)
+        serializer = flexmock(PickleSerializer())
+        serializer.should_call('serialize').twice()
+        serializer.should_receive('unserialize').never()
+        remote.set_serializer(serializer)
+        store = WriteBehindStore(remote, interval=10)
+
+        store.put('foo', 'bar', 10)
+        store.forever('baz', 'boom')
+        store.drain()
+
+        self.assertEqual(PickleSerializer().serialize('bar'), redis.get('foo'))
+        self.assertEqual(PickleSerializer().serialize('boom'), redis.get('baz'))
+
+        store.close()
+
+    def test_failed_writes_are_counted(self):
+        remote = flexmock(DictStore())
+        remote.should_receive('put_many').and_raise(IOError())
+        store = WriteBehindStore(remote)
+
+        store.put('foo', 'bar', 10)
+        store.close()
+
+        self.assertEqual(1, store.get_stats()['errors'])
+
+    def test_background_thread_keeps_applying_after_a_failing_entry(self):
+        remote = DictStore()
+        store = WriteBehindStore(remote, max_pending=1, interval=0)
+
+        store._enqueue('foo', (WriteBehindStore.PUT, b'not a payload', 10))
+        store.drain()
+
+        self.assertEqual(1, store.get_stats()['errors'])
+
+        # Writers wait for the background thread once the buffer is full.
+        store.put('bar', 'baz', 10)
+        store.put('bop', 'bip', 10)
+        store.drain()
+
+        self.assertTrue(store._thread.is_alive())
+        self.assertIsNone(remote.get('foo'))
+        self.assertEqual('baz', remote.get('bar'))
+        self.assertEqual('bip', remote.get('bop'))
+
+        store.close()
+
+    def test_background_thread_survives_unexpected_errors(self):
+        remote = DictStore()
+        store = flexmock(WriteBehindStore(remote, max_pending=1, interval=0))
+        store.should_receive('_apply').and_raise(RuntimeError()).once()
+
+        store.put('foo', 'bar', 10)
+        store.drain()
+
+        self.assertEqual(1, store.get_stats()['errors'])
+
+        flexmock_teardown()
+        store.put('bar', 'baz', 10)
+        store.put('bop', 'bip', 10)
+        store.drain()
+
+        self.assertTrue(store._thread.is_alive())
+        self.assertEqual('baz', remote.get('bar'))
+        self.assertEqual('bip', remote.get('bop'))
+
+        store.close()
+
+    def test_writes_after_close_are_synchronous(self):
+        remote = DictStore()
+        store = WriteBehindStore(remote)
+        store.close()
+
+        store.put('foo', 'bar', 10)
+
+        self.assertEqual('bar', remote.get('foo'))
+
+    def test_manager_enables_write_behind_for_redis(self):
+        cache = CacheManager({
+            'default': 'redis',
+            'stores': {
+                'redis': {
+                    'driver': 'redis',
+                    'redis_class': FakeStrictRedis,
+                    'server': FakeServer(),
+                    'write_behind': {'interval': 10}
+                }
+            }
+        })
+
+        store = cache.store().get_store()
+        self.assertIsInstance(store, WriteBehindStore)
+        self.assertIsInstance(store.get_store(), RedisStore)
+
+        cache.put('foo', 'bar', 10)
+        self.assertEqual('bar', cache.get('foo'))
+        self.assertIsNone(store.get_store().get('foo'))
+
+        cache.close()
+
+        self.assertEqual('bar', store.get_store().get('foo'))
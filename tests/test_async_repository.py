@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+from unittest import TestCase
+
+from cachy import CacheManager
+from cachy.async_repository import AsyncRepository
+from cachy.stores import DictStore
+from cachy.stores.async_redis_store import AsyncRedisStore
+from cachy.stores.executor_store import ExecutorStore
+
+
+class AsyncRepositoryTestCase(TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.repo = AsyncRepository(ExecutorStore(DictStore()))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_items_can_be_set_and_retrieved(self):
+        self.run_async(self.repo.put('foo', 'bar', 10))
+
+        self.assertEqual('bar', self.run_async(self.repo.get('foo')))
+        self.assertTrue(self.run_async(self.repo.has('foo')))
+        self.assertEqual('baz', self.run_async(self.repo.get('bar', 'baz')))
+
+    def test_add_and_pull(self):
+        self.assertTrue(self.run_async(self.repo.add('foo', 'bar', 10)))
+        self.assertFalse(self.run_async(self.repo.add('foo', 'baz', 10)))
+
+        self.assertEqual('bar', self.run_async(self.repo.pull('foo')))
+        self.assertEqual('baz', self.run_async(self.repo.pull('foo', 'baz')))
+
+    def test_many_items_can_be_set_and_retrieved(self):
+        self.run_async(self.repo.put_many({'foo': 'bar', 'baz': 'boom'}, 10))
+
+        self.assertEqual(
+            {'foo': 'bar', 'baz': 'boom', 'bop': None},
+            self.run_async(self.repo.get_many(['foo', 'baz', 'bop']))
+        )
+
+        self.run_async(self.repo.forget_many(['foo', 'baz']))
+
+        self.assertIsNone(self.run_async(self.repo.get('foo')))
+
+    def test_remember_accepts_coroutine_functions(self):
+        async def compute():
+            return 'bar'
+
+        self.assertEqual('bar', self.run_async(self.repo.remember('foo', 10, compute)))
+        self.assertEqual('bar', self.run_async(self.repo.get('foo')))
+
+    def test_remember_caches_none_values(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+
+        self.assertIsNone(self.run_async(self.repo.remember('foo', 10, compute)))
+        self.assertIsNone(self.run_async(self.repo.remember('foo', 10, compute)))
+        self.assertEqual(1, len(calls))
+        self.assertTrue(self.run_async(self.repo.has('foo')))
+
+    def test_concurrent_remember_calls_share_the_computation(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+
+            return 'bar'
+
+        async def main():
+            return await asyncio.gather(*[
+                self.repo.remember('foo', 10, compute) for _ in range(10)
+            ])
+
+        self.assertEqual(['bar'] * 10, self.run_async(main()))
+        self.assertEqual(1, len(calls))
+
+    def test_decorator(self):
+        calls = []
+
+        @self.repo(minutes=10)
+        async def test(i, m=3):
+            calls.append(i)
+
+            return i * 3
+
+        self.assertEqual(6, self.run_async(test(2)))
+        self.assertEqual(6, self.run_async(test(2)))
+        self.assertEqual(1, len(calls))
+
+    def test_decorator_rejects_regular_functions(self):
+        self.assertRaises(ValueError, self.repo, lambda: None)
+
+    def test_manager_shares_sync_stores_through_an_executor(self):
+        cache = CacheManager({
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                }
+            }
+        })
+
+        cache.put('foo', 'bar', 10)
+
+        repo = cache.async_store()
+        self.assertIs(repo, cache.async_store('dict'))
+        self.assertIs(cache.store().get_store(), repo.get_store().get_store())
+        self.assertEqual('bar', self.run_async(repo.get('foo')))
+
+    def test_repository_can_be_used_from_several_event_loops(self):
+        results = []
+        errors = []
+
+        async def slow():
+            await asyncio.sleep(0.05)
+
+            return 'bar'
+
+        def worker():
+            try:
+                results.append(asyncio.run(self.repo.remember('foo', 1, slow)))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(['bar', 'bar'], results)
+
+    def test_manager_resolves_async_stores_per_event_loop(self):
+        cache = CacheManager({
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                }
+            }
+        })
+
+        async def resolve():
+            repo = cache.async_store()
+            self.assertIs(repo, cache.async_store('dict'))
+            await repo.put('foo', 'bar', 10)
+
+            return repo
+
+        first = asyncio.run(resolve())
+        second = asyncio.run(resolve())
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.get_store().get_store(), second.get_store().get_store())
+        self.assertEqual('bar', cache.get('foo'))
+
+    def test_async_store_can_be_built_from_a_replicated_redis_config(self):
+        cache = CacheManager({
+            'stores': {
+                'redis': {
+                    'driver': 'redis',
+                    'host': 'redis-primary',
+                    'replicas': [{'host': 'redis-replica'}],
+                    'replica_selection': 'latency',
+                    'replica_breaker': {'reset_timeout': 30},
+                    'read_your_writes': 1
+                }
+            }
+        })
+
+        async def resolve():
+            return cache.async_store().get_store()
+
+        store = asyncio.run(resolve())
+
+        self.assertIsInstance(store, AsyncRedisStore)
+        self.assertEqual(
+            'redis-primary', store._redis.connection_pool.connection_kwargs['host']
+        )
@@ -2,12 +2,14 @@
 
 import os
 import tempfile
+import threading
 from unittest import TestCase
 from flexmock import flexmock, flexmock_teardown
 
 from cachy import CacheManager, Repository
-from cachy.stores import DictStore, FileStore
+from cachy.stores import DictStore, FileStore, TieredStore
 from cachy.contracts.store import Store
+from cachy.single_flight import SingleFlight
 
 
 class RepositoryTestCase(TestCase):
@@ -33,6 +35,55 @@ class RepositoryTestCase(TestCase):
         self.assertIsInstance(cache.store('dict').get_store(), DictStore)
         self.assertIsInstance(cache.store('file').get_store(), FileStore)
 
+    def test_stores_are_resolved_once(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                }
+            }
+        })
+        resolve = cache._resolve
+        resolved = []
+
+        def counting_resolve(name):
+            resolved.append(name)
+
+            return resolve(name)
+
+        cache._resolve = counting_resolve
+
+        repository = cache.store()
+
+        cache.put('foo', 'bar', 10)
+        self.assertIs(repository, cache.store('dict'))
+        self.assertEqual('bar', cache.get('foo'))
+        self.assertEqual(['dict'], resolved)
+
+    def test_stores_are_shared_between_threads(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                }
+            }
+        })
+        repositories = []
+
+        def resolve():
+            repositories.append(cache.store())
+
+        threads = [threading.Thread(target=resolve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(set(map(id, repositories))))
+        self.assertIs(repositories[0], cache.store())
+
     def test_set_default_driver_changes_driver(self):
         cache = CacheManager({
             'default': 'dict',
@@ -104,6 +155,23 @@ class RepositoryTestCase(TestCase):
 
         self.assertEqual('dict', manager.get_default_driver())
 
+    def test_single_flight_can_be_enabled_per_store(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'stores': {
+                'dict': {
+                    'driver': 'dict',
+                    'single_flight': {'timeout': 5}
+                },
+                'other': {
+                    'driver': 'dict'
+                }
+            }
+        })
+
+        self.assertIsInstance(cache.store().get_single_flight(), SingleFlight)
+        self.assertIsNone(cache.store('other').get_single_flight())
+
     def test_decorator(self):
         manager = flexmock(CacheManager({
             'stores': {
@@ -142,7 +210,7 @@ class RepositoryTestCase(TestCase):
         }))
 
         store = flexmock(Repository(flexmock(CustomStore())))
-        store.should_receive('_get_key').with_args('my_key', (2,), {'m': 4}).and_return('foo')
+        store.should_receive('_get_key').with_args('my_key', (2,), {'m': 4}, False).and_return('foo')
         manager.should_receive('store').once().with_args('dict').and_return(store)
         store.get_store().should_receive('get').and_return(None, 6, 6).one_by_one()
         store.get_store().should_receive('put').once()\
@@ -163,6 +231,80 @@ class RepositoryTestCase(TestCase):
         self.assertEqual(1, len(calls))
 
 
+    def test_tiered_driver_wraps_another_store(self):
+        cache = CacheManager({
+            'default': 'tiered',
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                },
+                'tiered': {
+                    'driver': 'tiered',
+                    'store': 'dict',
+                    'local_minutes': 0.5,
+                    'local_size': 100
+                }
+            }
+        })
+
+        store = cache.store().get_store()
+
+        self.assertIsInstance(store, TieredStore)
+        self.assertIsInstance(store.get_store(), DictStore)
+        self.assertEqual(0.5, store._local_minutes)
+        self.assertEqual(100, store.get_local_store()._size)
+
+
+    def test_metrics_can_be_enabled(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'metrics': True,
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                },
+                'file': {
+                    'driver': 'file',
+                    'path': os.path.join(tempfile.gettempdir(), 'cachy'),
+                    'metrics': {'buckets': [0.1]}
+                }
+            }
+        })
+
+        cache.put('foo', 'bar', 10)
+        cache.store('file').put('foo', 'bar', 10)
+        cache.store('file').get('foo')
+
+        stats = cache.stats()
+
+        self.assertEqual(1, stats['dict']['sets'])
+        self.assertEqual(1, stats['file']['hits'])
+        self.assertGreater(stats['file']['bytes_out'], 0)
+        self.assertEqual(stats['file']['bytes_out'], stats['file']['bytes_in'])
+        self.assertEqual(2, len(stats['file']['latency']['serialize']['buckets']))
+
+
+    def test_slow_operations_can_be_queried(self):
+        cache = CacheManager({
+            'default': 'dict',
+            'slow_log': {'threshold': 0},
+            'stores': {
+                'dict': {
+                    'driver': 'dict'
+                }
+            }
+        })
+
+        cache.put('foo', 'bar', 10)
+
+        entries = cache.slow_operations('dict')
+
+        self.assertEqual(1, len(entries))
+        self.assertEqual('put', entries[0]['operation'])
+        self.assertEqual('foo', entries[0]['key'])
+        self.assertEqual([], cache.slow_operations('file'))
+
+
 class CustomStore(Store):
 
     def __init__(self, config=None):
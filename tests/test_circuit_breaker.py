@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.circuit_breaker import CircuitBreaker
+
+
+class CircuitBreakerTestCase(TestCase):
+
+    def test_breaker_opens_when_the_failure_rate_is_reached(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4)
+
+        breaker.record(0.01)
+        breaker.record(0.01, IOError())
+        breaker.record(0.01)
+        self.assertEqual(CircuitBreaker.CLOSED, breaker.state)
+
+        breaker.record(0.01, IOError())
+        self.assertEqual(CircuitBreaker.OPEN, breaker.state)
+        self.assertFalse(breaker.allow())
+
+        stats = breaker.get_stats()
+        self.assertEqual('open', stats['state'])
+        self.assertEqual(1, stats['transitions'])
+        self.assertEqual(4, stats['calls'])
+        self.assertEqual(2, stats['failures'])
+        self.assertEqual(1, stats['rejected'])
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker(latency=0.1, min_calls=2)
+
+        breaker.record(0.05)
+        breaker.record(0.5)
+
+        self.assertEqual(CircuitBreaker.OPEN, breaker.state)
+
+    def test_only_the_most_recent_calls_are_considered(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4)
+
+        breaker.record(0.01, IOError())
+        for _ in range(6):
+            breaker.record(0.01)
+        breaker.record(0.01, IOError())
+
+        self.assertEqual(CircuitBreaker.CLOSED, breaker.state)
+
+    def test_successful_probe_closes_the_breaker(self):
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0)
+
+        breaker.record(0.01, IOError())
+        self.assertEqual(CircuitBreaker.HALF_OPEN, breaker.state)
+
+        self.assertTrue(breaker.allow())
+        # Only one probe at a time
+        self.assertFalse(breaker.allow())
+
+        breaker.record(0.01)
+        self.assertEqual(CircuitBreaker.CLOSED, breaker.state)
+        self.assertTrue(breaker.allow())
+
+    def test_failed_probe_reopens_the_breaker(self):
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=30)
+
+        breaker.record(0.01, IOError())
+        breaker._opened_at -= 30
+
+        self.assertTrue(breaker.allow())
+        breaker.record(0.01, IOError())
+
+        self.assertEqual(CircuitBreaker.OPEN, breaker.state)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(3, breaker.get_stats()['transitions'])
+
+    def test_failure_rate_must_be_valid(self):
+        self.assertRaises(ValueError, CircuitBreaker, failure_rate=0)
+        self.assertRaises(ValueError, CircuitBreaker, failure_rate=1.5)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.envelope import Envelope
+from cachy.serializers import JsonSerializer, PickleSerializer
+
+
+class EnvelopeTestCase(TestCase):
+
+    def test_envelope_can_be_packed_and_unpacked(self):
+        for serializer in [JsonSerializer(), PickleSerializer()]:
+            payload = serializer.unserialize(serializer.serialize(Envelope('bar', 123., 1.5).pack()))
+            envelope = Envelope.unpack(payload)
+
+            self.assertEqual('bar', envelope.value)
+            self.assertEqual(123., envelope.expiration)
+            self.assertEqual(1.5, envelope.delta)
+
+    def test_unpack_returns_none_for_plain_values(self):
+        self.assertIsNone(Envelope.unpack('bar'))
+        self.assertIsNone(Envelope.unpack(['bar', 1, 2, 3]))
+        self.assertIsNone(Envelope.unpack(None))
+
+    def test_open_returns_the_value(self):
+        self.assertEqual('bar', Envelope.open(Envelope('bar').pack()))
+        self.assertEqual('bar', Envelope.open('bar'))
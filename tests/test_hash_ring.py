@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.hash_ring import HashRing
+
+
+class HashRingTestCase(TestCase):
+
+    def setUp(self):
+        self.keys = ['key:%d' % i for i in range(2000)]
+
+    def test_keys_are_spread_across_nodes(self):
+        ring = HashRing(['a', 'b', 'c'])
+
+        counts = {}
+        for key in self.keys:
+            node = ring.get_node(key)
+            counts[node] = counts.get(node, 0) + 1
+
+        self.assertEqual(['a', 'b', 'c'], sorted(counts))
+        for count in counts.values():
+            self.assertTrue(400 < count < 950, count)
+
+    def test_routing_is_deterministic(self):
+        ring = HashRing(['a', 'b', 'c'])
+        other = HashRing(['c', 'b', 'a'])
+
+        for key in self.keys:
+            self.assertEqual(ring.get_node(key), other.get_node(key))
+
+    def test_adding_a_node_only_remaps_its_share_of_keys(self):
+        ring = HashRing(['a', 'b', 'c'])
+        grown = HashRing(['a', 'b', 'c', 'd'])
+
+        moved = [key for key in self.keys if ring.get_node(key) != grown.get_node(key)]
+
+        self.assertTrue(len(moved) < len(self.keys) * 0.35, len(moved))
+        for key in moved:
+            self.assertEqual('d', grown.get_node(key))
+
+    def test_weights_are_honored(self):
+        ring = HashRing(['a', 'b'], {'a': 3})
+
+        heavy = len([key for key in self.keys if ring.get_node(key) == 'a'])
+
+        self.assertTrue(heavy > len(self.keys) * 0.65, heavy)
+        self.assertEqual(3, ring.get_weight('a'))
+        self.assertEqual(1, ring.get_weight('b'))
+
+    def test_nodes_must_be_valid(self):
+        self.assertRaises(ValueError, HashRing, [])
+        self.assertRaises(ValueError, HashRing, ['a', 'a'])
+        self.assertRaises(ValueError, HashRing, ['a'], {'a': 0})
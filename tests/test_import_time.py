@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+
+# Modules of optional drivers and serializers, or slow to import,
+# which must only be imported when actually used.
+LAZY_MODULES = (
+    'redis', 'memcache', 'pylibmc', 'msgpack', 'simplejson', 'json',
+    'uuid', 'concurrent', 'asyncio'
+)
+
+
+@skipIf(sys.version_info < (3, 7), 'Lazy imports require Python 3.7')
+class ImportTimeTestCase(TestCase):
+
+    def import_times(self, code):
+        """
+        Run the given code in a new interpreter with -X importtime
+        and get the cumulative import time in microseconds of each imported module.
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+
+        output = subprocess.check_output(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            stderr=subprocess.STDOUT, env=env
+        ).decode()
+
+        times = {}
+        for line in output.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+
+            _, cumulative, module = line[len('import time:'):].split('|')
+            times[module.strip()] = int(cumulative)
+
+        return times
+
+    def assert_not_imported(self, times):
+        imported = sorted(
+            module for module in times if module.split('.')[0] in LAZY_MODULES
+        )
+
+        self.assertEqual([], imported)
+
+    def test_import_does_not_import_drivers(self):
+        times = self.import_times('import cachy')
+
+        self.assertIn('cachy', times)
+        self.assertNotIn('cachy.stores.redis_store', times)
+        self.assertNotIn('cachy.serializers.msgpack_serializer', times)
+        self.assert_not_imported(times)
+
+    def test_dict_store_does_not_import_other_drivers(self):
+        times = self.import_times(
+            'from cachy import CacheManager\n'
+            'cache = CacheManager({"stores": {"dict": {"driver": "dict"}}})\n'
+            'cache.put("foo", "bar", 10)\n'
+        )
+
+        self.assertIn('cachy.stores.dict_store', times)
+        self.assertIn('cachy.locks.lock', times)
+        self.assertNotIn('cachy.stores.redis_store', times)
+        self.assertNotIn('redis', times)
+        self.assertNotIn('memcache', times)
+        self.assertNotIn('msgpack', times)
+        self.assert_not_imported(times)
+
+    def test_drivers_are_imported_on_first_use(self):
+        times = self.import_times('from cachy.stores import RedisStore')
+
+        self.assertIn('cachy.stores.redis_store', times)
+        self.assertNotIn('cachy.stores.memcached_store', times)
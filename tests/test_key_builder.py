@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.key_builder import KeyBuilder
+from cachy.serializers import PickleSerializer
+
+
+serialize = PickleSerializer().serialize
+
+
+def fn(a, b=None):
+    pass
+
+
+class Foo(object):
+
+    def method(self, a):
+        pass
+
+
+class KeyBuilderTestCase(TestCase):
+
+    def test_keys_depend_on_arguments(self):
+        builder = KeyBuilder(fn)
+
+        self.assertNotEqual(builder.build((2,), {}, serialize), builder.build((3,), {}, serialize))
+        self.assertNotEqual(builder.build((2,), {}, serialize), builder.build(('2',), {}, serialize))
+        self.assertNotEqual(builder.build((2,), {'b': 1}, serialize), builder.build((2,), {}, serialize))
+        self.assertEqual(builder.build((2,), {'b': 1}, serialize), builder.build((2,), {'b': 1}, serialize))
+
+    def test_keys_depend_on_the_function(self):
+        self.assertNotEqual(
+            KeyBuilder(fn).build((2,), {}, serialize),
+            KeyBuilder(Foo.method).build((None, 2), {}, serialize)
+        )
+
+    def test_primitive_arguments_are_not_serialized(self):
+        builder = KeyBuilder(fn)
+
+        def fail(data):
+            raise AssertionError('The serializer should not be used.')
+
+        builder.build((2, 'foo', 1.5, None, True), {'b': b'bar'}, fail)
+
+    def test_other_arguments_are_serialized(self):
+        builder = KeyBuilder(fn)
+
+        self.assertEqual(builder.build(([1, 2],), {}, serialize), builder.build(([1, 2],), {}, serialize))
+        self.assertNotEqual(builder.build(([1, 2],), {}, serialize), builder.build(([1, 3],), {}, serialize))
+
+    def test_instance_is_not_part_of_method_keys(self):
+        builder = KeyBuilder(Foo.method)
+
+        self.assertEqual(builder.build((Foo(), 2), {}, serialize), builder.build((Foo(), 2), {}, serialize))
+
+    def test_bound_methods(self):
+        builder = KeyBuilder(Foo().method)
+
+        self.assertEqual(builder.build((2,), {}, serialize), builder.build((2,), {}, serialize))
+        self.assertNotEqual(builder.build((2,), {}, serialize), builder.build((3,), {}, serialize))
+
+    def test_typed_keys(self):
+        builder = KeyBuilder(fn)
+        typed = KeyBuilder(fn, typed=True)
+
+        self.assertEqual(builder.build((1,), {}, serialize), builder.build((1.0,), {}, serialize))
+        self.assertNotEqual(typed.build((1,), {}, serialize), typed.build((1.0,), {}, serialize))
+
+    def test_typed_keyword_arguments_keep_their_types(self):
+        typed = KeyBuilder(fn, typed=True)
+
+        first = typed.build((), {'a': 1, 'b': 1.0}, serialize)
+        second = typed.build((), {'b': 1, 'a': 1.0}, serialize)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(KeyBuilder(fn, typed=True).build((), {'b': 1, 'a': 1.0}, serialize), second)
+        self.assertEqual(first, typed.build((), {'b': 1.0, 'a': 1}, serialize))
+
+    def test_prefix_is_kept(self):
+        key = KeyBuilder('my_key').build((2,), {}, serialize)
+
+        self.assertTrue(key.startswith('my_key:'))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from unittest import TestCase
+
+from cachy import Repository
+from cachy.refresh_ahead import RefreshAhead
+from cachy.stores import DictStore
+
+
+class RefreshAheadTestCase(TestCase):
+
+    def wait_for(self, condition, timeout=2):
+        deadline = time.time() + timeout
+
+        while not condition():
+            if time.time() > deadline:
+                self.fail('Condition not met in time.')
+
+            time.sleep(0.005)
+
+    def test_registered_keys_are_loaded_right_away(self):
+        repo = Repository(DictStore())
+        repo.refresh_ahead('foo', lambda: 'bar', 10)
+
+        self.wait_for(lambda: repo.has('foo'))
+
+        self.assertEqual('bar', repo.get('foo'))
+        self.assertEqual(['foo'], repo.get_refresh_ahead().keys())
+
+        repo.get_refresh_ahead().stop()
+
+    def test_keys_are_reloaded_before_they_expire(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        def load():
+            calls.append(1)
+
+            return len(calls)
+
+        repo.set_refresh_ahead(RefreshAhead(repo, jitter=0))
+        repo.refresh_ahead('foo', load, 0.2 / 60, lead_seconds=0.1)
+
+        self.wait_for(lambda: len(calls) >= 3)
+        repo.get_refresh_ahead().stop()
+
+        # Each reload happens before the previous value expires.
+        self.assertIsNotNone(repo.get('foo'))
+        self.assertGreaterEqual(repo.get_refresh_ahead().get_stats()['refreshes'], 3)
+
+    def test_failed_reloads_are_retried_with_backoff(self):
+        repo = Repository(DictStore())
+        attempts = []
+
+        def load():
+            attempts.append(time.time())
+
+            if len(attempts) < 3:
+                raise RuntimeError('Unavailable')
+
+            return 'bar'
+
+        repo.set_refresh_ahead(RefreshAhead(repo, jitter=0, backoff=0.05))
+        repo.refresh_ahead('foo', load, 10)
+
+        self.wait_for(lambda: repo.has('foo'))
+        repo.get_refresh_ahead().stop()
+
+        self.assertEqual(3, len(attempts))
+        self.assertGreaterEqual(attempts[1] - attempts[0], 0.04)
+        self.assertGreaterEqual(attempts[2] - attempts[1], 0.09)
+        self.assertEqual(2, repo.get_refresh_ahead().get_stats()['failures'])
+
+    def test_reloads_run_on_a_bounded_pool(self):
+        repo = Repository(DictStore())
+        release = threading.Event()
+        running = []
+        lock = threading.Lock()
+
+        def load():
+            with lock:
+                running.append(1)
+
+            release.wait()
+
+            return 'bar'
+
+        repo.set_refresh_ahead(RefreshAhead(repo, workers=2))
+
+        for i in range(5):
+            repo.refresh_ahead('foo%d' % i, load, 10)
+
+        self.wait_for(lambda: len(running) == 2)
+        time.sleep(0.05)
+
+        self.assertEqual(2, len(running))
+
+        release.set()
+        self.wait_for(lambda: len(running) == 5)
+        repo.get_refresh_ahead().stop()
+
+    def test_unregistered_keys_are_not_reloaded(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        repo.set_refresh_ahead(RefreshAhead(repo, jitter=0))
+        repo.refresh_ahead('foo', lambda: calls.append(1), 0.1 / 60, lead_seconds=0.05)
+
+        self.wait_for(lambda: calls)
+        self.assertTrue(repo.get_refresh_ahead().unregister('foo'))
+        time.sleep(0.15)
+        repo.get_refresh_ahead().stop()
+
+        self.assertLessEqual(len(calls), 2)
+        self.assertEqual([], repo.get_refresh_ahead().keys())
+
+    def test_lead_time_must_be_shorter_than_lifetime(self):
+        repo = Repository(DictStore())
+
+        self.assertRaises(ValueError, repo.refresh_ahead, 'foo', lambda: 'bar', 1, 60)
@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
 
 import datetime
+import random
+import tempfile
+import threading
+import time
 from unittest import TestCase
 from flexmock import flexmock, flexmock_teardown
 
 from cachy import Repository
 from cachy.contracts.store import Store
+from cachy.envelope import Envelope
+from cachy.metrics import Metrics
+from cachy.single_flight import SingleFlight
+from cachy.stores import DictStore, FileStore
 
 
 class RepositoryTestCase(TestCase):
@@ -42,10 +50,11 @@ class RepositoryTestCase(TestCase):
 
     def test_pull(self):
         repo = self._get_repository()
-        repo.get_store().should_receive('get').with_args('foo').and_return('bar')
-        repo.get_store().should_receive('forget').with_args('foo')
+        repo.get_store().should_receive('pull').once().with_args('foo').and_return('bar')
+        repo.get_store().should_receive('pull').once().with_args('bar').and_return(None)
 
-        self.assertEqual('bar', repo.get('foo'))
+        self.assertEqual('bar', repo.pull('foo'))
+        self.assertEqual('baz', repo.pull('bar', 'baz'))
 
     def test_put(self):
         repo = self._get_repository()
@@ -59,12 +68,50 @@ class RepositoryTestCase(TestCase):
 
         repo.put('foo', 'bar', datetime.datetime.now() + datetime.timedelta(hours=1))
 
+    def test_put_supports_timedelta_as_minutes(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('put').with_args('foo', 'bar', 5 / 60.)
+
+        repo.put('foo', 'bar', datetime.timedelta(seconds=4.5))
+
     def test_put_with_minutes_to_zero_doesnt_store(self):
         repo = self._get_repository()
         repo.get_store().should_receive('put').never()
 
         repo.put('foo', 'bar', datetime.datetime.now() - datetime.timedelta(hours=1))
 
+    def test_has_uses_the_store(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('has').once().with_args('foo').and_return(True)
+        repo.get_store().should_receive('get').never()
+
+        self.assertTrue(repo.has('foo'))
+
+    def test_get_many(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('get_many').once()\
+            .with_args(['foo', 'bar']).and_return({'foo': 'baz', 'bar': None})
+
+        self.assertEqual({'foo': 'baz', 'bar': None}, repo.get_many(['foo', 'bar']))
+
+    def test_put_many(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('put_many').once().with_args({'foo': 'bar'}, 10)
+
+        repo.put_many({'foo': 'bar'}, 10)
+
+    def test_put_many_with_minutes_to_zero_doesnt_store(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('put_many').never()
+
+        repo.put_many({'foo': 'bar'}, datetime.datetime.now() - datetime.timedelta(hours=1))
+
+    def test_forget_many(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('forget_many').once().with_args(['foo', 'bar']).and_return(True)
+
+        self.assertTrue(repo.forget_many(['foo', 'bar']))
+
     def test_add(self):
         repo = self._get_repository()
         repo.get_store().should_receive('get').once().with_args('foo').and_return(None)
@@ -75,6 +122,28 @@ class RepositoryTestCase(TestCase):
         self.assertTrue(repo.add('foo', 'bar', 10))
         self.assertFalse(repo.add('bar', 'baz', 10))
 
+    def test_add_uses_the_store(self):
+        repo = self._get_repository()
+        repo.get_store().should_receive('add').once().with_args('foo', 'bar', 10).and_return(True)
+        repo.get_store().should_receive('has').never()
+
+        self.assertTrue(repo.add('foo', 'bar', 10))
+
+    def test_add_is_atomic_with_a_store(self):
+        repo = Repository(DictStore())
+        results = []
+
+        def add(i):
+            results.append(repo.add('foo', i, 10))
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, results.count(True))
+
     def test_forever(self):
         repo = self._get_repository()
         repo.get_store().should_receive('forever').once().with_args('foo', 'bar')
@@ -117,7 +186,7 @@ class RepositoryTestCase(TestCase):
 
     def test_repository_can_serve_as_a_decorator_with_key_and_minutes(self):
         repo = flexmock(self._get_repository())
-        repo.should_receive('_get_key').with_args('my_key', (2,), {'m': 4}).and_return('foo')
+        repo.should_receive('_get_key').with_args('my_key', (2,), {'m': 4}, False).and_return('foo')
         repo.get_store().should_receive('get').and_return(None, 6, 6).one_by_one()
         repo.get_store().should_receive('put').once()\
             .with_args('foo', 6, 35)
@@ -135,6 +204,422 @@ class RepositoryTestCase(TestCase):
 
         self.assertEqual(1, len(calls))
 
+    def test_remember_with_single_flight_computes_once(self):
+        repo = Repository(DictStore()).set_single_flight(SingleFlight())
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+
+            return 'bar'
+
+        threads = [
+            threading.Thread(target=lambda: repo.remember('foo', 10, compute))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual('bar', repo.get('foo'))
+
+    def test_tags_share_the_repository_single_flight(self):
+        flight = SingleFlight()
+        repo = Repository(DictStore()).set_single_flight(flight)
+        repo.tags('bop').get('foo')
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+
+            return 'bar'
+
+        threads = [
+            threading.Thread(target=lambda: repo.tags('bop').remember('foo', 10, compute))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual('bar', repo.tags('bop').get('foo'))
+
+    def test_lock_uses_the_store_locks(self):
+        repo = Repository(DictStore())
+
+        with repo.lock('foo', 10):
+            self.assertFalse(repo.lock('foo', 10).acquire())
+
+        self.assertTrue(repo.lock('foo', 10).acquire())
+
+    def test_remember_with_lock_releases_it(self):
+        repo = Repository(DictStore())
+
+        self.assertEqual('bar', repo.remember('foo', 10, lambda: 'bar', lock=True))
+        self.assertEqual('bar', repo.get('foo'))
+        self.assertTrue(repo.lock('foo:lock', 10).acquire())
+
+    def test_remember_with_lock_waits_for_the_lock_owner(self):
+        repo = Repository(DictStore())
+        lock = repo.lock('foo:lock', 10)
+        lock.acquire()
+        calls = []
+
+        def owner():
+            time.sleep(0.1)
+            repo.put('foo', 'bar', 10)
+            lock.release()
+
+        t = threading.Thread(target=owner)
+        t.start()
+
+        self.assertEqual('bar', repo.remember('foo', 10, lambda: calls.append(1), lock=True))
+        self.assertEqual(0, len(calls))
+
+        t.join()
+
+    def test_remember_with_beta_stores_an_envelope(self):
+        repo = Repository(DictStore())
+
+        self.assertEqual('bar', repo.remember('foo', 10, lambda: 'bar', beta=1.))
+
+        envelope = Envelope.unpack(repo.get_store().get('foo'))
+        self.assertEqual('bar', envelope.value)
+        self.assertAlmostEqual(time.time() + 600, envelope.expiration, delta=5)
+        self.assertEqual('bar', repo.get('foo'))
+
+    def test_remember_with_beta_recomputes_early_when_drawn(self):
+        repo = Repository(DictStore())
+        repo.get_store().put('foo', Envelope('bar', time.time() + 1, 10.).pack(), 10)
+
+        flexmock(random).should_receive('random').and_return(0.99)
+        self.assertEqual('baz', repo.remember('foo', 10, lambda: 'baz', beta=1.))
+
+        flexmock(random).should_receive('random').and_return(0.)
+        self.assertEqual('baz', repo.remember('foo', 10, lambda: 'boom', beta=1.))
+
+    def test_remember_with_stale_serves_fresh_values(self):
+        repo = Repository(DictStore())
+
+        self.assertEqual('bar', repo.remember('foo', 10, lambda: 'bar', stale=5))
+        self.assertEqual('bar', repo.remember('foo', 10, lambda: 'baz', stale=5))
+
+        envelope = Envelope.unpack(repo.get_store().get('foo'))
+        self.assertAlmostEqual(time.time() + 600, envelope.expiration, delta=5)
+        self.assertAlmostEqual(15, repo.get_store()._get_payload('foo')[1], places=2)
+
+    def test_remember_with_stale_refreshes_stale_values_in_background(self):
+        repo = Repository(DictStore())
+        repo.get_store().put('foo', Envelope('bar', time.time() - 1).pack(), 10)
+        refreshed = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            refreshed.wait(1)
+
+            return 'baz'
+
+        self.assertEqual('bar', repo.remember('foo', 10, compute, stale=5))
+        self.assertEqual('bar', repo.remember('foo', 10, compute, stale=5))
+
+        refreshed.set()
+        repo._refresher.shutdown(wait=True)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual('baz', repo.get('foo'))
+
+    def test_decorator_accepts_remember_options(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo(minutes=10, stale=5)
+        def test(i):
+            calls.append(i)
+
+            return i * 3
+
+        self.assertEqual(6, test(2))
+        self.assertEqual(6, test(2))
+        self.assertEqual(1, len(calls))
+
+        payload = list(repo.get_store()._storage.values())[0][1]
+        self.assertIsNotNone(Envelope.unpack(payload))
+
+    def test_decorator_caches_calls_with_different_arguments_separately(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo
+        def test(i):
+            calls.append(i)
+
+            return i * 3
+
+        self.assertEqual(6, test(2))
+        self.assertEqual(9, test(3))
+        self.assertEqual(6, test(2))
+        self.assertEqual([2, 3], calls)
+
+    def test_decorator_accepts_a_key_function(self):
+        repo = Repository(DictStore())
+
+        @repo(key=lambda i: 'test:%s' % i)
+        def test(i):
+            return i * 3
+
+        test(2)
+
+        self.assertEqual(6, repo.get('test:2'))
+
+    def test_decorator_with_typed_keys(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo(typed=True)
+        def test(i):
+            calls.append(i)
+
+            return i * 3
+
+        test(1)
+        test(1.0)
+
+        self.assertEqual(2, len(calls))
+
+    def test_decorators_sharing_a_prefix_keep_their_typed_option(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo(key='test')
+        def untyped(i):
+            return i
+
+        @repo(key='test', typed=True)
+        def typed(i):
+            calls.append(i)
+
+            return i * 3
+
+        untyped(2)
+        typed(1)
+        typed(1.0)
+
+        self.assertEqual(2, len(calls))
+
+    def test_decorator_keys_are_not_recorded_as_serializations(self):
+        metrics = Metrics('dict')
+        repo = Repository(DictStore().set_metrics(metrics)).set_metrics(metrics)
+
+        @repo
+        def test(items):
+            return len(items)
+
+        self.assertEqual(2, test([1, 2]))
+
+        stats = metrics.stats()
+
+        self.assertEqual(0, stats['bytes_out'])
+        self.assertNotIn('serialize', stats['latency'])
+
+    def test_remember_caches_none_values(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        def compute():
+            calls.append(1)
+
+        self.assertIsNone(repo.remember('foo', 10, compute))
+        self.assertIsNone(repo.remember('foo', 10, compute))
+        self.assertEqual(1, len(calls))
+        self.assertTrue(repo.has('foo'))
+        self.assertIsNone(repo.get('foo', 'bar'))
+
+    def test_remember_with_negative_minutes_stores_none_values_for_less_time(self):
+        repo = Repository(flexmock(DictStore()))
+        repo.get_store().should_receive('put').with_args('foo', Envelope(None).pack(), 1).once()
+        repo.get_store().should_receive('put').with_args('bar', 'baz', 10).once()
+
+        repo.remember('foo', 10, lambda: None, negative_minutes=1)
+        repo.remember('bar', 10, lambda: 'baz', negative_minutes=1)
+
+    def test_decorated_functions_returning_none_are_computed_once(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo(negative_minutes=1)
+        def find(i):
+            calls.append(i)
+
+        find(1)
+        find(1)
+
+        self.assertEqual([1], calls)
+
+    def test_decorator_accepts_seconds(self):
+        repo = Repository(flexmock(DictStore()))
+        repo.get_store().should_receive('put').with_args(str, 6, 0.5).once()
+
+        @repo(seconds=30)
+        def test(i):
+            return i * 3
+
+        test(2)
+
+    def test_many_decorator_loads_only_missing_ids(self):
+        repo = Repository(flexmock(DictStore()))
+        calls = []
+
+        @repo.many(minutes=10)
+        def load(ids):
+            calls.append(ids)
+
+            return {i: i * 3 for i in ids}
+
+        self.assertEqual([(1, 3), (2, 6)], list(load([1, 2]).items()))
+
+        repo.get_store().should_call('get_many').once()
+        repo.get_store().should_call('put_many').once()
+
+        self.assertEqual([(3, 9), (2, 6), (4, 12)], list(load([3, 2, 4, 3]).items()))
+        self.assertEqual([[1, 2], [3, 4]], calls)
+
+    def test_many_decorator_with_key_function(self):
+        repo = Repository(DictStore())
+
+        class Loader(object):
+
+            @repo.many(key_fn=lambda i: 'user:%s' % i, negative_minutes=1)
+            def load(self, ids):
+                return {i: 'user %s' % i for i in ids if i != 2}
+
+        self.assertEqual(
+            {1: 'user 1', 2: None},
+            dict(Loader().load([1, 2]))
+        )
+        self.assertEqual('user 1', repo.get('user:1'))
+        self.assertTrue(repo.has('user:2'))
+
+    def test_many_decorator_rejects_unknown_options(self):
+        repo = Repository(DictStore())
+
+        self.assertRaises(TypeError, repo.many, minute=10)
+
+    def test_many_decorator_accepts_ids_by_name(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo.many(minutes=10)
+        def load(ids, factor=3):
+            calls.append(ids)
+
+            return {i: i * factor for i in ids}
+
+        self.assertEqual([(1, 6), (2, 12)], list(load(ids=[1, 2], factor=6).items()))
+        self.assertEqual([(1, 6), (2, 12)], list(load([1, 2], factor=6).items()))
+        self.assertEqual([(2, 6)], list(load(factor=3, ids=[2]).items()))
+        self.assertEqual([[1, 2], [2]], calls)
+        self.assertRaises(TypeError, load, factor=3)
+
+    def test_many_decorator_with_ids_sharing_a_key(self):
+        repo = Repository(DictStore())
+        calls = []
+
+        @repo.many(key_fn=lambda i: 'user:%s' % i, minutes=10)
+        def load(ids):
+            calls.append(ids)
+
+            return {i: 'user %s' % i for i in ids if i != '1'}
+
+        self.assertEqual(
+            [(1, 'user 1'), ('1', 'user 1'), (2, 'user 2')],
+            list(load([1, '1', 2]).items())
+        )
+        self.assertEqual([[1, '1', 2]], calls)
+        self.assertEqual('user 1', repo.get('user:1'))
+
+    def test_remember_many(self):
+        repo = Repository(DictStore())
+        repo.put('foo', 'bar', 10)
+
+        values = repo.remember_many(
+            ['baz', 'foo'], 10, lambda missing: {key: key * 2 for key in missing}
+        )
+
+        self.assertEqual([('baz', 'bazbaz'), ('foo', 'bar')], list(values.items()))
+        self.assertEqual('bazbaz', repo.get('baz'))
+
+    def test_metrics_record_operations(self):
+        metrics = Metrics('dict')
+        repo = Repository(DictStore()).set_metrics(metrics)
+
+        repo.put('foo', 'bar', 10)
+        repo.get('foo')
+        repo.get('baz')
+        repo.remember('bop', 10, lambda: 'bip')
+        repo.get_many(['foo', 'baz'])
+        repo.forget('foo')
+
+        stats = repo.stats()
+
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(3, stats['misses'])
+        self.assertEqual(2, stats['sets'])
+        self.assertEqual(1, stats['deletes'])
+        self.assertEqual(3, stats['latency']['get']['count'])
+        self.assertEqual(2, stats['latency']['put']['count'])
+
+    def test_metrics_record_errors(self):
+        repo = Repository(flexmock(DictStore())).set_metrics(Metrics())
+        repo.get_store().should_receive('get').and_raise(RuntimeError)
+
+        self.assertRaises(RuntimeError, repo.get, 'foo')
+        self.assertEqual(1, repo.stats()['errors'])
+
+    def test_hooks_are_called_around_operations(self):
+        repo = Repository(FileStore(tempfile.mkdtemp()))
+        before = []
+        after = []
+
+        repo.before(lambda operation: before.append((operation.name, operation.key)))
+        repo.after(after.append)
+
+        repo.put('foo', 'bar', 10)
+        repo.get('foo')
+        repo.put_many({'baz': 'boom'}, 10)
+
+        self.assertEqual([('put', 'foo'), ('get', 'foo'), ('put_many', ['baz'])], before)
+        self.assertEqual(['put', 'get', 'put_many'], [operation.name for operation in after])
+        self.assertEqual(len(repo.get_store().serialize('bar')), after[1].size)
+        self.assertGreaterEqual(after[1].elapsed, 0)
+        self.assertIsNone(after[1].error)
+
+    def test_hooks_receive_errors(self):
+        repo = Repository(flexmock(DictStore()))
+        repo.get_store().should_receive('forget').and_raise(RuntimeError)
+        after = []
+        repo.after(after.append)
+
+        self.assertRaises(RuntimeError, repo.forget, 'foo')
+        self.assertIsInstance(after[0].error, RuntimeError)
+
+    def test_tags_share_the_repository_hooks(self):
+        repo = Repository(DictStore())
+        after = []
+        repo.after(after.append)
+
+        repo.tags('bop').put('foo', 'bar', 10)
+
+        self.assertIn(('put', 'foo'), [(operation.name, operation.key) for operation in after])
+
     def _get_repository(self):
         repo = Repository(flexmock(Store()))
 
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from unittest import TestCase
+
+from cachy.single_flight import SingleFlight
+
+
+class SingleFlightTestCase(TestCase):
+
+    def test_concurrent_callers_share_a_single_computation(self):
+        flight = SingleFlight()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+
+            return 'bar'
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do('foo', compute)))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(['bar'] * 10, results)
+        self.assertEqual(0, flight.in_flight())
+
+    def test_errors_are_propagated_to_waiting_callers(self):
+        flight = SingleFlight()
+        errors = []
+
+        def compute():
+            time.sleep(0.1)
+
+            raise ValueError('boom')
+
+        def call():
+            try:
+                flight.do('foo', compute)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(5, len(errors))
+        self.assertEqual(0, flight.in_flight())
+
+    def test_fallback_is_used_when_wait_times_out(self):
+        flight = SingleFlight(timeout=0.05)
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            time.sleep(0.3)
+
+            return 'slow'
+
+        leader = threading.Thread(target=lambda: flight.do('foo', slow))
+        leader.start()
+        started.wait()
+
+        self.assertEqual('fallback', flight.do('foo', slow, lambda: 'fallback'))
+
+        leader.join()
+
+    def test_stripes_must_be_positive(self):
+        self.assertRaises(ValueError, SingleFlight, stripes=0)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from cachy.instrumentation import Operation
+from cachy.slow_log import SlowLog
+
+
+class SlowLogTestCase(TestCase):
+
+    def make_operation(self, key, elapsed):
+        operation = Operation('get', key)
+        operation.elapsed = elapsed
+
+        return operation
+
+    def test_only_slow_operations_are_recorded(self):
+        slow_log = SlowLog(threshold=0.1)
+        slow_log.record(self.make_operation('foo', 0.05))
+        slow_log.record(self.make_operation('bar', 0.2), 'redis')
+
+        entries = slow_log.entries()
+
+        self.assertEqual(1, len(entries))
+        self.assertEqual('bar', entries[0]['key'])
+        self.assertEqual('redis', entries[0]['store'])
+        self.assertEqual(0.2, entries[0]['elapsed'])
+
+    def test_oldest_entries_are_dropped(self):
+        slow_log = SlowLog(threshold=0, size=2)
+
+        for key in ('foo', 'bar', 'baz'):
+            slow_log.record(self.make_operation(key, 1))
+
+        self.assertEqual(['baz', 'bar'], [entry['key'] for entry in slow_log.entries()])
+
+        slow_log.clear()
+
+        self.assertEqual(0, len(slow_log))
+
+    def test_entries_can_be_filtered_by_store(self):
+        slow_log = SlowLog(threshold=0)
+        slow_log.hook('redis')(self.make_operation('foo', 1))
+        slow_log.hook('file')(self.make_operation('bar', 1))
+
+        self.assertEqual(['foo'], [entry['key'] for entry in slow_log.entries('redis')])
@@ -60,6 +60,53 @@ class TaggedCacheTestCase(TestCase):
 
         self.assertEqual('bar', store.tags(tags).get('foo'))
 
+    def test_many_tagged_items_can_be_stored_and_flushed(self):
+        store = DictStore()
+
+        store.tags('bop').put_many({'foo': 'bar', 'baz': 'boom'}, 10)
+        store.tags('zap').put_many({'foo': 'zip'}, 10)
+
+        self.assertEqual({'foo': 'bar', 'baz': 'boom'}, store.tags('bop').get_many(['foo', 'baz']))
+        self.assertEqual({'foo': 'zip', 'baz': None}, store.tags('zap').get_many(['foo', 'baz']))
+
+        store.tags('bop').flush()
+
+        self.assertEqual({'foo': None, 'baz': None}, store.tags('bop').get_many(['foo', 'baz']))
+
+    def test_many_tagged_items_can_be_removed(self):
+        store = DictStore()
+
+        store.tags('bop').put_many({'foo': 'bar', 'baz': 'boom'}, 10)
+        store.tags('bop').forget_many(['foo'])
+
+        self.assertEqual({'foo': None, 'baz': 'boom'}, store.tags('bop').get_many(['foo', 'baz']))
+
+    def test_tagged_none_values_can_be_cached(self):
+        store = DictStore()
+        calls = []
+
+        def compute():
+            calls.append(1)
+
+        store.tags('bop').remember('foo', 10, compute)
+        store.tags('bop').remember('foo', 10, compute)
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(store.tags('bop').has('foo'))
+        self.assertIsNone(store.tags('bop').get('foo', 'bar'))
+        self.assertEqual({'foo': None}, store.tags('bop').get_many(['foo']))
+
+    def test_tagged_items_can_be_added_and_pulled(self):
+        store = DictStore()
+
+        self.assertTrue(store.tags('bop').add('foo', 'bar', 10))
+        self.assertFalse(store.tags('bop').add('foo', 'baz', 10))
+        self.assertTrue(store.tags('bop').add('baz', None, 10))
+
+        self.assertEqual('bar', store.tags('bop').pull('foo'))
+        self.assertEqual('default', store.tags('bop').pull('foo', 'default'))
+        self.assertIsNone(store.tags('bop').pull('baz', 'default'))
+
     def test_redis_cache_tags_push_forever_keys_correctly(self):
         store = flexmock(RedisStore(redis_class=FakeStrictRedis))
         tag_set = flexmock(TagSet(store, ['foo', 'bar']))